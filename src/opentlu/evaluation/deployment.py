@@ -9,7 +9,7 @@ import hashlib
 import time
 import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 from collections import defaultdict
 import numpy as np
 
@@ -70,6 +70,7 @@ class ShadowRunner:
         candidate_policy: Policy,
         shadow_fraction: float = 1.0,
         timeout_ms: float = 100.0,
+        clock: Callable[[], float] = time.perf_counter,
     ):
         """
         Initialize shadow runner.
@@ -79,11 +80,13 @@ class ShadowRunner:
             candidate_policy: Candidate policy to evaluate
             shadow_fraction: Fraction of requests to run shadow (0-1)
             timeout_ms: Timeout for shadow policy execution
+            clock: Seconds counter used to time policy calls
         """
         self.production_policy = production_policy
         self.candidate_policy = candidate_policy
         self.shadow_fraction = shadow_fraction
         self.timeout_ms = timeout_ms
+        self.clock = clock
 
         self._lock = threading.Lock()
         self._divergence_history: List[float] = []
@@ -101,9 +104,10 @@ class ShadowRunner:
             ShadowResult with both actions and divergence.
         """
         # Always run production
-        start = time.perf_counter()
+        clock = self.clock
+        start = clock()
         production_action = self.production_policy(observation)
-        production_latency = (time.perf_counter() - start) * 1000
+        production_latency = (clock() - start) * 1000
 
         # Check if we should run shadow
         shadow_action = np.zeros_like(production_action)
@@ -112,9 +116,9 @@ class ShadowRunner:
 
         if np.random.random() < self.shadow_fraction:
             try:
-                start = time.perf_counter()
+                start = clock()
                 shadow_action = self.candidate_policy(observation)
-                shadow_latency = (time.perf_counter() - start) * 1000
+                shadow_latency = (clock() - start) * 1000
 
                 with self._lock:
                     self._n_shadow_runs += 1
@@ -179,6 +183,7 @@ class ABTestRunner:
         policies: Dict[str, Policy],
         allocation: Dict[str, float],
         sticky_key: str = "session_id",
+        clock: Callable[[], float] = time.perf_counter,
     ):
         """
         Initialize A/B test runner.
@@ -187,10 +192,12 @@ class ABTestRunner:
             policies: Dict mapping variant name to policy
             allocation: Dict mapping variant name to traffic fraction (must sum to 1)
             sticky_key: Key in context for sticky allocation
+            clock: Seconds counter used to time policy calls
         """
         self.policies = policies
         self.allocation = allocation
         self.sticky_key = sticky_key
+        self.clock = clock
 
         # Validate allocation sums to ~1
         total = sum(allocation.values())
@@ -241,10 +248,10 @@ class ABTestRunner:
         variant = self._get_bucket(context)
         policy = self.policies[variant]
 
-        start = time.perf_counter()
+        start = self.clock()
         try:
             action = policy(observation)
-            latency = (time.perf_counter() - start) * 1000
+            latency = (self.clock() - start) * 1000
 
             with self._lock:
                 metrics = self._metrics[variant]
@@ -6,8 +6,10 @@ and stratified aggregation by scenario tags for statistically sound evaluation.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import numpy as np
+from scipy.special import ndtri
 
 
 @dataclass
@@ -42,6 +44,15 @@ class AggregatedResults:
     power_analysis: Dict[str, float]
 
 
+# Reductions applied to a whole (B, N) block of resamples with axis=1, keyed
+# by the stat_fn they stand in for
+_AXIS_REDUCTIONS: Dict[Callable[..., Any], Callable[..., np.ndarray]] = {
+    fn: fn for fn in (np.mean, np.median, np.std, np.var, np.sum, np.min, np.max)
+}
+# Resampled elements gathered per block; bounds scratch memory to ~16 MB
+_BOOTSTRAP_BLOCK_ELEMENTS = 1 << 20
+
+
 def bootstrap_ci(
     data: np.ndarray,
     stat_fn: Callable[[np.ndarray], float] = np.mean,
@@ -85,11 +96,19 @@ def bootstrap_ci(
     # Point estimate
     estimate = stat_fn(data)
 
-    # Bootstrap resampling
+    # Bootstrap resampling: gather blocks of resamples with one index draw
+    # each (the same random stream as per-resample rng.choice calls)
     bootstrap_stats = np.empty(n_bootstrap)
-    for i in range(n_bootstrap):
-        sample = rng.choice(data, size=n, replace=True)
-        bootstrap_stats[i] = stat_fn(sample)
+    reducer = _AXIS_REDUCTIONS.get(stat_fn) if data.ndim == 1 else None
+    block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // n)
+    for start in range(0, n_bootstrap, block):
+        stop = min(start + block, n_bootstrap)
+        samples = data[rng.integers(0, n, size=(stop - start, n))]
+        if reducer is not None:
+            reducer(samples, axis=1, out=bootstrap_stats[start:stop])
+        else:
+            for i, sample in enumerate(samples, start):
+                bootstrap_stats[i] = stat_fn(sample)
 
     # Percentile method
     ci_lower = float(np.percentile(bootstrap_stats, 100 * (alpha / 2)))
@@ -98,6 +117,30 @@ def bootstrap_ci(
     return (float(estimate), ci_lower, ci_upper)
 
 
+def _ci_row(metric: MetricWithCI) -> Tuple[float, float, float]:
+    """(value, ci_lower, ci_upper) of a metric."""
+    return (metric.value, metric.ci_lower, metric.ci_upper)
+
+
+@lru_cache(maxsize=32)
+def _two_sided_z(alpha: float) -> float:
+    """Standard normal quantile z_{1 - alpha/2}."""
+    return float(ndtri(1 - alpha / 2))
+
+
+def _wilson_bounds(p_hat: Any, n: Any, z: float) -> Tuple[Any, Any]:
+    """
+    Unclipped Wilson (center - margin, center + margin).
+
+    Pure arithmetic, so it takes Python floats or broadcasting arrays alike.
+    """
+    z2_n = z * z / n
+    denominator = 1 + z2_n
+    center = (p_hat + z2_n / 2) / denominator
+    margin = z * np.sqrt((p_hat * (1 - p_hat) + z2_n / 4) / n) / denominator
+    return center - margin, center + margin
+
+
 def wilson_ci(
     successes: int,
     n: int,
@@ -120,19 +163,38 @@ def wilson_ci(
     if n == 0:
         return (0.0, 0.0, 0.0)
 
-    from scipy import stats
-
-    z = stats.norm.ppf(1 - alpha / 2)
     p_hat = successes / n
+    lower, upper = _wilson_bounds(p_hat, n, _two_sided_z(alpha))
 
-    denominator = 1 + z**2 / n
-    center = (p_hat + z**2 / (2 * n)) / denominator
-    margin = z * np.sqrt((p_hat * (1 - p_hat) + z**2 / (4 * n)) / n) / denominator
+    return (float(p_hat), float(max(0.0, lower)), float(min(1.0, upper)))
 
-    ci_lower = max(0.0, center - margin)
-    ci_upper = min(1.0, center + margin)
 
-    return (float(p_hat), float(ci_lower), float(ci_upper))
+def wilson_ci_batch(
+    successes: np.ndarray,
+    n: np.ndarray,
+    alpha: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Wilson score intervals for many proportions at once (e.g. one per stratum).
+
+    Args:
+        successes: Success counts
+        n: Trial counts, broadcastable against successes
+        alpha: Significance level
+
+    Returns:
+        (proportions, ci_lowers, ci_uppers) arrays; all 0 where n == 0.
+    """
+    successes = np.asarray(successes, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    empty = n == 0
+    n_safe = np.where(empty, 1.0, n)
+
+    p_hat = np.where(empty, 0.0, successes / n_safe)
+    lower, upper = _wilson_bounds(p_hat, n_safe, _two_sided_z(alpha))
+    lower = np.where(empty, 0.0, np.maximum(lower, 0.0))
+    upper = np.where(empty, 0.0, np.minimum(upper, 1.0))
+    return p_hat, lower, upper
 
 
 def exact_binomial_ci(
@@ -379,66 +441,77 @@ class StatisticalEvaluator:
         passed_count = sum(1 for r in results if r.get("passed", False))
         pass_rate = self.compute_proportion_with_ci(passed_count, total)
 
-        # Aggregate metrics with CIs
-        all_metrics: Dict[str, List[float]] = {}
-        for r in results:
+        # Aggregate metrics with CIs; one pass builds each metric's values and
+        # the indices of the results that report it
+        metric_values: Dict[str, List[float]] = {}
+        metric_rows: Dict[str, List[int]] = {}
+        for i, r in enumerate(results):
             for k, v in r.get("metrics", {}).items():
-                if k not in all_metrics:
-                    all_metrics[k] = []
-                all_metrics[k].append(float(v))
+                if k not in metric_values:
+                    metric_values[k] = []
+                    metric_rows[k] = []
+                metric_values[k].append(float(v))
+                metric_rows[k].append(i)
+        all_metrics = {k: np.array(values) for k, values in metric_values.items()}
 
         mean_metrics: Dict[str, MetricWithCI] = {}
         for k, values in all_metrics.items():
-            mean_metrics[k] = self.compute_metric_with_ci(np.array(values))
+            mean_metrics[k] = self.compute_metric_with_ci(values)
 
         # Stratified metrics
         stratified_metrics: Dict[str, StratifiedMetrics] = {}
-        if stratify_by:
-            stratified_data = self.stratify_by_tags(results, stratify_by)
-
-            for dim, strata in stratified_data.items():
-                strata_metrics: Dict[str, Dict[str, MetricWithCI]] = {}
-                sample_sizes: Dict[str, int] = {}
-
-                for stratum_name, stratum_results in strata.items():
-                    sample_sizes[stratum_name] = len(stratum_results)
-                    strata_metrics[stratum_name] = {}
-
-                    # Aggregate metrics for this stratum
-                    stratum_values: Dict[str, List[float]] = {}
-                    for r in stratum_results:
-                        for k, v in r.get("metrics", {}).items():
-                            if k not in stratum_values:
-                                stratum_values[k] = []
-                            stratum_values[k].append(float(v))
-
-                    for k, values in stratum_values.items():
-                        if len(values) < self.min_stratum_size:
-                            # Fallback to simpler method for small strata
-                            val = np.mean(values)
-                            std = np.std(values) / np.sqrt(len(values)) if len(values) > 1 else 0
-                            strata_metrics[stratum_name][k] = MetricWithCI(
-                                value=float(val),
-                                ci_lower=float(val - 1.96 * std),
-                                ci_upper=float(val + 1.96 * std),
-                                method="normal_approx",
-                                n_samples=len(values),
-                            )
-                        else:
-                            strata_metrics[stratum_name][k] = self.compute_metric_with_ci(
-                                np.array(values)
-                            )
-
-                stratified_metrics[dim] = StratifiedMetrics(
-                    dimension=dim,
-                    strata=strata_metrics,
-                    sample_sizes=sample_sizes,
-                )
+        for dim in stratify_by or []:
+            # Stratum code per result, strata numbered in order of appearance
+            strata_codes: Dict[str, int] = {}
+            codes = np.fromiter(
+                (
+                    strata_codes.setdefault(
+                        r.get("tags", {}).get(dim, "unknown"), len(strata_codes)
+                    )
+                    for r in results
+                ),
+                dtype=np.intp,
+                count=total,
+            )
+            strata_names = list(strata_codes)
+            counts = np.bincount(codes, minlength=len(strata_names))
+            sample_sizes = {name: int(c) for name, c in zip(strata_names, counts)}
+            strata_metrics: Dict[str, Dict[str, MetricWithCI]] = {name: {} for name in strata_names}
+
+            for k, values in all_metrics.items():
+                # Stable sort groups each stratum's values, keeping their original order
+                metric_codes = codes[metric_rows[k]]
+                order = np.argsort(metric_codes, kind="stable")
+                per_stratum = np.bincount(metric_codes, minlength=len(strata_names))
+                groups = np.split(values[order], np.cumsum(per_stratum)[:-1])
+
+                for stratum_name, group in zip(strata_names, groups):
+                    n_group = len(group)
+                    if n_group == 0:
+                        continue
+                    if n_group < self.min_stratum_size:
+                        # Fallback to simpler method for small strata
+                        val = np.mean(group)
+                        std = np.std(group) / np.sqrt(n_group) if n_group > 1 else 0
+                        strata_metrics[stratum_name][k] = MetricWithCI(
+                            value=float(val),
+                            ci_lower=float(val - 1.96 * std),
+                            ci_upper=float(val + 1.96 * std),
+                            method="normal_approx",
+                            n_samples=n_group,
+                        )
+                    else:
+                        strata_metrics[stratum_name][k] = self.compute_metric_with_ci(group)
+
+            stratified_metrics[dim] = StratifiedMetrics(
+                dimension=dim,
+                strata=strata_metrics,
+                sample_sizes=sample_sizes,
+            )
 
         # Power analysis for each metric
         power_results: Dict[str, float] = {}
-        for k, values in all_metrics.items():
-            arr = np.array(values)
+        for k, arr in all_metrics.items():
             if len(arr) > 1 and np.std(arr) > 0:
                 # Compute effect size as (threshold - mean) / std
                 if k in self.acceptance_thresholds:
@@ -464,17 +537,21 @@ class StatisticalEvaluator:
         old_results: AggregatedResults,
         new_results: AggregatedResults,
         safety_metrics: Optional[List[str]] = None,
+        higher_is_better: Optional[List[str]] = None,
     ) -> Tuple[bool, Dict[str, str]]:
         """
         Detect if new model shows regression compared to old model.
 
-        Regression detected when new model CI lower bound < old model CI upper bound
-        for safety metrics (i.e., new model could be worse).
+        Regression is detected when the new and old CIs do not overlap in the
+        worse direction: new lower bound > old upper bound for safety metrics
+        (lower is better), or new upper bound < old lower bound for metrics in
+        `higher_is_better`. All metrics are compared in one vectorized pass.
 
         Args:
             old_results: Baseline model aggregated results
             new_results: Candidate model aggregated results
             safety_metrics: List of safety-critical metrics to check
+            higher_is_better: Metrics among `safety_metrics` where higher values are better
 
         Returns:
             (has_regression, details dict)
@@ -482,29 +559,35 @@ class StatisticalEvaluator:
         if safety_metrics is None:
             safety_metrics = list(self.acceptance_thresholds.keys())
 
-        has_regression = False
-        details: Dict[str, str] = {}
+        old_metrics = old_results.mean_metrics
+        new_metrics = new_results.mean_metrics
+        names = [m for m in safety_metrics if m in old_metrics and m in new_metrics]
+        if not names:
+            return (False, {})
 
-        for metric in safety_metrics:
-            if metric not in old_results.mean_metrics or metric not in new_results.mean_metrics:
-                continue
+        # (k, 3) columns of value, ci_lower, ci_upper
+        old = np.array([_ci_row(old_metrics[m]) for m in names])
+        new = np.array([_ci_row(new_metrics[m]) for m in names])
+        flip = np.isin(names, list(higher_is_better or ()))
 
-            old_ci = old_results.mean_metrics[metric]
-            new_ci = new_results.mean_metrics[metric]
+        # Definite regression: CIs separated in the worse direction
+        regressed = np.where(flip, new[:, 2] < old[:, 1], new[:, 1] > old[:, 2])
+        # Warn if the point estimate is worse even if CIs overlap
+        worse = ~regressed & np.where(flip, new[:, 0] < old[:, 0], new[:, 0] > old[:, 0])
 
-            # For safety metrics (lower is better), regression means new is higher
-            # Check if new lower bound > old upper bound (definite regression)
-            if new_ci.ci_lower > old_ci.ci_upper:
-                has_regression = True
-                details[metric] = (
-                    f"REGRESSION: new [{new_ci.ci_lower:.4f}, {new_ci.ci_upper:.4f}] "
-                    f"> old [{old_ci.ci_lower:.4f}, {old_ci.ci_upper:.4f}]"
+        details: Dict[str, str] = {}
+        for i in np.flatnonzero(regressed | worse):
+            (old_val, old_lo, old_hi), (new_val, new_lo, new_hi) = old[i], new[i]
+            cmp = "<" if flip[i] else ">"
+            if regressed[i]:
+                details[names[i]] = (
+                    f"REGRESSION: new [{new_lo:.4f}, {new_hi:.4f}] "
+                    f"{cmp} old [{old_lo:.4f}, {old_hi:.4f}]"
                 )
-            elif new_ci.value > old_ci.value:
-                # Warn if point estimate is worse even if CIs overlap
-                details[metric] = (
-                    f"WARNING: new mean {new_ci.value:.4f} > old mean {old_ci.value:.4f} "
+            else:
+                details[names[i]] = (
+                    f"WARNING: new mean {new_val:.4f} {cmp} old mean {old_val:.4f} "
                     "(CIs overlap, inconclusive)"
                 )
 
-        return (has_regression, details)
+        return (bool(regressed.any()), details)
@@ -1,5 +1,8 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -38,6 +41,45 @@ class UncertaintyEstimate(BaseModel):
     )
 
 
+@dataclass
+class UncertaintyEstimateBatch:
+    """
+    Structure-of-arrays view of N uncertainty estimates, one per timestep.
+
+    Lets hot control loops pass uncertainty for many steps without allocating
+    an UncertaintyEstimate per step. Fields mirror UncertaintyEstimate; the
+    scores are not range-validated.
+    """
+
+    confidence: np.ndarray  # (N,)
+    aleatoric_score: np.ndarray  # (N,)
+    epistemic_score: np.ndarray  # (N,)
+    source: str = ""
+
+    def __post_init__(self) -> None:
+        self.confidence = np.asarray(self.confidence, dtype=np.float64)
+        self.aleatoric_score = np.asarray(self.aleatoric_score, dtype=np.float64)
+        self.epistemic_score = np.asarray(self.epistemic_score, dtype=np.float64)
+        shapes = {self.confidence.shape, self.aleatoric_score.shape, self.epistemic_score.shape}
+        if len(shapes) != 1 or self.confidence.ndim != 1:
+            raise ValueError(
+                f"UncertaintyEstimateBatch fields must be 1-D of equal length, got {shapes}"
+            )
+
+    @classmethod
+    def from_estimates(cls, estimates: Sequence[UncertaintyEstimate]) -> "UncertaintyEstimateBatch":
+        """Pack a sequence of estimates into a batch (source taken from the first)."""
+        return cls(
+            confidence=np.array([e.confidence for e in estimates], dtype=np.float64),
+            aleatoric_score=np.array([e.aleatoric_score for e in estimates], dtype=np.float64),
+            epistemic_score=np.array([e.epistemic_score for e in estimates], dtype=np.float64),
+            source=estimates[0].source if estimates else "",
+        )
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+
 class RiskAssessment(BaseModel):
     """Operational risk profile for a candidate action."""
 
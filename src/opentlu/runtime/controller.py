@@ -1,8 +1,59 @@
-from typing import Any, Dict, List
-from opentlu.foundations.contracts import MitigationState, UncertaintyEstimate
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from opentlu.foundations.contracts import (
+    MitigationState,
+    MonitorOutput,
+    UncertaintyEstimate,
+    UncertaintyEstimateBatch,
+)
+from opentlu.runtime.logging import InterventionLogger
 from opentlu.safety.monitors import BaseMonitor
 
 
+# step_batch() reports states as indices into this tuple
+_STATES = tuple(MitigationState)
+_NOMINAL, _CAUTIOUS, _FALLBACK, _SAFE_STOP = (
+    _STATES.index(state)
+    for state in (
+        MitigationState.NOMINAL,
+        MitigationState.CAUTIOUS,
+        MitigationState.FALLBACK,
+        MitigationState.SAFE_STOP,
+    )
+)
+
+_Classifier = Callable[[float, float, float], MitigationState]
+
+
+def _build_classifier(uncertainty_threshold: float, ood_threshold: float) -> _Classifier:
+    """
+    Specialize the state transition rules to fixed thresholds.
+
+    The thresholds become closure constants, so the per-step classification
+    does no attribute lookups. The first matching rule wins.
+    """
+    nominal = MitigationState.NOMINAL
+    cautious = MitigationState.CAUTIOUS
+    fallback = MitigationState.FALLBACK
+    safe_stop = MitigationState.SAFE_STOP
+
+    def classify(epistemic: float, ood_score: float, max_severity: float) -> MitigationState:
+        # Critical Safety Failure -> SAFE STOP
+        if max_severity >= 1.0:
+            return safe_stop
+        # OOD or Soft Monitor Violation -> FALLBACK
+        if ood_score > ood_threshold or max_severity > 0.1:
+            return fallback
+        # High Uncertainty -> CAUTIOUS
+        if epistemic > uncertainty_threshold:
+            return cautious
+        return nominal
+
+    return classify
+
+
 class MitigationController:
     """
     Finite State Machine for runtime safety and mitigation.
@@ -14,11 +65,43 @@ class MitigationController:
         monitors: List[BaseMonitor],
         uncertainty_threshold: float = 0.5,
         ood_threshold: float = 0.8,
+        short_circuit: bool = False,
     ):
+        """
+        Args:
+            monitors: Safety monitors checked on every step, in order.
+            uncertainty_threshold: Epistemic score above which to go CAUTIOUS.
+            ood_threshold: OOD score above which to fall back.
+            short_circuit: Stop checking monitors once one reports critical
+                severity (>= 1.0). Cheaper, but later monitors miss that
+                step, which matters for monitors that debounce over history.
+        """
         self.monitors = monitors
-        self.uncertainty_threshold = uncertainty_threshold
-        self.ood_threshold = ood_threshold
+        self._uncertainty_threshold = uncertainty_threshold
+        self._ood_threshold = ood_threshold
+        self._classify = _build_classifier(uncertainty_threshold, ood_threshold)
+        self.short_circuit = short_circuit
         self.current_state = MitigationState.NOMINAL
+        # Outputs from the latest step, by monitor_id, for loggers/alerting
+        self._last_outputs: Dict[str, MonitorOutput] = {}
+
+    @property
+    def uncertainty_threshold(self) -> float:
+        return self._uncertainty_threshold
+
+    @uncertainty_threshold.setter
+    def uncertainty_threshold(self, value: float) -> None:
+        self._uncertainty_threshold = value
+        self._classify = _build_classifier(value, self._ood_threshold)
+
+    @property
+    def ood_threshold(self) -> float:
+        return self._ood_threshold
+
+    @ood_threshold.setter
+    def ood_threshold(self, value: float) -> None:
+        self._ood_threshold = value
+        self._classify = _build_classifier(self._uncertainty_threshold, value)
 
     def step(
         self, state: Dict[str, Any], uncertainty: UncertaintyEstimate, ood_score: float
@@ -35,23 +118,108 @@ class MitigationController:
             New MitigationState.
         """
         # 1. Check Monitors
-        monitor_outputs = [m.check(state) for m in self.monitors]
-        max_severity = max([m.severity for m in monitor_outputs]) if monitor_outputs else 0.0
+        max_severity = self._check_monitors(state)
 
         # 2. Determine State Transition
-        new_state = MitigationState.NOMINAL
+        new_state = self._classify(uncertainty.epistemic_score, ood_score, max_severity)
+        self.current_state = new_state
+        return new_state
 
-        # Critical Safety Failure -> SAFE STOP
-        if max_severity >= 1.0:
-            new_state = MitigationState.SAFE_STOP
+    def step_batch(
+        self,
+        states: Sequence[Dict[str, Any]],
+        uncertainty: UncertaintyEstimateBatch,
+        ood_scores: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Execute N consecutive control steps at once.
 
-        # OOD or Soft Monitor Violation -> FALLBACK
-        elif ood_score > self.ood_threshold or max_severity > 0.1:
-            new_state = MitigationState.FALLBACK
+        Monitors still check each state in order (they may keep history), but
+        the state transitions of all steps are classified in one vectorized
+        pass. Afterwards current_state and the cached monitor outputs reflect
+        the last step.
 
-        # High Uncertainty -> CAUTIOUS
-        elif uncertainty.epistemic_score > self.uncertainty_threshold:
-            new_state = MitigationState.CAUTIOUS
+        Args:
+            states: System states for N consecutive steps.
+            uncertainty: Uncertainty estimates for the same steps.
+            ood_scores: (N,) OOD scores.
 
-        self.current_state = new_state
+        Returns:
+            (N,) int8 array of states as indices into ``tuple(MitigationState)``.
+        """
+        ood_scores = np.asarray(ood_scores, dtype=np.float64)
+        if not (len(states) == len(uncertainty) == len(ood_scores)):
+            raise ValueError("states, uncertainty and ood_scores must have the same length")
+
+        max_severity = np.fromiter(
+            (self._check_monitors(state) for state in states), dtype=np.float64, count=len(states)
+        )
+
+        # Same rules as _build_classifier, applied in reverse priority order
+        codes = np.full(len(states), _NOMINAL, dtype=np.int8)
+        codes[uncertainty.epistemic_score > self._uncertainty_threshold] = _CAUTIOUS
+        codes[(ood_scores > self._ood_threshold) | (max_severity > 0.1)] = _FALLBACK
+        codes[max_severity >= 1.0] = _SAFE_STOP
+
+        if len(codes):
+            self.current_state = _STATES[codes[-1]]
+        return codes
+
+    def step_and_log(
+        self,
+        state: Dict[str, Any],
+        uncertainty: UncertaintyEstimate,
+        ood_score: float,
+        action: np.ndarray,
+        logger: InterventionLogger,
+    ) -> MitigationState:
+        """
+        Execute one control step and log it in the same pass.
+
+        The monitor outputs computed by the step are handed to the logger
+        directly and the observation is shared with zero-copy sinks (see
+        InterventionLogger.log_fast), so `state` must not be mutated afterwards.
+
+        Args:
+            state: Current system state.
+            uncertainty: Uncertainty estimate from the model.
+            ood_score: Out-of-distribution score (higher is more OOD).
+            action: Action executed this step.
+            logger: Logger receiving the intervention record.
+
+        Returns:
+            New MitigationState.
+        """
+        new_state = self.step(state, uncertainty, ood_score)
+        logger.log_fast(
+            state, new_state, uncertainty, ood_score, action, self._last_outputs.values()
+        )
         return new_state
+
+    def _check_monitors(self, state: Dict[str, Any]) -> float:
+        """Check every monitor against `state`, caching outputs; returns the max severity."""
+        last_outputs = self._last_outputs
+        last_outputs.clear()
+        max_severity = 0.0
+        for monitor in self.monitors:
+            output = monitor.check(state)
+            last_outputs[output.monitor_id] = output
+            severity = output.severity
+            if severity > max_severity:
+                max_severity = severity
+                if severity >= 1.0 and self.short_circuit:
+                    break
+        return max_severity
+
+    def get_monitor_output(self, monitor_id: str) -> Optional[MonitorOutput]:
+        """Output of a monitor from the latest step, or None if it was not checked."""
+        return self._last_outputs.get(monitor_id)
+
+    @property
+    def last_monitor_outputs(self) -> List[MonitorOutput]:
+        """
+        All monitor outputs from the latest step, in check order.
+
+        Pass these to InterventionLogger.log instead of checking the monitors again.
+        """
+        return list(self._last_outputs.values())
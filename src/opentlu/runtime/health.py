@@ -5,14 +5,23 @@ Implements latency tracking, throughput monitoring, error rate computation,
 and configurable alerting rules with multiple notification channels.
 """
 
+import itertools
+import sys
 import time
 import threading
 from abc import ABC, abstractmethod
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from types import TracebackType
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Type
 import numpy as np
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 
 @dataclass
 class Alert:
@@ -46,6 +55,10 @@ class RollingStatistics:
     """
     Efficient rolling statistics computation using reservoir sampling
     and approximate quantiles (T-Digest like approach for simplicity).
+
+    The mean and variance of the window are kept as running Welford moments,
+    updated as samples enter and leave, so reading them is O(1). Samples
+    older than the window are dropped on every record and query.
     """
 
     def __init__(self, window_seconds: float = 60.0, max_samples: int = 10000):
@@ -61,60 +74,88 @@ class RollingStatistics:
 
         self._lock = threading.Lock()
         self._values: Deque[Tuple[float, float]] = deque()  # (timestamp, value)
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared deviations from the mean
         self._error_count = 0
         self._total_count = 0
         self._start_time = time.monotonic()
 
+    def _evict_oldest(self) -> None:
+        """Drop the oldest sample and remove it from the running moments."""
+        _, value = self._values.popleft()
+        n = len(self._values)
+        if n == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / n
+        self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+
+    def _expire(self, now: float) -> None:
+        """Drop samples that fell out of the time window. Caller holds the lock."""
+        cutoff = now - self.window_seconds
+        values = self._values
+        while values and values[0][0] < cutoff:
+            self._evict_oldest()
+
     def record(self, value: float, success: bool = True) -> None:
         """Record a new observation."""
         now = time.monotonic()
 
         with self._lock:
             self._values.append((now, value))
+            n = len(self._values)
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
+
             self._total_count += 1
             if not success:
                 self._error_count += 1
 
             # Trim old values
-            cutoff = now - self.window_seconds
-            while self._values and self._values[0][0] < cutoff:
-                self._values.popleft()
+            self._expire(now)
 
             # Limit size
             while len(self._values) > self.max_samples:
-                self._values.popleft()
+                self._evict_oldest()
 
     def get_percentile(self, p: float) -> float:
         """Get the p-th percentile (0-100)."""
         with self._lock:
+            self._expire(time.monotonic())
             if not self._values:
                 return 0.0
-            values = [v for _, v in self._values]
+            values = np.fromiter((v for _, v in self._values), dtype=np.float64)
             return float(np.percentile(values, p))
 
     def get_mean(self) -> float:
         """Get mean value."""
         with self._lock:
-            if not self._values:
-                return 0.0
-            return float(np.mean([v for _, v in self._values]))
+            self._expire(time.monotonic())
+            return self._mean if self._values else 0.0
+
+    def get_variance(self) -> float:
+        """Get sample variance of the window (0 with fewer than two samples)."""
+        with self._lock:
+            self._expire(time.monotonic())
+            n = len(self._values)
+            return self._m2 / (n - 1) if n > 1 else 0.0
 
     def get_throughput(self) -> float:
         """Get operations per second in the window."""
         with self._lock:
+            now = time.monotonic()
+            self._expire(now)
             if not self._values:
                 return 0.0
 
-            now = time.monotonic()
-            window_start = now - self.window_seconds
-            count = sum(1 for t, _ in self._values if t >= window_start)
-
             # Effective window duration
-            if self._values:
-                actual_start = max(self._values[0][0], window_start)
-                duration = now - actual_start
-                if duration > 0:
-                    return count / duration
+            actual_start = max(self._values[0][0], now - self.window_seconds)
+            duration = now - actual_start
+            if duration > 0:
+                return len(self._values) / duration
             return 0.0
 
     def get_error_rate(self) -> float:
@@ -203,37 +244,172 @@ class WebhookChannel(NotificationChannel):
             return False
 
 
+# Comparison operators supported by AlertRule.op
+ALERT_OPS = (">", ">=", "<", "<=", "==")
+
+# Per-op outcome masks for (value > threshold, value == threshold, value < threshold).
+_OP_OUTCOMES = {
+    ">": (True, False, False),
+    ">=": (True, True, False),
+    "<": (False, False, True),
+    "<=": (False, True, True),
+    "==": (False, True, False),
+}
+
+
 @dataclass
 class AlertRule:
-    """Rule for triggering alerts."""
+    """
+    Rule for triggering alerts.
+
+    The built-in comparison `value <op> threshold` is evaluated inline by the
+    engine. `condition` is an optional custom predicate for advanced rules; when
+    set it replaces the comparison (threshold is then for display purposes only).
+
+    Rules may be edited in place: every field assignment gives the rule a new
+    version stamp, which tells the engines holding it to recompile their rule
+    arrays.
+    """
 
     name: str
     metric: str  # "latency_p99", "error_rate", "throughput"
-    condition: Callable[[float], bool]  # Returns True if alert should fire
-    threshold: float  # For display purposes
+    condition: Optional[Callable[[float], bool]] = None  # Returns True if alert should fire
+    threshold: float = float("nan")  # NaN never fires the built-in comparison
     severity: str = "warning"  # "warning" or "critical"
     channels: List[NotificationChannel] = field(default_factory=list)
     cooldown_seconds: float = 300.0  # Minimum time between alerts
     min_samples: int = 10  # Minimum samples before alerting
+    op: str = ">"  # One of ALERT_OPS
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "op" and value not in ALERT_OPS:
+            raise ValueError(f"Unsupported alert op {value!r}, expected one of {ALERT_OPS}")
+        object.__setattr__(self, name, value)
+        # next() on a shared counter is atomic, so concurrent edits still get
+        # distinct stamps
+        object.__setattr__(self, "_version", next(_RULE_VERSIONS))
+
+
+# Source of AlertRule version stamps
+_RULE_VERSIONS = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class _CompiledRules:
+    """Struct-of-arrays view of an AlertEngine rule list."""
+
+    rules: Tuple[AlertRule, ...]
+    metric_names: List[str]  # Unique metrics referenced by the rules
+    metric_idx: np.ndarray  # Per-rule index into metric_names
+    rule_names: List[str]  # Unique rule names; cooldowns are tracked per name
+    name_idx: np.ndarray  # Per-rule index into rule_names
+    thresholds: np.ndarray
+    min_samples: np.ndarray
+    cooldowns: np.ndarray
+    fire_gt: np.ndarray  # Per-rule outcome masks, see _OP_OUTCOMES
+    fire_eq: np.ndarray
+    fire_lt: np.ndarray
+    custom_idx: np.ndarray  # Rules evaluated through their `condition`
+
+
+def _compile_rules(rules: Tuple[AlertRule, ...]) -> _CompiledRules:
+    """Precompile rules into contiguous arrays for vectorized evaluation."""
+    metric_pos: Dict[str, int] = {}
+    metric_idx = np.fromiter(
+        (metric_pos.setdefault(rule.metric, len(metric_pos)) for rule in rules),
+        dtype=np.intp,
+        count=len(rules),
+    )
+    name_pos: Dict[str, int] = {}
+    name_idx = np.fromiter(
+        (name_pos.setdefault(rule.name, len(name_pos)) for rule in rules),
+        dtype=np.intp,
+        count=len(rules),
+    )
+    outcomes = np.array([_OP_OUTCOMES[rule.op] for rule in rules], dtype=bool).reshape(-1, 3)
+    custom = np.array([rule.condition is not None for rule in rules], dtype=bool)
+    return _CompiledRules(
+        rules=rules,
+        metric_names=list(metric_pos),
+        metric_idx=metric_idx,
+        rule_names=list(name_pos),
+        name_idx=name_idx,
+        thresholds=np.array([rule.threshold for rule in rules], dtype=np.float64),
+        min_samples=np.array([rule.min_samples for rule in rules], dtype=np.float64),
+        cooldowns=np.array([rule.cooldown_seconds for rule in rules], dtype=np.float64),
+        fire_gt=outcomes[:, 0] & ~custom,
+        fire_eq=outcomes[:, 1] & ~custom,
+        fire_lt=outcomes[:, 2] & ~custom,
+        custom_idx=np.flatnonzero(custom),
+    )
 
 
 class AlertEngine:
     """
     Engine for evaluating alert rules and dispatching notifications.
 
-    Includes deduplication and rate limiting.
+    Includes deduplication and rate limiting. Notifications are dispatched on a
+    background thread pool so slow channels (e.g. webhooks) never block the
+    caller of evaluate().
     """
 
-    def __init__(self, rules: Optional[List[AlertRule]] = None):
-        self.rules = rules or []
+    def __init__(
+        self,
+        rules: Optional[List[AlertRule]] = None,
+        dispatch_workers: int = 4,
+    ):
+        """
+        Initialize alert engine.
+
+        Args:
+            rules: Initial alert rules
+            dispatch_workers: Threads used to send notifications (0 = send inline)
+        """
+        self._rules: Tuple[AlertRule, ...] = tuple(rules or ())
         self._lock = threading.Lock()
-        self._last_alert: Dict[str, float] = {}  # rule_name -> last alert time
+        self._compiled = _compile_rules(self._rules)
+        self._compiled_versions = [rule._version for rule in self._rules]
+        # Monotonic time each rule name last fired, aligned with the compiled
+        # rule_names; names that left the rule set are kept in _fire_times
+        self._last_fire = np.full(len(self._compiled.rule_names), -np.inf)
+        self._fire_times: Dict[str, float] = {}
         self._alert_history: Deque[Alert] = deque(maxlen=1000)
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=dispatch_workers, thread_name_prefix="alert-dispatch")
+            if dispatch_workers > 0
+            else None
+        )
+
+    @property
+    def rules(self) -> Tuple[AlertRule, ...]:
+        """Registered rules. Change the set through add_rule() or by assigning a new sequence."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: Sequence[AlertRule]) -> None:
+        with self._lock:
+            self._rules = tuple(rules)
+            self._recompile()
 
     def add_rule(self, rule: AlertRule) -> None:
         """Add an alert rule."""
         with self._lock:
-            self.rules.append(rule)
+            self._rules += (rule,)
+            self._recompile()
+
+    def _recompile(self) -> None:
+        """Rebuild the compiled rule arrays. Must be called with the lock held."""
+        # Cooldowns are keyed by rule name, so reordering rules never moves a
+        # timestamp onto a different rule, and a rule replaced or re-added
+        # under the same name keeps cooling down
+        self._fire_times.update(zip(self._compiled.rule_names, self._last_fire.tolist()))
+        self._compiled = _compile_rules(self._rules)
+        self._compiled_versions = [rule._version for rule in self._rules]
+        self._last_fire = np.array(
+            [self._fire_times.get(name, -np.inf) for name in self._compiled.rule_names],
+            dtype=np.float64,
+        )
 
     def evaluate(
         self,
@@ -250,32 +426,67 @@ class AlertEngine:
         Returns:
             List of triggered alerts.
         """
-        now = time.time()
-        triggered: List[Alert] = []
+        now = time.monotonic()
 
+        # Snapshot the compiled rules so condition checks and channel sends run
+        # without holding the lock (webhook channels may block on I/O).
         with self._lock:
-            for rule in self.rules:
-                # Check if metric exists
-                if rule.metric not in metrics:
-                    continue
-
-                value = metrics[rule.metric]
-                count = sample_counts.get(rule.metric, 0)
-
-                # Check minimum samples
-                if count < rule.min_samples:
-                    continue
+            if [rule._version for rule in self._rules] != self._compiled_versions:
+                self._recompile()  # a rule was edited in place
+            compiled = self._compiled
+
+        if not compiled.rules:
+            return []
+
+        # Gather metric values once per metric; missing metrics read as NaN,
+        # which fails every built-in comparison.
+        names = compiled.metric_names
+        values = np.fromiter(
+            (metrics.get(name, np.nan) for name in names), dtype=np.float64, count=len(names)
+        )
+        counts = np.fromiter(
+            (sample_counts.get(name, 0) for name in names), dtype=np.float64, count=len(names)
+        )
+        rule_values = values[compiled.metric_idx]
+        thresholds = compiled.thresholds
+
+        # Branchless comparison of every built-in rule in one pass
+        fired = (
+            ((rule_values > thresholds) & compiled.fire_gt)
+            | ((rule_values == thresholds) & compiled.fire_eq)
+            | ((rule_values < thresholds) & compiled.fire_lt)
+        )
+        fired &= counts[compiled.metric_idx] >= compiled.min_samples
 
-                # Check condition
-                if not rule.condition(value):
-                    continue
+        # Custom predicates still run in Python, but only for eligible rules
+        for i in compiled.custom_idx:
+            rule = compiled.rules[i]
+            if rule.metric in metrics and counts[compiled.metric_idx[i]] >= rule.min_samples:
+                fired[i] = bool(rule.condition(metrics[rule.metric]))
 
-                # Check cooldown
-                last = self._last_alert.get(rule.name, 0)
-                if now - last < rule.cooldown_seconds:
-                    continue
+        if not fired.any():
+            return []
 
-                # Create and dispatch alert
+        # Cooldown check and update are done atomically so concurrent
+        # evaluators cannot fire the same rule twice.
+        timestamp = time.time()
+        dispatch: List[Tuple[AlertRule, Alert]] = []
+        with self._lock:
+            current = self._compiled
+            rows = np.flatnonzero(fired)
+            if current is not compiled:
+                # Rules changed since the snapshot: follow the fired rules to
+                # their current rows, dropping any that were removed
+                row_of = {id(rule): i for i, rule in enumerate(current.rules)}
+                moved = (row_of.get(id(compiled.rules[i])) for i in rows)
+                rows = np.array([i for i in moved if i is not None], dtype=np.intp)
+            last_fire = self._last_fire
+            rows = rows[(now - last_fire[current.name_idx[rows]]) >= current.cooldowns[rows]]
+            last_fire[current.name_idx[rows]] = now
+
+            for i in rows:
+                rule = current.rules[i]
+                value = metrics[rule.metric]
                 alert = Alert(
                     rule_name=rule.name,
                     metric=rule.metric,
@@ -283,21 +494,43 @@ class AlertEngine:
                     message=f"{rule.metric} = {value:.4f} exceeds threshold {rule.threshold:.4f}",
                     value=value,
                     threshold=rule.threshold,
-                    timestamp=now,
+                    timestamp=timestamp,
                 )
+                self._alert_history.append(alert)
+                dispatch.append((rule, alert))
 
-                # Send to channels
-                for channel in rule.channels:
+        # Send to channels outside the lock
+        executor = self._executor
+        for rule, alert in dispatch:
+            for channel in rule.channels:
+                if executor is not None:
                     try:
-                        channel.send(alert)
-                    except Exception:
-                        pass  # Log failure but continue
+                        executor.submit(self._send, channel, alert)
+                        continue
+                    except RuntimeError:  # closed concurrently; send inline
+                        executor = None
+                self._send(channel, alert)
 
-                self._last_alert[rule.name] = now
-                self._alert_history.append(alert)
-                triggered.append(alert)
+        return [alert for _, alert in dispatch]
 
-        return triggered
+    @staticmethod
+    def _send(channel: NotificationChannel, alert: Alert) -> None:
+        """Send an alert, swallowing channel failures."""
+        try:
+            channel.send(alert)
+        except Exception:
+            pass  # Log failure but continue
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the dispatch pool, optionally waiting for pending notifications.
+
+        The engine stays usable; later notifications are sent inline.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
 
     def get_history(self, limit: int = 100) -> List[Alert]:
         """Get recent alert history."""
@@ -326,7 +559,9 @@ class HealthMonitor:
             latency_threshold_p99_ms: P99 latency threshold in ms
             error_rate_threshold: Error rate threshold (0-1)
             window_seconds: Rolling window for statistics
-            alert_engine: Alert engine (created with defaults if None)
+            alert_engine: Alert engine (created with defaults if None). A
+                default engine is owned by the monitor and stopped by close();
+                a supplied one is left for the caller to close.
         """
         self.latency_threshold = latency_threshold_p99_ms
         self.error_rate_threshold = error_rate_threshold
@@ -344,16 +579,16 @@ class HealthMonitor:
                     AlertRule(
                         name="high_latency_p99",
                         metric="latency_p99",
-                        condition=lambda v: v > latency_threshold_p99_ms,
                         threshold=latency_threshold_p99_ms,
+                        op=">",
                         severity="warning",
                         channels=[log_channel],
                     ),
                     AlertRule(
                         name="high_error_rate",
                         metric="error_rate",
-                        condition=lambda v: v > error_rate_threshold,
                         threshold=error_rate_threshold,
+                        op=">",
                         severity="critical",
                         channels=[log_channel],
                     ),
@@ -361,6 +596,7 @@ class HealthMonitor:
             )
         else:
             self.alert_engine = alert_engine
+        self._owns_alert_engine = alert_engine is None
 
     def record(
         self,
@@ -446,3 +682,19 @@ class HealthMonitor:
     def add_alert_rule(self, rule: AlertRule) -> None:
         """Add a custom alert rule."""
         self.alert_engine.add_rule(rule)
+
+    def close(self) -> None:
+        """Stop the alert dispatch threads of the default alert engine."""
+        if self._owns_alert_engine:
+            self.alert_engine.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
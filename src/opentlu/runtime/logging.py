@@ -11,12 +11,15 @@ import time
 import uuid
 import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from collections import deque
+import hashlib
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Collection, Deque, Dict, Iterator, List, Optional, Tuple
 from queue import Queue
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from opentlu.foundations.contracts import (
     MitigationState,
@@ -51,10 +54,62 @@ class InterventionRecord:
     session_id: str = ""
     version: str = "1.0"
 
+    # Observation deduplication (see InterventionLogger(dedup_observations=True)).
+    # observation_id marks a record carrying a unique observation payload;
+    # observation_ref points to such a record and leaves `observation` empty.
+    observation_id: Optional[int] = None
+    observation_ref: Optional[int] = None
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for numpy values in observations."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def resolve_observation_refs(records: List[InterventionRecord]) -> List[InterventionRecord]:
+    """
+    Restore observations of deduplicated records.
+
+    Records with an `observation_ref` get the observation of the record (from
+    the same session) whose `observation_id` matches, and their ref is cleared.
+    A ref whose payload record is not among `records` (e.g. a log read back
+    in parts) cannot be resolved; such records keep their `observation_ref`
+    and an empty observation. Other records are returned unchanged.
+    """
+    payloads: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    for record in records:
+        if record.observation_id is not None:
+            payloads[(record.session_id, record.observation_id)] = record.observation
+
+    if not payloads:
+        return records
+
+    resolved: List[InterventionRecord] = []
+    for record in records:
+        if record.observation_ref is not None:
+            observation = payloads.get((record.session_id, record.observation_ref))
+            if observation is not None:
+                record = replace(record, observation=observation, observation_ref=None)
+        resolved.append(record)
+    return resolved
+
 
 class LogSink(ABC):
     """Abstract base class for log sinks."""
 
+    # True if records are kept in process as-is, so loggers may hand over
+    # observation dicts by reference (see InterventionLogger.log_fast)
+    zero_copy: bool = False
+
+    @property
+    def retention(self) -> Optional[int]:
+        """Number of most recent records the sink keeps, or None if unbounded."""
+        return None
+
     @abstractmethod
     def write(self, record: InterventionRecord) -> None:
         """Write a record to the sink."""
@@ -168,19 +223,75 @@ class FileLogSink(LogSink):
         self._writer_thread.join(timeout=5.0)
 
 
+# Integer codes for MitigationState values in MemoryLogSink columns (-1 = unknown)
+_STATE_CODES: Dict[str, int] = {state.value: i for i, state in enumerate(MitigationState)}
+
+
 class MemoryLogSink(LogSink):
-    """In-memory log sink for testing and short sessions."""
+    """
+    In-memory log sink for testing and short sessions.
+
+    Keeps at most `max_records` records in a ring buffer. Alongside the records,
+    the numeric fields are written circularly into compact numpy columns so
+    analytical scans (see get_columns) avoid touching records: state as int8,
+    and OOD score, uncertainty scores and action in `column_dtype` (float16 by
+    default, ~3 significant digits; values beyond 65504 saturate to inf).
+    Timestamps stay float64.
+    """
 
-    def __init__(self, max_records: int = 10000):
+    zero_copy = True
+
+    def __init__(self, max_records: int = 10000, column_dtype: DTypeLike = np.float16):
+        """
+        Args:
+            max_records: Capacity of the ring buffer
+            column_dtype: Floating point type of the score and action columns
+        """
         self.max_records = max_records
-        self._records: List[InterventionRecord] = []
+        self.column_dtype = np.dtype(column_dtype)
+        self._records: Deque[InterventionRecord] = deque(maxlen=max_records)
         self._lock = threading.Lock()
 
+        self._timestamp = np.empty(max_records, dtype=np.float64)
+        self._state = np.empty(max_records, dtype=np.int8)
+        self._ood_score = np.empty(max_records, dtype=self.column_dtype)
+        self._uncertainty = np.empty((max_records, 3), dtype=self.column_dtype)
+        self._action: Optional[np.ndarray] = None  # Sized by the first record's action
+        self._step = np.empty(max_records, dtype=np.int64)
+        self._head = 0  # Next column slot to write
+
+    @property
+    def retention(self) -> Optional[int]:
+        return self.max_records
+
     def write(self, record: InterventionRecord) -> None:
         with self._lock:
             self._records.append(record)
-            if len(self._records) > self.max_records:
-                self._records.pop(0)
+            if self.max_records == 0:
+                return
+            head = self._head
+            self._timestamp[head] = record.timestamp
+            self._state[head] = _STATE_CODES.get(record.mitigation_state, -1)
+            self._ood_score[head] = record.ood_score
+            unc = record.uncertainty
+            self._uncertainty[head] = (
+                unc.get("confidence", np.nan),
+                unc.get("aleatoric_score", np.nan),
+                unc.get("epistemic_score", np.nan),
+            )
+            try:
+                action = np.ravel(np.asarray(record.action_taken, dtype=np.float64))
+            except (TypeError, ValueError):  # ragged or non-numeric actions
+                action = None
+            if self._action is None:
+                width = 0 if action is None else action.size
+                self._action = np.full((self.max_records, width), np.nan, self.column_dtype)
+            if action is not None and action.size == self._action.shape[1]:
+                self._action[head] = action
+            else:
+                self._action[head] = np.nan
+            self._step[head] = record.step_number
+            self._head = (head + 1) % self.max_records
 
     def flush(self) -> None:
         pass
@@ -192,6 +303,31 @@ class MemoryLogSink(LogSink):
         with self._lock:
             return list(self._records)
 
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get the numeric record fields as columns, oldest first.
+
+        Returns:
+            Dict with "timestamp", "state" (index into MitigationState, -1 if
+            unknown), "ood_score", "uncertainty" ((N, 3) confidence, aleatoric
+            and epistemic scores), "action" ((N, action_dim) flattened actions,
+            NaN rows where the size differs from the first record's) and
+            "step_number" arrays.
+        """
+        with self._lock:
+            n = len(self._records)
+            start = self._head - n  # negative when the ring has wrapped
+            order = np.arange(start, start + n) % max(self.max_records, 1)
+            action = self._action if self._action is not None else np.empty((0, 0))
+            return {
+                "timestamp": self._timestamp[order],
+                "state": self._state[order],
+                "ood_score": self._ood_score[order],
+                "uncertainty": self._uncertainty[order],
+                "action": action[order],
+                "step_number": self._step[order],
+            }
+
 
 class InterventionLogger:
     """
@@ -206,6 +342,8 @@ class InterventionLogger:
         session_id: Optional[str] = None,
         log_all: bool = False,
         field_filters: Optional[List[str]] = None,
+        dedup_observations: bool = False,
+        dedup_cache_size: int = 4096,
     ):
         """
         Initialize intervention logger.
@@ -213,17 +351,32 @@ class InterventionLogger:
         Args:
             sink: Where to write logs
             session_id: Unique session identifier
-            log_all: If True, log every step. Otherwise only non-nominal states.
+            log_all: If True, log every step. Otherwise only non-nominal states,
+                the step after leaving one, and steps with a triggered monitor.
+                Skipped steps are only counted (see flush_counters).
             field_filters: List of observation keys to exclude (for privacy)
+            dedup_observations: If True, repeated observations are stored once and
+                later records reference them by id (resolved by LogQuery/ReplayEngine).
+                For sinks with bounded retention (e.g. MemoryLogSink), whose ring
+                may evict the record holding a payload, repeats instead share the
+                first record's observation dict and carry no reference.
+            dedup_cache_size: Maximum number of observation hashes remembered
         """
         self.sink = sink
         self.session_id = session_id or str(uuid.uuid4())
         self.log_all = log_all
         self.field_filters = set(field_filters or [])
+        self.dedup_observations = dedup_observations
+        self.dedup_cache_size = dedup_cache_size
+
+        # observation digest -> (observation_id, stored observation)
+        self._obs_cache: Dict[bytes, Tuple[int, Dict[str, Any]]] = {}
+        self._next_obs_id = 0
 
         self._trace_id = str(uuid.uuid4())
         self._step_number = 0
         self._previous_state = MitigationState.NOMINAL.value
+        self._counters: Dict[str, int] = {"nominal": 0, "logged": 0}
 
     def log(
         self,
@@ -245,44 +398,84 @@ class InterventionLogger:
             action_taken: Action executed
             monitor_outputs: Outputs from safety monitors
         """
-        # Check if we should log this step
+        self._log(
+            observation,
+            mitigation_state,
+            uncertainty,
+            ood_score,
+            action_taken,
+            monitor_outputs,
+            copy_observation=True,
+        )
+
+    def log_fast(
+        self,
+        observation: Dict[str, Any],
+        mitigation_state: MitigationState,
+        uncertainty: UncertaintyEstimate,
+        ood_score: float,
+        action_taken: np.ndarray,
+        monitor_outputs: Optional[Collection[MonitorOutput]] = None,
+    ) -> None:
+        """
+        Log an intervention record, sharing the observation when possible.
+
+        Same as log(), except that for zero-copy sinks (e.g. MemoryLogSink) an
+        unfiltered observation is stored by reference rather than copied, so the
+        caller must not mutate it afterwards. `monitor_outputs` may be any
+        collection, such as MitigationController.last_monitor_outputs.
+        """
+        self._log(
+            observation,
+            mitigation_state,
+            uncertainty,
+            ood_score,
+            action_taken,
+            monitor_outputs,
+            copy_observation=not self.sink.zero_copy,
+        )
+
+    def _log(
+        self,
+        observation: Dict[str, Any],
+        mitigation_state: MitigationState,
+        uncertainty: UncertaintyEstimate,
+        ood_score: float,
+        action_taken: np.ndarray,
+        monitor_outputs: Optional[Collection[MonitorOutput]],
+        copy_observation: bool,
+    ) -> None:
+        """Shared implementation of log() and log_fast()."""
+        # Skip nominal steps before touching observation/uncertainty/action, so
+        # the common case allocates nothing per step.
         should_log = (
             self.log_all
             or mitigation_state != MitigationState.NOMINAL
             or self._previous_state != MitigationState.NOMINAL.value
+            or (monitor_outputs is not None and any(m.triggered for m in monitor_outputs))
         )
 
         if not should_log:
+            self._counters["nominal"] += 1
             self._step_number += 1
             return
 
         # Filter observation fields
-        filtered_obs = {k: v for k, v in observation.items() if k not in self.field_filters}
-
-        # Serialize uncertainty estimate
-        uncertainty_dict = {
-            "confidence": uncertainty.confidence,
-            "aleatoric_score": uncertainty.aleatoric_score,
-            "epistemic_score": uncertainty.epistemic_score,
-            "source": uncertainty.source,
-            "conformal_set_size": uncertainty.conformal_set_size,
-            "coverage_probability": uncertainty.coverage_probability,
-            "prediction_set": uncertainty.prediction_set,
-        }
-
-        # Serialize monitor outputs
-        monitor_dicts = []
-        if monitor_outputs:
-            for m in monitor_outputs:
-                monitor_dicts.append(
-                    {
-                        "monitor_id": m.monitor_id,
-                        "triggered": m.triggered,
-                        "severity": m.severity,
-                        "message": m.message,
-                        "timestamp": m.timestamp,
-                    }
-                )
+        if self.field_filters:
+            filtered_obs = {k: v for k, v in observation.items() if k not in self.field_filters}
+        else:
+            filtered_obs = dict(observation) if copy_observation else observation
+
+        # Serialize uncertainty estimate and monitor outputs. Pydantic keeps model
+        # fields in the instance __dict__, so a C-level dict copy yields the same
+        # field -> value mapping without rebuilding the dict key by key.
+        uncertainty_dict = uncertainty.__dict__.copy()
+        monitor_dicts = [m.__dict__.copy() for m in monitor_outputs] if monitor_outputs else []
+
+        observation_id: Optional[int] = None
+        observation_ref: Optional[int] = None
+        if self.dedup_observations:
+            observation_id, observation_ref, filtered_obs = self._dedup_observation(filtered_obs)
 
         record = InterventionRecord(
             id=str(uuid.uuid4()),
@@ -299,13 +492,62 @@ class InterventionLogger:
             monitor_outputs=monitor_dicts,
             step_number=self._step_number,
             session_id=self.session_id,
+            observation_id=observation_id,
+            observation_ref=observation_ref,
         )
 
         self.sink.write(record)
+        self._counters["logged"] += 1
 
         self._previous_state = mitigation_state.value
         self._step_number += 1
 
+    def _dedup_observation(
+        self, observation: Dict[str, Any]
+    ) -> Tuple[Optional[int], Optional[int], Dict[str, Any]]:
+        """
+        Look up an observation by content hash.
+
+        Returns:
+            (observation_id, None, observation) for a new payload, (None, ref, {})
+            for a repeat, or (None, None, observation) if the observation cannot
+            be serialized. For sinks with bounded retention a repeat gives
+            (None, None, stored observation) instead.
+        """
+        try:
+            blob = json.dumps(observation, sort_keys=True, default=_json_default).encode("utf-8")
+        except (TypeError, ValueError):
+            return None, None, observation
+
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        cached = self._obs_cache.get(digest)
+        if cached is not None:
+            ref, stored = cached
+            if self.sink.retention is not None:
+                return None, None, stored
+            return None, ref, {}
+
+        if len(self._obs_cache) >= self.dedup_cache_size:
+            self._obs_cache.clear()
+
+        obs_id = self._next_obs_id
+        self._next_obs_id += 1
+        self._obs_cache[digest] = (obs_id, observation)
+        return obs_id, None, observation
+
+    def flush_counters(self) -> Dict[str, int]:
+        """
+        Return and reset step counts since the last call.
+
+        Returns:
+            Dict with "nominal" (steps skipped without a record) and "logged"
+            (records written), suitable for periodic summary rows.
+        """
+        counters = dict(self._counters)
+        for key in self._counters:
+            self._counters[key] = 0
+        return counters
+
     def new_trace(self) -> str:
         """Start a new trace (e.g., new episode)."""
         self._trace_id = str(uuid.uuid4())
@@ -326,7 +568,7 @@ class LogQuery:
     """Query interface for intervention logs."""
 
     def __init__(self, records: List[InterventionRecord]):
-        self._records = records
+        self._records = resolve_observation_refs(records)
 
     @classmethod
     def from_file(cls, path: Path) -> "LogQuery":
@@ -394,7 +636,9 @@ class ReplayEngine:
         Args:
             records: List of intervention records to replay
         """
-        self.records = sorted(records, key=lambda r: (r.trace_id, r.step_number))
+        self.records = sorted(
+            resolve_observation_refs(records), key=lambda r: (r.trace_id, r.step_number)
+        )
 
     @classmethod
     def from_query(cls, query: LogQuery) -> "ReplayEngine":
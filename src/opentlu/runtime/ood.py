@@ -1,8 +1,33 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, cast
 
 import numpy as np
+from numpy.typing import DTypeLike
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.linalg.blas import dsyrk
+from scipy.special import rel_entr
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+    _prange = numba.prange
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+    _prange = range
+
+# Above this feature dimension BLAS beats the per-sample compiled kernels
+_MAHAL_KERNEL_MAX_DIM = 64
+
+# Rows of training data shifted per block in MahalanobisDetector.fit, as a
+# budget of float64 elements (bounds fit scratch memory to ~8 MiB)
+_MAHAL_FIT_BLOCK_ELEMENTS = 1 << 20
+
+# Logit gap (in units of temperature, beyond log(C - 1)) above which the
+# energy score is taken as -max(logits); the error is below T * exp(-20)
+_ENERGY_FAST_GAP = 20.0
 
 
 @dataclass
@@ -47,10 +72,73 @@ class BaseOODDetector(ABC):
         pass
 
 
+def _mahal_tri_kernel(X: np.ndarray, mu: np.ndarray, L: np.ndarray, out: np.ndarray) -> None:
+    """
+    Per-sample ||L^-1 (x - mu)|| by forward substitution (lower triangle of L only).
+
+    Plain loops so numba can compile it; rows are independent.
+    """
+    n_samples, dim = X.shape
+    for n in _prange(n_samples):
+        y = np.empty(dim, dtype=X.dtype)
+        total = 0.0
+        for i in range(dim):
+            acc = X[n, i] - mu[i]
+            for j in range(i):
+                acc -= L[i, j] * y[j]
+            y[i] = acc / L[i, i]
+            total += y[i] * y[i]
+        out[n] = np.sqrt(max(total, 0.0))
+
+
+def _mahal_quad_kernel(X: np.ndarray, mu: np.ndarray, P: np.ndarray, out: np.ndarray) -> None:
+    """
+    Per-sample sqrt((x - mu)^T P (x - mu)) for an explicit precision matrix.
+
+    Plain loops so numba can compile it; rows are independent.
+    """
+    n_samples, dim = X.shape
+    for n in _prange(n_samples):
+        diff = np.empty(dim, dtype=X.dtype)
+        for i in range(dim):
+            diff[i] = X[n, i] - mu[i]
+        total = 0.0
+        for i in range(dim):
+            acc = 0.0
+            for j in range(dim):
+                acc += P[i, j] * diff[j]
+            total += diff[i] * acc
+        out[n] = np.sqrt(max(total, 0.0))
+
+
+if HAS_NUMBA:
+    _mahal_tri_numba = numba.njit(parallel=True, fastmath=True, cache=True)(_mahal_tri_kernel)
+    _mahal_quad_numba = numba.njit(parallel=True, fastmath=True, cache=True)(_mahal_quad_kernel)
+else:
+    _mahal_tri_numba = None
+    _mahal_quad_numba = None
+
+
 class MahalanobisDetector(BaseOODDetector):
     """
     Simple Mahalanobis distance based detector.
     Requires pre-computed mean and covariance from training data.
+
+    When fitted from data the detector keeps the lower Cholesky factor of the
+    covariance and scores with a triangular solve; the precision matrix is only
+    materialized on demand.
+
+    Statistics are always estimated in float64 and then stored in ``dtype``.
+    float32 halves the memory traffic of scoring; only the ordering of scores
+    relative to the threshold matters at runtime, so the lost precision is
+    harmless.
+
+    Batch scoring reuses scratch buffers sized to the last batch shape, so a
+    single instance must not be scored from several threads at once.
+
+    Fitting with labels estimates one mean per class and a shared (pooled
+    within-class) covariance; the score is then the distance to the nearest
+    class mean.
     """
 
     def __init__(
@@ -58,19 +146,114 @@ class MahalanobisDetector(BaseOODDetector):
         mean: Optional[np.ndarray] = None,
         precision: Optional[np.ndarray] = None,
         name: str = "mahalanobis",
+        dtype: DTypeLike = np.float64,
+        shrinkage: float = 0.0,
     ):
+        """
+        Args:
+            mean: Feature mean, if not fitted from data
+            precision: Precision matrix, if not fitted from data
+            name: Detector name
+            dtype: Floating point type of the stored statistics
+            shrinkage: Diagonal loading added by fit(), as a fraction of the
+                average feature variance (at least 1e-6 is always added)
+        """
         super().__init__(name)
-        self.mean = mean
+        self.dtype = np.dtype(dtype)
+        self.shrinkage = shrinkage
+        self.classes: Optional[np.ndarray] = None  # Set by fit() with labels
+        self.means: Optional[np.ndarray] = None  # (K, D) class means, aligned with classes
+        self._whitened_means: Optional[np.ndarray] = None  # (K, D) rows L^-1 (mu_k - mean)
+        self._cov_factor: Optional[Tuple[np.ndarray, bool]] = None
+        self._precision: Optional[np.ndarray] = None
+        self.mean: Optional[np.ndarray] = (
+            None if mean is None else np.asarray(mean, dtype=self.dtype)
+        )
         self.precision = precision
         self._fitted = mean is not None and precision is not None
+        self._diff_buf: Optional[np.ndarray] = None
+        self._tmp_buf: Optional[np.ndarray] = None
+
+    @property
+    def precision(self) -> Optional[np.ndarray]:
+        """Precision matrix Sigma^-1 in ``dtype``, computed lazily from the Cholesky factor."""
+        if self._precision is None and self._cov_factor is not None:
+            dim = self._cov_factor[0].shape[0]
+            precision = cho_solve(self._cov_factor, np.eye(dim))
+            self._precision = np.asarray(precision, dtype=self.dtype)
+        return self._precision
+
+    @precision.setter
+    def precision(self, value: Optional[np.ndarray]) -> None:
+        self._precision = None if value is None else np.asarray(value, dtype=self.dtype)
+        self._cov_factor = None
+        self.classes = self.means = self._whitened_means = None
 
     def fit(self, data: np.ndarray, labels: Optional[np.ndarray] = None) -> None:
-        """Fit from data by computing mean and precision matrix."""
-        self.mean = np.mean(data, axis=0)
-        cov = np.cov(data.T)
-        # Add regularization for numerical stability
-        cov = cov + 1e-6 * np.eye(cov.shape[0])
-        self.precision = np.linalg.inv(cov)
+        """
+        Fit from data by computing mean and the Cholesky factor of the covariance.
+
+        Args:
+            data: (N, D) training features
+            labels: Optional (N,) class labels; enables class-conditional means
+                with a shared within-class covariance
+        """
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim == 1:
+            data = data[:, None]
+        n_samples, dim = data.shape
+
+        class_idx: Optional[np.ndarray] = None
+        if labels is not None:
+            classes, class_idx = np.unique(np.asarray(labels), return_inverse=True)
+            class_sums = np.zeros((len(classes), dim))
+
+        # One pass over the data accumulating the sum and the scatter X^T X,
+        # in blocks so no full centered copy is made. Rows are shifted by the
+        # first sample, which keeps X^T X - n mu mu^T from cancelling
+        # catastrophically when the mean is large relative to the spread.
+        shift = data[0].copy() if n_samples else np.zeros(dim)
+        total = np.zeros(dim)
+        scatter = np.zeros((dim, dim), order="F")
+        block_rows = max(1, _MAHAL_FIT_BLOCK_ELEMENTS // max(dim, 1))
+        for start in range(0, n_samples, block_rows):
+            block = data[start : start + block_rows] - shift
+            total += block.sum(axis=0)
+            if class_idx is not None:
+                np.add.at(class_sums, class_idx[start : start + block_rows], block)
+            # Symmetric rank-k update of the lower triangle, which is all
+            # cho_factor(lower=True) reads. block.T is F-contiguous, so BLAS
+            # consumes it without a copy.
+            scatter = dsyrk(1.0, block.T, beta=1.0, c=scatter, lower=1, overwrite_c=1)
+
+        shifted_mean = total / max(n_samples, 1)
+        cov = scatter  # upper triangle is unused
+        if class_idx is None:
+            cov -= n_samples * np.outer(shifted_mean, shifted_mean)
+            cov /= max(n_samples - 1, 1)
+        else:
+            # Within-class scatter: X^T X - sum_k n_k mu_k mu_k^T
+            counts = np.bincount(class_idx, minlength=len(classes))
+            shifted_class_means = class_sums / counts[:, None]
+            cov -= class_sums.T @ shifted_class_means
+            cov /= max(n_samples - len(classes), 1)
+        mean = shifted_mean + shift
+
+        # Diagonal loading for numerical stability
+        ridge = max(1e-6, self.shrinkage * float(np.trace(cov)) / max(dim, 1))
+        cov[np.diag_indices_from(cov)] += ridge
+        factor, lower = cho_factor(cov, lower=True, overwrite_a=True)
+        self.mean = mean.astype(self.dtype, copy=False)
+        self._precision = None
+        self._cov_factor = (factor.astype(self.dtype, copy=False), lower)
+        self.classes = self.means = self._whitened_means = None
+        if class_idx is not None:
+            # Whitened offsets of the class means from the overall mean, so
+            # scoring needs one solve for the inputs and no per-class loop
+            self.classes = classes
+            self.means = (shifted_class_means + shift).astype(self.dtype, copy=False)
+            whitened = solve_triangular(factor, (shifted_class_means - shifted_mean).T, lower=lower)
+            self._whitened_means = np.ascontiguousarray(whitened.T, dtype=self.dtype)
         self._fitted = True
 
     def score(self, inputs: np.ndarray) -> float:
@@ -81,15 +264,74 @@ class MahalanobisDetector(BaseOODDetector):
             raise RuntimeError("Detector not fitted. Call fit() first.")
 
         if inputs.ndim == 1:
-            diff = inputs - self.mean
-            return float(np.sqrt(np.dot(np.dot(diff, self.precision), diff)))
+            return float(self.score_batch(inputs)[0])
         else:
             # Batch mode
-            scores = []
-            for x in inputs:
-                diff = x - self.mean
-                scores.append(np.sqrt(np.dot(np.dot(diff, self.precision), diff)))
-            return float(np.mean(scores))
+            return float(np.mean(self.score_batch(inputs)))
+
+    def score_batch(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Compute per-sample Mahalanobis distances.
+
+        Args:
+            inputs: (N, D) batch of features (a (D,) vector is treated as N=1)
+
+        Returns:
+            (N,) array of distances.
+        """
+        mean = self.mean
+        if not self._fitted or mean is None:
+            raise RuntimeError("Detector not fitted. Call fit() first.")
+
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=self.dtype))
+        if self._whitened_means is not None:
+            return self._score_classes(inputs)
+        if HAS_NUMBA and inputs.shape[1] <= _MAHAL_KERNEL_MAX_DIM:
+            out = np.empty(inputs.shape[0], dtype=self.dtype)
+            X = np.ascontiguousarray(inputs)
+            if self._cov_factor is not None:
+                _mahal_tri_numba(X, mean, self._cov_factor[0], out)
+            else:
+                _mahal_quad_numba(X, mean, self.precision, out)
+            return out
+
+        if self._diff_buf is None or self._diff_buf.shape != inputs.shape:
+            self._diff_buf = np.empty(inputs.shape, dtype=self.dtype)
+            self._tmp_buf = None
+        diff = np.subtract(inputs, mean, out=self._diff_buf)
+
+        if self._cov_factor is not None:
+            # ||L^-1 (x - mu)||^2 with Sigma = L L^T: one triangular solve per
+            # batch, done in place on the (F-contiguous) transposed buffer
+            factor, lower = self._cov_factor
+            y = solve_triangular(factor, diff.T, lower=lower, overwrite_b=True, check_finite=False)
+            d2 = np.einsum("ij,ij->j", y, y)
+        else:
+            # Row-wise quadratic form via one GEMM plus a fused row reduction
+            precision = self.precision
+            if precision is None:
+                raise RuntimeError("Detector not fitted. Call fit() first.")
+            if self._tmp_buf is None:
+                self._tmp_buf = np.empty_like(diff)
+            projected = np.matmul(diff, precision, out=self._tmp_buf)
+            d2 = np.einsum("ij,ij->i", projected, diff)
+        return cast(np.ndarray, np.sqrt(np.maximum(d2, 0.0, out=d2)))
+
+    def _score_classes(self, inputs: np.ndarray) -> np.ndarray:
+        """Distance to the nearest class mean for (N, D) inputs."""
+        w = self._whitened_means
+        if self._cov_factor is None or w is None or self.mean is None:
+            raise RuntimeError("Detector not fitted with labels. Call fit() first.")
+        factor, lower = self._cov_factor
+        # With z = L^-1 (x - mean) and w_k = L^-1 (mu_k - mean), the squared
+        # distance to class k is |z|^2 - 2 z.w_k + |w_k|^2: one GEMM for all K
+        z = solve_triangular(factor, (inputs - self.mean).T, lower=lower, check_finite=False)
+        d2 = z.T @ w.T
+        d2 *= -2.0
+        d2 += np.einsum("ij,ij->j", z, z)[:, None]
+        d2 += np.einsum("ij,ij->i", w, w)
+        min_d2 = d2.min(axis=1)
+        return cast(np.ndarray, np.sqrt(np.maximum(min_d2, 0.0, out=min_d2)))
 
 
 class EnergyBasedDetector(BaseOODDetector):
@@ -117,18 +359,43 @@ class EnergyBasedDetector(BaseOODDetector):
         inputs = np.asarray(inputs)
         if inputs.ndim == 1:
             inputs = inputs.reshape(1, -1)
+        return float(np.mean(self.energy_batch(inputs)))
 
-        # Energy = -T * log(sum(exp(logits/T)))
-        scaled = inputs / self.temperature
-        # Use logsumexp for numerical stability
-        max_val = np.max(scaled, axis=1, keepdims=True)
-        energy = -self.temperature * (
-            max_val.flatten() + np.log(np.sum(np.exp(scaled - max_val), axis=1))
-        )
+    def energy_batch(self, logits: np.ndarray) -> np.ndarray:
+        """
+        Per-sample energy -T * logsumexp(logits / T) for (N, C) logits.
 
-        # Return negative energy (higher = more OOD)
-        # In-distribution samples have lower (more negative) energy
-        return float(np.mean(energy))
+        Confident rows, whose top logit leads the runner-up by more than
+        T * (_ENERGY_FAST_GAP + log(C - 1)), get -max(logits) directly: the
+        other terms change the energy by less than T * exp(-_ENERGY_FAST_GAP).
+        Only the remaining rows pay for the exponentials.
+        """
+        logits = np.asarray(logits, dtype=np.float64)
+        n_classes = logits.shape[1]
+        if n_classes < 2:
+            return -logits[:, 0] if n_classes else np.full(len(logits), np.inf)
+
+        T = self.temperature
+        top2 = np.partition(logits, -2, axis=1)[:, -2:]
+        row_max = top2[:, 1]
+        energy = -row_max
+        slow = ~(row_max - top2[:, 0] > T * (_ENERGY_FAST_GAP + np.log(n_classes - 1)))
+        if slow.all():
+            rows, row_max = logits, row_max[:, None]
+        elif slow.any():
+            rows, row_max = logits[slow], row_max[slow, None]
+        else:
+            return energy
+
+        # Stable logsumexp on the ambiguous rows, shifted by the max found above
+        shifted = np.subtract(rows, row_max)
+        shifted /= T
+        np.exp(shifted, out=shifted)
+        slow_energy = cast(np.ndarray, -(row_max[:, 0] + T * np.log(shifted.sum(axis=1))))
+        if rows is logits:
+            return slow_energy
+        energy[slow] = slow_energy
+        return energy
 
 
 class LabelShiftDetector(BaseOODDetector):
@@ -183,13 +450,15 @@ class LabelShiftDetector(BaseOODDetector):
             # Softmax predictions - compute mean
             current_dist = np.mean(inputs, axis=0)
         else:
-            # Predicted labels - compute histogram
-            unique, counts = np.unique(inputs, return_counts=True)
-            current_dist = np.zeros(self._n_classes)
-            for u, c in zip(unique, counts):
-                if u < self._n_classes:
-                    current_dist[int(u)] = c
-            current_dist = current_dist / (current_dist.sum() + 1e-10)
+            # Predicted labels - compute histogram (labels >= n_classes are ignored)
+            labels = inputs.astype(np.intp)
+            if labels.size and labels.min() < 0:
+                raise ValueError(
+                    f"Predicted labels must be non-negative class indices, got {labels.min()}"
+                )
+            counts = np.bincount(labels, minlength=self._n_classes)
+            counts = counts[: self._n_classes].astype(np.float64)
+            current_dist = counts / (counts.sum() + 1e-10)
 
         # Ensure same size
         ref = self.reference_distribution
@@ -199,11 +468,10 @@ class LabelShiftDetector(BaseOODDetector):
             current_dist = np.pad(current_dist, (0, max_len - len(current_dist)))
             ref = np.pad(ref, (0, max_len - len(ref)))
 
-        # Compute KL divergence: sum(p * log(p/q))
-        eps = 1e-10
-        current_dist = np.clip(current_dist, eps, 1)
-        ref = np.clip(ref, eps, 1)
-        kl_div = np.sum(current_dist * np.log(current_dist / ref))
+        # Compute KL divergence: sum(p * log(p/q)); rel_entr treats 0*log(0) as 0.
+        # Only the reference is floored, so unseen reference classes give a
+        # large but finite score.
+        kl_div = rel_entr(current_dist, np.maximum(ref, 1e-10)).sum()
 
         return float(kl_div)
 
@@ -225,6 +493,17 @@ class DynamicsResidualDetector(BaseOODDetector):
         self.residual_threshold = residual_threshold
         self._mean_residual = 0.0
         self._std_residual = 1.0
+        # Running moments of residual norms (Welford / Chan et al.)
+        self._n = 0
+        self._m2 = 0.0
+
+    @staticmethod
+    def _residual_norms(data: np.ndarray) -> np.ndarray:
+        """Per-sample residual magnitudes; 1-D data holds scalar residuals."""
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim == 1:
+            return cast(np.ndarray, np.abs(data))
+        return cast(np.ndarray, np.sqrt(np.einsum("...i,...i->...", data, data)).ravel())
 
     def fit(self, data: np.ndarray, labels: Optional[np.ndarray] = None) -> None:
         """
@@ -234,9 +513,33 @@ class DynamicsResidualDetector(BaseOODDetector):
             data: Historical residuals (N, D)
             labels: Not used
         """
-        residual_norms = np.linalg.norm(data, axis=-1) if data.ndim > 1 else np.abs(data)
-        self._mean_residual = float(np.mean(residual_norms))
-        self._std_residual = float(np.std(residual_norms)) + 1e-6
+        self._n = 0
+        self._m2 = 0.0
+        self._mean_residual = 0.0
+        self.update(data)
+
+    def update(self, residuals: np.ndarray) -> None:
+        """
+        Fold a batch of residuals into the running mean/std without refitting.
+
+        Args:
+            residuals: New residuals (N, D), or (N,) scalar residuals
+        """
+        norms = self._residual_norms(residuals)
+        n_new = norms.size
+        if n_new == 0:
+            return
+
+        batch_mean = float(norms.mean())
+        batch_m2 = float(np.square(norms - batch_mean).sum())
+
+        # Merge batch moments into the running ones
+        n_total = self._n + n_new
+        delta = batch_mean - self._mean_residual
+        self._mean_residual += delta * n_new / n_total
+        self._m2 += batch_m2 + delta * delta * self._n * n_new / n_total
+        self._n = n_total
+        self._std_residual = float(np.sqrt(self._m2 / n_total)) + 1e-6
 
     def score(self, inputs: np.ndarray) -> float:
         """
@@ -250,9 +553,9 @@ class DynamicsResidualDetector(BaseOODDetector):
         """
         inputs = np.asarray(inputs)
         if inputs.ndim == 1:
-            residual_norm = float(np.linalg.norm(inputs))
+            residual_norm = float(np.sqrt(np.vdot(inputs, inputs)))
         else:
-            residual_norm = float(np.mean(np.linalg.norm(inputs, axis=-1)))
+            residual_norm = float(np.mean(self._residual_norms(inputs)))
 
         # Return z-score
         z_score = (residual_norm - self._mean_residual) / self._std_residual
@@ -283,16 +586,40 @@ class OODEnsemble:
             combination_method: How to combine scores
         """
         self.detectors = detectors
-        self.weights = weights or [1.0 / len(detectors)] * len(detectors)
         self.threshold = threshold
         self.combination_method = combination_method
 
-        if len(self.weights) != len(detectors):
+        if weights:
+            weights_arr = np.asarray(weights, dtype=np.float64)
+        else:
+            weights_arr = np.full(len(detectors), 1.0 / len(detectors))
+        if weights_arr.shape != (len(detectors),):
             raise ValueError("Number of weights must match number of detectors")
 
         # Normalize weights
-        weight_sum = sum(self.weights)
-        self.weights = [w / weight_sum for w in self.weights]
+        self._weights_arr = weights_arr / weights_arr.sum()
+        self.weights = self._weights_arr.tolist()
+
+        # Resolve which input each detector consumes once, not per call
+        self._dispatch = tuple(
+            (detector.name, self._make_scorer(detector)) for detector in detectors
+        )
+
+    @staticmethod
+    def _make_scorer(
+        detector: BaseOODDetector,
+    ) -> Callable[[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]], float]:
+        """Bind a detector to the ``score`` argument it consumes."""
+        score = detector.score
+        if isinstance(detector, LabelShiftDetector):
+            return lambda inputs, predictions, residual: score(
+                inputs if predictions is None else predictions
+            )
+        if isinstance(detector, DynamicsResidualDetector):
+            return lambda inputs, predictions, residual: score(
+                inputs if residual is None else residual
+            )
+        return lambda inputs, predictions, residual: score(inputs)
 
     def score(
         self,
@@ -312,40 +639,36 @@ class OODEnsemble:
             OODResult with ensemble and component scores.
         """
         component_scores: Dict[str, float] = {}
-        weighted_scores: List[Tuple[float, float]] = []  # (weight, score)
+        n_detectors = len(self.detectors)
+        scores = np.zeros(n_detectors)
+        ok = np.ones(n_detectors, dtype=bool)
+
+        inputs = np.asarray(inputs)
 
-        for detector, weight in zip(self.detectors, self.weights):
+        for i, (name, scorer) in enumerate(self._dispatch):
             try:
-                if isinstance(detector, LabelShiftDetector) and predictions is not None:
-                    score = detector.score(predictions)
-                elif (
-                    isinstance(detector, DynamicsResidualDetector) and dynamics_residual is not None
-                ):
-                    score = detector.score(dynamics_residual)
-                else:
-                    score = detector.score(inputs)
-
-                component_scores[detector.name] = score
-                weighted_scores.append((weight, score))
+                score = scorer(inputs, predictions, dynamics_residual)
+                component_scores[name] = score
+                scores[i] = score
             except Exception:
                 # Graceful degradation - skip failed detectors
-                component_scores[detector.name] = 0.0
-                weighted_scores.append((0.0, 0.0))
+                component_scores[name] = 0.0
+                ok[i] = False
 
-        # Combine scores
+        # Combine scores; failed detectors contribute zero weight and score
+        weights = np.where(ok, self._weights_arr, 0.0)
         if self.combination_method == "weighted_mean":
-            total_weight = sum(w for w, _ in weighted_scores)
+            total_weight = weights.sum()
             if total_weight > 0:
-                ensemble_score = sum(w * s for w, s in weighted_scores) / total_weight
+                ensemble_score = float(weights @ scores / total_weight)
             else:
                 ensemble_score = 0.0
         elif self.combination_method == "max":
-            ensemble_score = max(s for _, s in weighted_scores) if weighted_scores else 0.0
+            ensemble_score = float(scores[ok].max()) if ok.any() else 0.0
         elif self.combination_method == "vote":
-            votes = sum(1 for _, s in weighted_scores if s > self.threshold)
-            ensemble_score = votes / len(self.detectors)
+            ensemble_score = np.count_nonzero(scores > self.threshold) / n_detectors
         else:
-            ensemble_score = sum(w * s for w, s in weighted_scores)
+            ensemble_score = float(weights @ scores)
 
         # Determine contributing detector
         if component_scores:
@@ -5,12 +5,21 @@ Implements convex constraint projection and control barrier function (CBF)
 filtering to ensure actions satisfy safety envelope constraints.
 """
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Protocol, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, cast
 import numpy as np
 
 from opentlu.foundations.contracts import SafetyEnvelope
 
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
 
 @dataclass
 class FilteredAction:
@@ -39,6 +48,21 @@ class LinearConstraint:
     A: np.ndarray  # (M, D) constraint matrix
     b: np.ndarray  # (M,) constraint bounds
     name: str = "linear"
+    # Derived from A at construction; rebuild the constraint if A changes
+    _row_norm_sq: np.ndarray = field(init=False, repr=False, compare=False)
+    _active_rows: np.ndarray = field(init=False, repr=False, compare=False)
+    _active_A: np.ndarray = field(init=False, repr=False, compare=False)
+    _active_gram: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # C-contiguous floating rows keep the per-row slices and GEMVs cheap
+        self.A = np.ascontiguousarray(self.A, dtype=np.result_type(self.A, 1.0))
+        self._row_norm_sq = np.einsum("ij,ij->i", self.A, self.A)
+        # Degenerate (all-zero) rows cannot be projected onto and are skipped
+        self._active_rows = np.flatnonzero(self._row_norm_sq > 1e-10)
+        self._active_A = self.A[self._active_rows]
+        # Row inner products, so a projection step updates all violations at once
+        self._active_gram = self._active_A @ self._active_A.T
 
 
 class DynamicsModel(Protocol):
@@ -69,11 +93,71 @@ def box_constraint_project(
         constraint: Box constraint with lower and upper bounds
 
     Returns:
-        (projected_action, was_modified)
+        (projected_action, was_modified). An action already inside the box is
+        returned as-is, without a copy.
     """
-    projected = np.clip(action, constraint.lower, constraint.upper)
-    was_modified = not np.allclose(action, projected)
-    return projected, was_modified
+    # Exact containment test; it short-circuits on the lower bound and, unlike
+    # a "< lower / > upper" test, treats NaN coordinates as violations.
+    if (action >= constraint.lower).all() and (action <= constraint.upper).all():
+        return action, False
+    # At least one coordinate is outside (or NaN), so clipping changes it
+    return np.clip(action, constraint.lower, constraint.upper), True
+
+
+def _project_halfspaces(
+    A: np.ndarray,
+    b: np.ndarray,
+    norm_sq: np.ndarray,
+    gram: np.ndarray,
+    x: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+    omega: float = 1.0,
+) -> Tuple[np.ndarray, bool]:
+    """
+    Scalar-loop kernel for Gauss-Southwell half-space projection, updating ``x`` in place.
+
+    Same update order as the NumPy path of linear_constraint_project (always
+    the most violated row, ties to the lowest index), so both paths return
+    the same action. ``A`` holds the non-degenerate rows only and ``gram`` is
+    ``A @ A.T``. Written with explicit loops so it can be compiled by numba;
+    it is only called directly when numba is available.
+    """
+    n_rows, dim = A.shape
+    violations = np.empty(n_rows)
+    for _ in range(max_iterations):
+        max_violation = -np.inf
+        for i in range(n_rows):
+            violation = -b[i]
+            for j in range(dim):
+                violation += A[i, j] * x[j]
+            violations[i] = violation
+            if violation > max_violation:
+                max_violation = violation
+        if max_violation <= tolerance:
+            break
+
+        for _ in range(n_rows):
+            k = 0
+            for i in range(1, n_rows):
+                if violations[i] > violations[k]:
+                    k = i
+            violation = violations[k]
+            if violation <= tolerance:
+                break
+            # Project: x = x - omega * (a'x - b) * a / ||a||^2
+            step = omega * violation / norm_sq[k]
+            for j in range(dim):
+                x[j] -= step * A[k, j]
+            for i in range(n_rows):
+                violations[i] -= step * gram[k, i]
+    return x, True
+
+
+if HAS_NUMBA:
+    _project_numba = numba.njit(cache=True, fastmath=True)(_project_halfspaces)
+else:
+    _project_numba = None
 
 
 def linear_constraint_project(
@@ -81,24 +165,33 @@ def linear_constraint_project(
     constraint: LinearConstraint,
     max_iterations: int = 100,
     tolerance: float = 1e-6,
+    omega: float = 1.0,
 ) -> Tuple[np.ndarray, bool]:
     """
     Project action onto linear constraints using iterative projection.
 
-    Uses Dykstra's algorithm for projection onto intersection of half-spaces.
+    Uses Gauss-Southwell iterative projection onto the intersection of
+    half-spaces (always stepping onto the most violated one). The loop runs in
+    a numba-compiled kernel with the same update order when numba is installed.
 
     Args:
         action: Original action
         constraint: Linear constraint A @ x <= b
         max_iterations: Maximum projection iterations
-        tolerance: Convergence tolerance
+        tolerance: Convergence tolerance on the largest violation in a pass
+        omega: Successive over-relaxation factor in (0, 2); values in
+            1.0-1.9 step past each violated boundary and converge in fewer
+            passes when constraints are strongly coupled
 
     Returns:
         (projected_action, was_modified)
     """
+    if not 0.0 < omega < 2.0:
+        raise ValueError(f"omega must be in (0, 2), got {omega}")
+
     A = constraint.A
     b = constraint.b
-    x = action.copy()
+    x = action.astype(np.result_type(action, 1.0))
 
     # Check which constraints are violated
     violations = A @ x - b
@@ -106,24 +199,45 @@ def linear_constraint_project(
     if np.all(violations <= tolerance):
         return x, False
 
-    # Iterative projection onto half-spaces
-    for _ in range(max_iterations):
-        x_prev = x.copy()
-
-        for i in range(len(b)):
-            # Project onto half-space A[i] @ x <= b[i]
-            a_i = A[i]
-            violation = np.dot(a_i, x) - b[i]
-
-            if violation > tolerance:
-                # Project: x = x - (a'x - b) * a / ||a||^2
-                norm_sq = np.dot(a_i, a_i)
-                if norm_sq > 1e-10:
-                    x = x - (violation / norm_sq) * a_i
+    active = constraint._active_rows
+    A_active = constraint._active_A
+    gram = constraint._active_gram
+    b_active = b[active]
+    norm_sq = constraint._row_norm_sq[active]
+
+    if _project_numba is not None:
+        return cast(
+            Tuple[np.ndarray, bool],
+            _project_numba(
+                np.ascontiguousarray(A_active, dtype=np.float64),
+                np.ascontiguousarray(b_active, dtype=np.float64),
+                norm_sq.astype(np.float64, copy=False),
+                np.ascontiguousarray(gram, dtype=np.float64),
+                x.astype(np.float64, copy=False),
+                max_iterations,
+                tolerance,
+                omega,
+            ),
+        )
 
-        if np.linalg.norm(x - x_prev) < tolerance:
+    # Gauss-Southwell projection: always project onto the most violated
+    # half-space. All violations come from one GEMV per outer iteration and are
+    # kept current with a rank-1 (Gram column) update after each step.
+    for _ in range(max_iterations):
+        violations = A_active @ x - b_active
+        if violations.max(initial=-np.inf) <= tolerance:
             break
 
+        for _ in range(len(active)):
+            k = int(np.argmax(violations))
+            violation = violations[k]
+            if violation <= tolerance:
+                break
+            # Project: x = x - omega * (a'x - b) * a / ||a||^2
+            step = omega * violation / norm_sq[k]
+            x -= step * A_active[k]
+            violations -= step * gram[k]
+
     return x, True
 
 
@@ -140,6 +254,7 @@ class CBFFilter:
         dynamics_model: DynamicsModel,
         barrier_fn: Callable[[np.ndarray], float],
         alpha: float = 1.0,
+        batch_dynamics: bool = False,
     ):
         """
         Initialize CBF filter.
@@ -148,10 +263,14 @@ class CBFFilter:
             dynamics_model: Model predicting next state
             barrier_fn: Safety barrier function h(x) >= 0 means safe
             alpha: Class-K function parameter (higher = more conservative)
+            batch_dynamics: Whether ``dynamics_model.predict`` accepts stacked
+                (N, ...) states and actions; enables a single batched
+                line-search call instead of one call per candidate
         """
         self.dynamics = dynamics_model
         self.h = barrier_fn
         self.alpha = alpha
+        self.batch_dynamics = batch_dynamics
 
     def is_safe(self, state: np.ndarray, action: np.ndarray) -> Tuple[bool, float]:
         """
@@ -200,6 +319,11 @@ class CBFFilter:
         if is_safe:
             return action, False, margin
 
+        if self.batch_dynamics:
+            result = self._batched_line_search(state, action, n_samples)
+            if result is not None:
+                return result
+
         # Line search toward zero action
         for alpha in np.linspace(0, 1, n_samples):
             scaled_action = (1 - alpha) * action
@@ -210,6 +334,39 @@ class CBFFilter:
         # Return zero action if nothing works
         return np.zeros_like(action), True, self.h(state)
 
+    def _batched_line_search(
+        self,
+        state: np.ndarray,
+        action: np.ndarray,
+        n_samples: int,
+    ) -> Optional[Tuple[np.ndarray, bool, float]]:
+        """
+        Evaluate every line-search candidate with one ``predict`` call.
+
+        Returns None if the dynamics model rejects batched input, so the
+        caller can fall back to the sequential search.
+        """
+        alphas = np.linspace(0, 1, n_samples)
+        scaled = (1 - alphas)[:, None] * action[None, :]
+        states = np.broadcast_to(state, (n_samples,) + np.shape(state))
+        try:
+            next_states = np.asarray(self.dynamics.predict(states, scaled))
+        except Exception:
+            return None
+        if next_states.ndim == 0 or next_states.shape[0] != n_samples:
+            return None
+
+        h_current = self.h(state)
+        h_next = np.fromiter((self.h(s) for s in next_states), dtype=float, count=n_samples)
+        margins = h_next - (1 - self.alpha) * h_current
+
+        # Smallest scaling (closest to the proposed action) that is safe
+        safe = np.flatnonzero(margins >= 0)
+        if safe.size == 0:
+            return np.zeros_like(action), True, h_current
+        first = safe[0]
+        return scaled[first], True, float(margins[first])
+
 
 class SafetyFilter:
     """
@@ -226,6 +383,7 @@ class SafetyFilter:
         linear_constraints: Optional[List[LinearConstraint]] = None,
         cbf_filter: Optional[CBFFilter] = None,
         fallback_action: Optional[np.ndarray] = None,
+        memo_size: int = 0,
     ):
         """
         Initialize safety filter.
@@ -236,12 +394,49 @@ class SafetyFilter:
             linear_constraints: List of linear constraints
             cbf_filter: Optional CBF filter for dynamics constraints
             fallback_action: Conservative fallback action
+            memo_size: Number of recent filter results to memoize, keyed on
+                the exact candidate action (0 disables). Only used without a
+                CBF filter, whose result also depends on the state.
         """
         self.envelope = envelope
-        self.box_constraints = box_constraints or []
-        self.linear_constraints = linear_constraints or []
+        # Tuples, so the memoized results cannot go stale through in-place edits
+        self.box_constraints = tuple(box_constraints or ())
+        self.linear_constraints = tuple(linear_constraints or ())
         self.cbf_filter = cbf_filter
         self.fallback_action = fallback_action
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[str, Tuple[int, ...], bytes], FilteredAction]" = (
+            OrderedDict()
+        )
+
+        # Stack constraints of each kind so filter() makes one pass per kind
+        # instead of one per constraint.
+        self._box_names = [c.name for c in self.box_constraints]
+        if self.box_constraints:
+            n_boxes = len(self.box_constraints)
+            bounds = np.broadcast_arrays(
+                *[c.lower for c in self.box_constraints],
+                *[c.upper for c in self.box_constraints],
+            )
+            self._box_lowers = np.array(bounds[:n_boxes], dtype=np.float64).reshape(n_boxes, -1)
+            self._box_uppers = np.array(bounds[n_boxes:], dtype=np.float64).reshape(n_boxes, -1)
+            # Projecting onto the intersection of all boxes is a single clip
+            self._box_lower = self._box_lowers.max(axis=0)
+            self._box_upper = self._box_uppers.min(axis=0)
+
+        # Constraints without rows are always satisfied and are left out of the
+        # stack, since reduceat cannot express an empty segment
+        stacked = [c for c in self.linear_constraints if np.size(c.b)]
+        self._linear_names = [c.name for c in stacked]
+        self._empty_linear_names = [c.name for c in self.linear_constraints if not np.size(c.b)]
+        if stacked:
+            self._linear_stack = LinearConstraint(
+                A=np.vstack([c.A for c in stacked]),
+                b=np.concatenate([np.ravel(c.b) for c in stacked]),
+                name="stacked",
+            )
+            # Start row of each constraint within the stack, for per-constraint reductions
+            self._linear_offsets = np.cumsum([0] + [np.size(c.b) for c in stacked[:-1]])
 
     def filter(
         self,
@@ -258,36 +453,71 @@ class SafetyFilter:
         Returns:
             FilteredAction with safe action and metadata.
         """
-        action = candidate_action.copy()
+        if self.memo_size <= 0 or self.cbf_filter is not None:
+            return self._filter(candidate_action, state)
+
+        key = (candidate_action.dtype.str, candidate_action.shape, candidate_action.tobytes())
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = self._filter(candidate_action, state)
+            # Keep a private copy; the returned result may be mutated by the caller
+            cached = replace(
+                cached,
+                action=cached.action.copy(),
+                constraint_margins=dict(cached.constraint_margins),
+            )
+            self._memo[key] = cached
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+
+        return replace(
+            cached,
+            action=cached.action.copy(),
+            constraint_margins=dict(cached.constraint_margins),
+        )
+
+    def _filter(
+        self,
+        candidate_action: np.ndarray,
+        state: Optional[np.ndarray],
+    ) -> FilteredAction:
+        """Run every constraint stage on the candidate action."""
+        action = candidate_action.astype(np.result_type(candidate_action, 1.0))
         was_modified = False
         constraint_margins: Dict[str, float] = {}
         fallback_used = False
         violation_type = None
 
-        # 1. Apply box constraints
-        for box_constraint in self.box_constraints:
-            new_action, modified = box_constraint_project(action, box_constraint)
-            if modified:
+        # 1. Apply box constraints, all boxes at once
+        if self.box_constraints:
+            margins = self._box_margins(action)
+            violated = ~(margins >= 0.0)  # NaN counts as a violation
+            if violated.any():
+                np.clip(action, self._box_lower, self._box_upper, out=action)
                 was_modified = True
-                violation_type = box_constraint.name
-
-            # Compute margin (min distance to constraint)
-            lower_margin = float(np.min(new_action - box_constraint.lower))
-            upper_margin = float(np.min(box_constraint.upper - new_action))
-            constraint_margins[box_constraint.name] = min(lower_margin, upper_margin)
-            action = new_action
-
-        # 2. Apply linear constraints
-        for lin_constraint in self.linear_constraints:
-            new_action, modified = linear_constraint_project(action, lin_constraint)
-            if modified:
+                violation_type = self._box_names[np.flatnonzero(violated)[-1]]
+                margins = self._box_margins(action)
+
+            constraint_margins.update(zip(self._box_names, margins.tolist()))
+
+        # 2. Apply linear constraints, projecting onto all half-spaces jointly
+        if self._linear_names:
+            stacked = self._linear_stack
+            violations = stacked.A @ action - stacked.b
+            row_violated = violations > 1e-6
+            if row_violated.any():
+                action, _ = linear_constraint_project(action, stacked)
                 was_modified = True
-                violation_type = lin_constraint.name
+                violated = np.logical_or.reduceat(row_violated, self._linear_offsets)
+                violation_type = self._linear_names[np.flatnonzero(violated)[-1]]
+                violations = stacked.A @ action - stacked.b
 
             # Compute margin
-            violations = lin_constraint.A @ new_action - lin_constraint.b
-            constraint_margins[lin_constraint.name] = float(-np.max(violations))
-            action = new_action
+            margins = -np.maximum.reduceat(violations, self._linear_offsets)
+            constraint_margins.update(zip(self._linear_names, margins.tolist()))
+        constraint_margins.update(dict.fromkeys(self._empty_linear_names, np.inf))
 
         # 3. Apply CBF filter if available
         if self.cbf_filter is not None and state is not None:
@@ -307,7 +537,7 @@ class SafetyFilter:
 
         # 4. Check if we need fallback
         # If action was modified to zero or very small, use fallback
-        if np.linalg.norm(action) < 1e-6 and self.fallback_action is not None:
+        if self.fallback_action is not None and float(np.vdot(action, action)) < 1e-12:
             action = self.fallback_action
             fallback_used = True
 
@@ -319,6 +549,11 @@ class SafetyFilter:
             violation_type=violation_type,
         )
 
+    def _box_margins(self, action: np.ndarray) -> np.ndarray:
+        """Distance from action to the nearest bound of each box (negative = outside)."""
+        margins = np.minimum(action - self._box_lowers, self._box_uppers - action)
+        return cast(np.ndarray, margins.min(axis=1))
+
     def check_constraints(self, action: np.ndarray) -> Dict[str, bool]:
         """
         Check if action satisfies all constraints without modifying.
@@ -328,14 +563,15 @@ class SafetyFilter:
         """
         results: Dict[str, bool] = {}
 
-        for box_constraint in self.box_constraints:
-            satisfied = bool(
-                np.all(action >= box_constraint.lower) and np.all(action <= box_constraint.upper)
-            )
-            results[box_constraint.name] = satisfied
+        if self.box_constraints:
+            satisfied = self._box_margins(action) >= 0.0
+            results.update(zip(self._box_names, satisfied.tolist()))
 
-        for lin_constraint in self.linear_constraints:
-            violations = lin_constraint.A @ action - lin_constraint.b
-            results[lin_constraint.name] = bool(np.all(violations <= 0))
+        if self._linear_names:
+            stacked = self._linear_stack
+            violations = stacked.A @ action - stacked.b
+            satisfied = np.maximum.reduceat(violations, self._linear_offsets) <= 0
+            results.update(zip(self._linear_names, satisfied.tolist()))
+        results.update(dict.fromkeys(self._empty_linear_names, True))
 
         return results
@@ -1,12 +1,23 @@
+import math
 import time
+from collections import deque
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from opentlu.foundations.contracts import MonitorOutput
 
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
 
 @dataclass
 class TTCConfig:
@@ -17,11 +28,28 @@ class TTCConfig:
     model: Literal["constant_velocity", "constant_acceleration"] = "constant_velocity"
     debounce_steps: int = 3  # Hysteresis for rapid oscillation prevention
     min_closing_velocity: float = 0.1  # Minimum closing speed to consider
+    exact_severity: bool = False  # Evaluate the severity formula instead of the lookup table
+
+
+# Resolution of the TTC severity lookup table (entries over [0, warning_ttc])
+_SEVERITY_LUT_SIZE = 1024
+
+
+def _exact_ttc_severity(min_ttc: float, warning_ttc: float) -> float:
+    """1 - min_ttc / warning_ttc clipped to [0, 1], for min_ttc < warning_ttc."""
+    if not min_ttc > 0.0:  # contact, or a NaN TTC treated as one
+        return 1.0
+    return max(0.0, min(1.0, 1.0 - min_ttc / warning_ttc))
 
 
 @dataclass
 class TrackedObject:
-    """Represents a tracked object for TTC computation."""
+    """
+    Represents a tracked object for TTC computation.
+
+    A convenience container for callers; TTCMonitor.check reads object state
+    from dicts or arrays straight into its buffers and never builds these.
+    """
 
     object_id: str
     position: np.ndarray  # (2,) or (3,) for 2D/3D
@@ -29,6 +57,34 @@ class TrackedObject:
     acceleration: Optional[np.ndarray] = None  # Optional for constant_acceleration model
 
 
+class _BatchBuffers:
+    """
+    Structure-of-arrays storage for the objects seen in one TTC check.
+
+    Rows are overwritten in place each tick; the arrays are only reallocated
+    when the object count or dimensionality changes.
+    """
+
+    def __init__(self, n_objects: int, dim: int, dtype: DTypeLike = np.float64):
+        self.pos = np.empty((n_objects, dim), dtype=dtype)
+        self.vel = np.empty((n_objects, dim), dtype=dtype)
+        self.acc = np.zeros((n_objects, dim), dtype=dtype)
+        self.has_acc = np.zeros(n_objects, dtype=bool)
+        self.ids: List[str] = [""] * n_objects
+
+    def fill(self, objects_data: List[Dict[str, Any]]) -> None:
+        """Copy object dicts into the buffers without per-object allocations."""
+        pos, vel, acc_buf, has_acc, ids = self.pos, self.vel, self.acc, self.has_acc, self.ids
+        for i, obj in enumerate(objects_data):
+            pos[i] = obj["position"]
+            vel[i] = obj["velocity"]
+            acc = obj.get("acceleration")
+            has_acc[i] = acc is not None
+            if acc is not None:
+                acc_buf[i] = acc
+            ids[i] = obj.get("object_id", "unknown")
+
+
 class BaseMonitor(ABC):
     """Abstract base class for runtime monitors."""
 
@@ -36,12 +92,14 @@ class BaseMonitor(ABC):
         self.monitor_id = monitor_id
 
     @abstractmethod
-    def check(self, state: Dict[str, Any]) -> MonitorOutput:
+    def check(self, state: Dict[str, Any], timestamp: Optional[float] = None) -> MonitorOutput:
         """
         Check the current state against safety criteria.
 
         Args:
             state: Dictionary containing current observations/state.
+            timestamp: Time to stamp the output with. Callers running several
+                monitors per tick can pass one shared value; defaults to now.
 
         Returns:
             MonitorOutput with trigger status and severity.
@@ -57,47 +115,209 @@ class ConstraintMonitor(BaseMonitor):
         self.limit = limit
         self.metric_key = metric_key
 
-    def check(self, state: Dict[str, Any]) -> MonitorOutput:
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: float) -> None:
+        self._limit = value
+        # Severity multiplies by the reciprocal instead of dividing per check.
+        # A zero limit has no relative scale: any excess is a full violation.
+        self._inv_limit = 1.0 / value if value else np.inf
+
+    def check(self, state: Dict[str, Any], timestamp: Optional[float] = None) -> MonitorOutput:
+        """
+        Check the metric against the limit.
+
+        An array metric is checked elementwise: the monitor triggers if any
+        element exceeds the limit and reports the largest severity.
+        """
         value = state.get(self.metric_key, 0.0)
-        triggered = value > self.limit
-        severity = (value - self.limit) / self.limit if triggered else 0.0
-        severity = min(max(severity, 0.0), 1.0)
+        if isinstance(value, np.ndarray):
+            return self._check_values(value, timestamp)
+
+        over = value - self._limit
+        triggered = over > 0
+        # The guard keeps severity at 0 below a negative limit, where the
+        # relative excess would otherwise be positive
+        severity = max(0.0, min(1.0, over * self._inv_limit)) if triggered else 0.0
 
         return MonitorOutput(
             monitor_id=self.monitor_id,
             triggered=triggered,
             severity=severity,
             message=f"Value {value} exceeded limit {self.limit}" if triggered else "OK",
-            timestamp=time.time(),
+            timestamp=time.time() if timestamp is None else timestamp,
+        )
+
+    def _check_values(self, values: np.ndarray, timestamp: Optional[float]) -> MonitorOutput:
+        """Aggregate check over an array of metric values."""
+        over = values - self._limit
+        with np.errstate(invalid="ignore"):  # 0 * inf for a zero limit, masked below
+            severity = np.clip(over * self._inv_limit, 0.0, 1.0)
+        severity[~(over > 0)] = 0.0
+        n_over = int(np.count_nonzero(over > 0))
+        return MonitorOutput(
+            monitor_id=self.monitor_id,
+            triggered=n_over > 0,
+            severity=float(severity.max()) if severity.size else 0.0,
+            message=(
+                f"{n_over} of {values.size} values exceeded limit {self.limit}" if n_over else "OK"
+            ),
+            timestamp=time.time() if timestamp is None else timestamp,
         )
 
 
 class GeofenceMonitor(BaseMonitor):
     """Monitors if position is within allowed bounds."""
 
-    def __init__(self, monitor_id: str, bounds: tuple[float, float, float, float]):
+    def __init__(
+        self,
+        monitor_id: str,
+        bounds: tuple[float, float, float, float],
+        severity_scale: Optional[float] = None,
+    ):
         """
         Args:
             bounds: (x_min, y_min, x_max, y_max)
+            severity_scale: Distance outside the bounds at which severity
+                saturates at 1. None reports severity 1.0 for any violation.
         """
         super().__init__(monitor_id)
         self.bounds = bounds
+        self.severity_scale = severity_scale
+
+    @property
+    def severity_scale(self) -> Optional[float]:
+        return self._severity_scale
+
+    @severity_scale.setter
+    def severity_scale(self, value: Optional[float]) -> None:
+        self._severity_scale = value
+        self._inv_scale = 1.0 / value if value else None
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, value: tuple[float, float, float, float]) -> None:
+        self._bounds = value
+        # Scalar and vector copies of the bounds used by check()/check_batch()
+        self._x_min, self._y_min, self._x_max, self._y_max = value
+        self._lo = np.array([self._x_min, self._y_min], dtype=np.float64)
+        self._hi = np.array([self._x_max, self._y_max], dtype=np.float64)
+
+    def check(self, state: Dict[str, Any], timestamp: Optional[float] = None) -> MonitorOutput:
+        """
+        Check a position, or many positions given as arrays under "x" and "y".
 
-    def check(self, state: Dict[str, Any]) -> MonitorOutput:
+        For arrays the monitor triggers if any point is outside and reports the
+        largest severity.
+        """
         x = state.get("x", 0.0)
         y = state.get("y", 0.0)
-        x_min, y_min, x_max, y_max = self.bounds
+        if isinstance(x, np.ndarray) or isinstance(y, np.ndarray):
+            return self._check_points(x, y, timestamp)
 
-        triggered = not (x_min <= x <= x_max and y_min <= y <= y_max)
+        triggered = not (self._x_min <= x <= self._x_max and self._y_min <= y <= self._y_max)
+        severity = 0.0
+        if triggered:
+            severity = 1.0
+            if self._inv_scale is not None:
+                dx = max(self._x_min - x, x - self._x_max, 0.0)
+                dy = max(self._y_min - y, y - self._y_max, 0.0)
+                # min keeps its first argument when the distance is NaN
+                severity = min(1.0, math.hypot(dx, dy) * self._inv_scale)
 
         return MonitorOutput(
             monitor_id=self.monitor_id,
             triggered=triggered,
-            severity=1.0 if triggered else 0.0,
+            severity=severity,
             message=f"Position ({x}, {y}) out of bounds {self.bounds}" if triggered else "OK",
-            timestamp=time.time(),
+            timestamp=time.time() if timestamp is None else timestamp,
+        )
+
+    def _severities(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-point (outside, severity) for (N, 2) positions in one vectorized pass."""
+        # NaN positions fail both comparisons and count as outside
+        outside = np.asarray(~((positions >= self._lo) & (positions <= self._hi)).all(axis=1))
+        if self._inv_scale is None:
+            return outside, outside.astype(np.float64)
+        excess = np.maximum(np.maximum(self._lo - positions, positions - self._hi), 0.0)
+        distance = np.hypot(excess[:, 0], excess[:, 1])
+        # fmin maps NaN distances to full severity
+        severity = np.asarray(np.fmin(distance * self._inv_scale, 1.0))
+        severity[~outside] = 0.0
+        return outside, severity
+
+    def _check_points(self, x: Any, y: Any, timestamp: Optional[float]) -> MonitorOutput:
+        """Aggregate check over arrays of x and y coordinates."""
+        xs, ys = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        )
+        positions = np.stack([xs.ravel(), ys.ravel()], axis=1)
+        outside, severity = self._severities(positions)
+        n_outside = int(np.count_nonzero(outside))
+        return MonitorOutput(
+            monitor_id=self.monitor_id,
+            triggered=n_outside > 0,
+            severity=float(severity.max()) if severity.size else 0.0,
+            message=(
+                f"{n_outside} of {len(positions)} positions out of bounds {self.bounds}"
+                if n_outside
+                else "OK"
+            ),
+            timestamp=time.time() if timestamp is None else timestamp,
         )
 
+    def check_batch(
+        self,
+        positions: np.ndarray,
+        ids: List[str],
+        timestamp: Optional[float] = None,
+    ) -> List[MonitorOutput]:
+        """
+        Check many agents against the fence in one vectorized pass.
+
+        Callers should keep positions in a preallocated (N, 2) float array
+        (one row per agent, x then y) rather than building it per tick.
+
+        Args:
+            positions: (N, 2) agent positions.
+            ids: Agent identifiers aligned with the rows of ``positions``;
+                used as the ``monitor_id`` of the outputs.
+            timestamp: Time to stamp the outputs with; defaults to now.
+
+        Returns:
+            Outputs for the agents outside the bounds only; agents inside
+            (the common case) produce no output.
+        """
+        outside_mask, severity = self._severities(positions)
+        outside = np.flatnonzero(outside_mask)
+        if outside.size == 0:
+            return []
+
+        ts = time.time() if timestamp is None else timestamp
+        return [
+            MonitorOutput(
+                monitor_id=ids[i],
+                triggered=True,
+                severity=sev,
+                message=f"Position ({x}, {y}) out of bounds {self.bounds}",
+                timestamp=ts,
+            )
+            for i, sev, (x, y) in zip(
+                outside.tolist(), severity[outside].tolist(), positions[outside].tolist()
+            )
+        ]
+
+
+def _components(vec: Any) -> List[float]:
+    """Plain Python floats for a short vector (scalar math beats NumPy at D=2/3)."""
+    return vec.tolist() if isinstance(vec, np.ndarray) else [float(v) for v in vec]
+
 
 def constant_velocity_ttc(
     ego_pos: np.ndarray,
@@ -122,16 +342,26 @@ def constant_velocity_ttc(
     Returns:
         TTC in seconds (inf if not approaching)
     """
-    # Relative position (object relative to ego)
-    rel_pos = obj_pos - ego_pos
-    distance = np.linalg.norm(rel_pos)
-
-    if distance < 1e-6:
-        return 0.0  # Already at collision
-
-    # Relative velocity (positive means approaching)
-    rel_vel = ego_vel - obj_vel  # Ego approaching object
-    closing_velocity = np.dot(rel_vel, rel_pos) / distance
+    ego_p = _components(ego_pos)
+    ego_v = _components(ego_vel)
+    obj_p = _components(obj_pos)
+    obj_v = _components(obj_vel)
+
+    # Relative position (object relative to ego) and relative velocity
+    # (ego approaching object), projected onto the line of sight
+    if len(ego_p) == 2:
+        dx = obj_p[0] - ego_p[0]
+        dy = obj_p[1] - ego_p[1]
+        distance = math.hypot(dx, dy)
+        if distance < 1e-6:
+            return 0.0  # Already at collision
+        closing_velocity = ((ego_v[0] - obj_v[0]) * dx + (ego_v[1] - obj_v[1]) * dy) / distance
+    else:
+        rel_pos = [o - e for o, e in zip(obj_p, ego_p)]
+        distance = math.hypot(*rel_pos)
+        if distance < 1e-6:
+            return 0.0  # Already at collision
+        closing_velocity = sum((e - o) * r for e, o, r in zip(ego_v, obj_v, rel_pos)) / distance
 
     if closing_velocity < min_closing_velocity:
         return float("inf")  # Not approaching or moving away
@@ -140,6 +370,80 @@ def constant_velocity_ttc(
     return max(0.0, ttc)
 
 
+def constant_velocity_ttc_batch(
+    ego_pos: np.ndarray,
+    ego_vel: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    min_closing_velocity: float = 0.1,
+) -> np.ndarray:
+    """
+    Vectorized constant velocity TTC against many objects at once.
+
+    Args:
+        ego_pos: Ego vehicle position (D,)
+        ego_vel: Ego vehicle velocity (D,)
+        positions: Object positions (N, D)
+        velocities: Object velocities (N, D)
+        min_closing_velocity: Minimum closing speed threshold
+
+    Returns:
+        (N,) TTC in seconds (inf where not approaching, 0 where colliding)
+    """
+    rel_pos = positions - ego_pos
+    distance = np.sqrt(np.einsum("ij,ij->i", rel_pos, rel_pos))
+    rel_vel = ego_vel - velocities
+    with np.errstate(divide="ignore", invalid="ignore"):
+        closing_velocity = np.einsum("ij,ij->i", rel_vel, rel_pos) / distance
+        ttc: np.ndarray = distance / closing_velocity
+    ttc[~(closing_velocity >= min_closing_velocity)] = np.inf
+    ttc[distance < 1e-6] = 0.0
+    return ttc
+
+
+def _ttc_cv_batch(
+    ego_pos: np.ndarray,
+    ego_vel: np.ndarray,
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    min_closing_velocity: float,
+) -> Tuple[float, int]:
+    """
+    Minimum constant velocity TTC over all objects, as (min_ttc, index).
+
+    Scalar loops only (no temporaries) so numba can compile it; the index is
+    -1 when no object is approaching.
+    """
+    best = np.inf
+    best_idx = -1
+    n_objects, dim = positions.shape
+    for n in range(n_objects):
+        dist_sq = 0.0
+        closing = 0.0
+        for k in range(dim):
+            r = positions[n, k] - ego_pos[k]
+            dist_sq += r * r
+            closing += (ego_vel[k] - velocities[n, k]) * r
+        distance = np.sqrt(dist_sq)
+        if distance < 1e-6:
+            ttc = 0.0
+        else:
+            closing /= distance
+            if closing < min_closing_velocity:
+                continue
+            ttc = distance / closing
+        if ttc < best:
+            best = ttc
+            best_idx = n
+    return best, best_idx
+
+
+if HAS_NUMBA:
+    _ttc_cv_batch_numba = numba.njit(cache=True, fastmath=True)(_ttc_cv_batch)
+else:
+    _ttc_cv_batch_numba = None
+
+
 def constant_acceleration_ttc(
     ego_pos: np.ndarray,
     ego_vel: np.ndarray,
@@ -165,51 +469,49 @@ def constant_acceleration_ttc(
     Returns:
         TTC in seconds (inf if no collision predicted)
     """
-    rel_pos = obj_pos - ego_pos
-    distance = np.linalg.norm(rel_pos)
+    rel_pos = [o - e for o, e in zip(_components(obj_pos), _components(ego_pos))]
+    distance = math.hypot(*rel_pos)
 
     if distance < 1e-6:
         return 0.0
 
-    # Direction from ego to object
-    direction = rel_pos / distance
-
-    # Project velocities and accelerations onto collision axis
-    rel_vel = ego_vel - obj_vel
-    v_rel = np.dot(rel_vel, direction)  # Positive = approaching
+    # Project velocities and accelerations onto the collision axis
+    # (direction from ego to object = rel_pos / distance)
+    rel_vel = [e - o for e, o in zip(_components(ego_vel), _components(obj_vel))]
+    v_rel = sum(v * r for v, r in zip(rel_vel, rel_pos)) / distance  # Positive = approaching
 
     if ego_acc is not None and obj_acc is not None:
-        rel_acc = ego_acc - obj_acc
-        a_rel = np.dot(rel_acc, direction)
+        rel_acc = [e - o for e, o in zip(_components(ego_acc), _components(obj_acc))]
+        a_rel = sum(a * r for a, r in zip(rel_acc, rel_pos)) / distance
     else:
         a_rel = 0.0
 
     # Solve quadratic: 0.5 * a_rel * t^2 + v_rel * t - distance = 0
-    # Standard form: at^2 + bt + c = 0
-    a = 0.5 * a_rel
-    b = v_rel
-    c = -distance
-
-    if abs(a) < 1e-10:
+    if abs(a_rel) < 2e-10:
         # Linear case (constant velocity)
-        if b > 1e-6:
-            return distance / b
+        if v_rel > 1e-6:
+            return distance / v_rel
         return float("inf")
 
-    discriminant = b * b - 4 * a * c
+    # b^2 - 4ac with a = 0.5 * a_rel, b = v_rel, c = -distance
+    discriminant = v_rel * v_rel + 2.0 * a_rel * distance
 
     if discriminant < 0:
         return float("inf")
 
-    sqrt_disc = np.sqrt(discriminant)
-    t1 = (-b + sqrt_disc) / (2 * a)
-    t2 = (-b - sqrt_disc) / (2 * a)
+    # Roots (-b +/- sqrt(disc)) / (2a), with 1 / (2a) = 1 / a_rel
+    sqrt_disc = math.sqrt(discriminant)
+    inv_a_rel = 1.0 / a_rel
+    t1 = (-v_rel + sqrt_disc) * inv_a_rel
+    t2 = (-v_rel - sqrt_disc) * inv_a_rel
+    if t1 > t2:
+        t1, t2 = t2, t1
 
     # Return smallest positive time
-    times = [t for t in [t1, t2] if t > 0]
-    if times:
-        return min(times)
-
+    if t1 > 0:
+        return t1
+    if t2 > 0:
+        return t2
     return float("inf")
 
 
@@ -219,12 +521,18 @@ class TTCMonitor(BaseMonitor):
 
     Estimates TTC based on relative position, velocity, and optionally
     acceleration to predict collisions and trigger severity-scaled alerts.
+
+    Object state is held in ``dtype`` arrays. float32 halves the bytes read by
+    the batched kernel; severity is clipped to [0, 1] so the lost precision
+    does not matter, provided coordinates are ego-centred or of moderate
+    magnitude (float32 resolves ~1 mm at 10 km).
     """
 
     def __init__(
         self,
         monitor_id: str,
         config: Optional[TTCConfig] = None,
+        dtype: DTypeLike = np.float64,
     ):
         """
         Initialize TTC monitor.
@@ -232,38 +540,88 @@ class TTCMonitor(BaseMonitor):
         Args:
             monitor_id: Unique identifier for this monitor
             config: TTC configuration (uses defaults if not provided)
+            dtype: Floating point type of the object state buffers
         """
         super().__init__(monitor_id)
         self.config = config or TTCConfig()
-        self._trigger_history: List[bool] = []
+        self.dtype = np.dtype(dtype)
+        # Debounce window with a running count of triggered entries
+        self._trigger_history: Deque[bool] = deque(maxlen=max(self.config.debounce_steps, 1))
+        self._trigger_count = 0
         self._last_triggered_object: Optional[str] = None
+        self._buffers: Optional[_BatchBuffers] = None
+
+        # Severity is linear in TTC for a fixed warning_ttc, so tabulate it:
+        # entry i covers TTC in [i, i + 1) / scale and rounds severity up, i.e.
+        # at most 1 / (size - 1) above the exact value, never below it. The
+        # scale is (re)computed by check() for the current config.warning_ttc;
+        # NaN never compares equal, so the first lookup sets it.
+        self._sev_warning_ttc = math.nan
+        self._sev_scale = 0.0
+        self._sev_lut: List[float] = np.linspace(1.0, 0.0, _SEVERITY_LUT_SIZE).tolist()
+
+        # The motion model is fixed for the monitor's lifetime, so dispatch on
+        # it once here rather than per object per tick
+        if self.config.model == "constant_velocity":
+            self._min_ttc = self._min_ttc_constant_velocity
+        else:
+            self._min_ttc = self._min_ttc_constant_acceleration
 
-    def _compute_ttc(
+    def _min_ttc_constant_velocity(
         self,
         ego_pos: np.ndarray,
         ego_vel: np.ndarray,
-        obj: TrackedObject,
-    ) -> float:
-        """Compute TTC for a single tracked object."""
-        if self.config.model == "constant_velocity":
-            return constant_velocity_ttc(
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        accelerations: Optional[np.ndarray],
+        has_acc: Optional[np.ndarray],
+    ) -> Tuple[float, int]:
+        """Smallest constant-velocity TTC over all objects and its row (-1 if none)."""
+        # All objects in one pass: compiled scalar loop, or vectorized NumPy
+        if _ttc_cv_batch_numba is not None:
+            best, idx = _ttc_cv_batch_numba(
                 ego_pos,
                 ego_vel,
-                obj.position,
-                obj.velocity,
+                positions,
+                velocities,
                 self.config.min_closing_velocity,
             )
-        else:  # constant_acceleration
-            return constant_acceleration_ttc(
+            return float(best), int(idx)
+        ttcs = constant_velocity_ttc_batch(
+            ego_pos, ego_vel, positions, velocities, self.config.min_closing_velocity
+        )
+        idx = int(np.argmin(ttcs))
+        best = float(ttcs[idx])
+        return best, (idx if best < math.inf else -1)
+
+    def _min_ttc_constant_acceleration(
+        self,
+        ego_pos: np.ndarray,
+        ego_vel: np.ndarray,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        accelerations: Optional[np.ndarray],
+        has_acc: Optional[np.ndarray],
+    ) -> Tuple[float, int]:
+        """Smallest constant-acceleration TTC over all objects and its row (-1 if none)."""
+        best, best_idx = math.inf, -1
+        for i in range(len(positions)):
+            acc = None
+            if accelerations is not None and (has_acc is None or has_acc[i]):
+                acc = accelerations[i]
+            ttc = constant_acceleration_ttc(
                 ego_pos,
                 ego_vel,
-                obj.position,
-                obj.velocity,
-                obj.acceleration,
-                obj.acceleration,  # Assume symmetric
+                positions[i],
+                velocities[i],
+                acc,
+                acc,  # Assume symmetric
             )
+            if ttc < best:
+                best, best_idx = ttc, i
+        return best, best_idx
 
-    def check(self, state: Dict[str, Any]) -> MonitorOutput:
+    def check(self, state: Dict[str, Any], timestamp: Optional[float] = None) -> MonitorOutput:
         """
         Check TTC against all tracked objects.
 
@@ -272,72 +630,96 @@ class TTCMonitor(BaseMonitor):
             - ego_velocity: np.ndarray (2,) or (3,)
             - objects: List[Dict] with keys: object_id, position, velocity, [acceleration]
 
+        Callers that already hold object state as arrays (simulators, replay
+        buffers) can pass it structure-of-arrays instead of ``objects``; the
+        arrays are used as-is when they already have the monitor's dtype:
+            - positions: np.ndarray (N, D)
+            - velocities: np.ndarray (N, D)
+            - accelerations: np.ndarray (N, D), optional
+            - object_ids: Sequence[str] aligned with the rows, optional
+
+        Args:
+            state: Current state (see expected keys above)
+            timestamp: Output timestamp; defaults to now
+
         Returns:
             MonitorOutput with severity based on minimum TTC.
         """
-        ego_pos = np.asarray(state.get("ego_position", [0.0, 0.0]))
-        ego_vel = np.asarray(state.get("ego_velocity", [0.0, 0.0]))
-        objects_data = state.get("objects", [])
-
-        if not objects_data:
+        if timestamp is None:
+            timestamp = time.time()
+        dtype = self.dtype
+        ego_pos = np.asarray(state.get("ego_position", [0.0, 0.0]), dtype=dtype)
+        ego_vel = np.asarray(state.get("ego_velocity", [0.0, 0.0]), dtype=dtype)
+        has_acc: Optional[np.ndarray] = None
+        if "positions" in state and "velocities" in state:
+            positions = np.asarray(state["positions"], dtype=dtype)
+            velocities = np.asarray(state["velocities"], dtype=dtype)
+            accelerations = state.get("accelerations")
+            if accelerations is not None:
+                accelerations = np.asarray(accelerations, dtype=dtype)
+            ids = state.get("object_ids", ())
+            n_objects = len(positions)
+        else:
+            objects_data = state.get("objects", [])
+            n_objects = len(objects_data)
+            if n_objects:
+                buffers = self._buffers
+                if buffers is None or buffers.pos.shape != (n_objects, ego_pos.shape[-1]):
+                    buffers = self._buffers = _BatchBuffers(n_objects, ego_pos.shape[-1], dtype)
+                buffers.fill(objects_data)
+                positions, velocities = buffers.pos, buffers.vel
+                accelerations, has_acc = buffers.acc, buffers.has_acc
+                ids = buffers.ids
+
+        if not n_objects:
             return MonitorOutput(
                 monitor_id=self.monitor_id,
                 triggered=False,
                 severity=0.0,
                 message="No objects to track",
-                timestamp=time.time(),
+                timestamp=timestamp,
             )
 
-        # Convert to TrackedObject instances
-        objects: List[TrackedObject] = []
-        for obj_dict in objects_data:
-            obj = TrackedObject(
-                object_id=obj_dict.get("object_id", "unknown"),
-                position=np.asarray(obj_dict["position"]),
-                velocity=np.asarray(obj_dict["velocity"]),
-                acceleration=np.asarray(obj_dict["acceleration"])
-                if "acceleration" in obj_dict
-                else None,
-            )
-            objects.append(obj)
-
-        # Compute TTC for all objects
-        min_ttc = float("inf")
+        min_ttc, idx = self._min_ttc(
+            ego_pos, ego_vel, positions, velocities, accelerations, has_acc
+        )
         min_ttc_object: Optional[str] = None
-
-        for obj in objects:
-            ttc = self._compute_ttc(ego_pos, ego_vel, obj)
-            if ttc < min_ttc:
-                min_ttc = ttc
-                min_ttc_object = obj.object_id
-
-        # Compute severity: 1.0 - (min_ttc / warning_ttc), clipped to [0, 1]
-        if min_ttc >= self.config.warning_ttc:
+        if idx >= 0:
+            min_ttc_object = ids[idx] if idx < len(ids) else "unknown"
+
+        # Compute severity: 1.0 - (min_ttc / warning_ttc), clipped to [0, 1].
+        # The table only covers 0 <= min_ttc < warning_ttc with a positive
+        # warning_ttc; anything else (incl. NaN) takes the exact formula.
+        warning_ttc = self.config.warning_ttc
+        if min_ttc >= warning_ttc:
             severity = 0.0
-        elif min_ttc <= 0:
-            severity = 1.0
+        elif self.config.exact_severity or not (warning_ttc > 0.0 and min_ttc >= 0.0):
+            severity = _exact_ttc_severity(min_ttc, warning_ttc)
         else:
-            severity = 1.0 - (min_ttc / self.config.warning_ttc)
-            severity = min(max(severity, 0.0), 1.0)
+            if warning_ttc != self._sev_warning_ttc:
+                self._sev_warning_ttc = warning_ttc
+                self._sev_scale = (_SEVERITY_LUT_SIZE - 1) / warning_ttc
+            severity = self._sev_lut[int(min_ttc * self._sev_scale)]
 
         # Check if triggered (TTC below critical threshold)
         triggered = min_ttc < self.config.critical_ttc
 
         # Apply hysteresis (debounce)
-        self._trigger_history.append(triggered)
-        if len(self._trigger_history) > self.config.debounce_steps:
-            self._trigger_history.pop(0)
+        history = self._trigger_history
+        if len(history) == history.maxlen:
+            self._trigger_count -= history[0]
+        history.append(triggered)
+        self._trigger_count += triggered
 
         # Only trigger if majority of recent checks triggered
         if self.config.debounce_steps > 1:
-            trigger_count = sum(self._trigger_history)
-            final_triggered = trigger_count > len(self._trigger_history) // 2
+            final_triggered = self._trigger_count > len(history) // 2
         else:
             final_triggered = triggered
 
         self._last_triggered_object = min_ttc_object if final_triggered else None
 
-        # Construct message
+        # Construct message; only formatted when something needs reporting
         if min_ttc == float("inf"):
             message = "No collision predicted"
         elif final_triggered:
@@ -345,14 +727,14 @@ class TTCMonitor(BaseMonitor):
         elif severity > 0:
             message = f"WARNING: TTC={min_ttc:.2f}s to {min_ttc_object}"
         else:
-            message = f"TTC={min_ttc:.2f}s (safe)"
+            message = "OK"
 
         return MonitorOutput(
             monitor_id=self.monitor_id,
             triggered=final_triggered,
             severity=severity,
             message=message,
-            timestamp=time.time(),
+            timestamp=timestamp,
         )
 
     def get_last_triggered_object(self) -> Optional[str]:
@@ -4,14 +4,18 @@ FastAPI Server for OpenTLU Backend
 Provides REST API endpoints for the frontend application.
 """
 
+import bisect
 import random
+import time
 import uuid
 import os
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Hashable, List, Tuple
 
-from fastapi import FastAPI
+import numpy as np
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import to_json
 
 from opentlu.schemas import (
     AcquisitionConfig,
@@ -48,46 +52,101 @@ app.add_middleware(
 )
 
 
+# Mitigation states with the cumulative weights of the mock distribution
+# (0.6, 0.2, 0.1, 0.05, 0.05), so a draw is one random() and a bisect.
+_MIT_STATES = ("nominal", "cautious", "fallback", "safe_stop", "human_escalation")
+_MIT_CUM = (0.6, 0.8, 0.9, 0.95, 1.0)
+_TIMELINE_STATES = _MIT_STATES[:3]
+
+_rng = np.random.default_rng()
+
+# ============================================================================
+# Response cache
+# ============================================================================
+
+# Mock payloads only need to look live to a polling dashboard, so bursts of
+# requests share one generated, pre-serialized body for a short window.
+_TTL_SECONDS = 0.5
+_TTL_MAXSIZE = 64
+_ttl_cache: Dict[Hashable, Tuple[float, bytes]] = {}
+
+
+def _json_response(payload: Any) -> Response:
+    """Serialize trusted payloads directly, bypassing response_model validation."""
+    return Response(content=to_json(payload), media_type="application/json")
+
+
+def _ttl_memoize(key: Hashable, producer: Callable[[], Any]) -> Response:
+    """Return the cached JSON body for ``key``, regenerating it once stale.
+
+    Args:
+        key: Cache key; include every query parameter that shapes the payload.
+        producer: Zero-argument callable building the (unserialized) payload.
+
+    Returns:
+        A JSON response carrying the pre-serialized bytes.
+    """
+    now = time.monotonic()
+    entry = _ttl_cache.get(key)
+    if entry is None or entry[0] <= now:
+        _ttl_cache.pop(key, None)
+        if len(_ttl_cache) >= _TTL_MAXSIZE:
+            # Fixed TTL, so insertion order is expiry order.
+            del _ttl_cache[next(iter(_ttl_cache))]
+        entry = (now + _TTL_SECONDS, to_json(producer()))
+        _ttl_cache[key] = entry
+    return Response(content=entry[1], media_type="application/json")
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
 
-@app.get("/api/uncertainty/estimate")
-async def get_uncertainty_estimate(model_id: str = "default") -> UncertaintyEstimate:
-    return generate_uncertainty_estimate(model_id)
+# The hot polling endpoints return a Response directly: FastAPI skips
+# response_model validation for it, while the decorator keeps the schema in
+# the OpenAPI docs.
 
 
-@app.get("/api/monitors")
-async def get_monitors() -> List[MonitorOutput]:
+@app.get("/api/uncertainty/estimate", response_model=UncertaintyEstimate)
+async def get_uncertainty_estimate(model_id: str = "default") -> Response:
+    return _json_response(generate_uncertainty_estimate(model_id))
+
+
+@app.get("/api/monitors", response_model=List[MonitorOutput])
+async def get_monitors() -> Response:
     monitor_ids = ["safety_envelope", "ood_detector", "drift_monitor", "constraint_checker"]
-    return [generate_monitor(mid) for mid in monitor_ids]
+    return _ttl_memoize("monitors", lambda: [generate_monitor(mid) for mid in monitor_ids])
 
 
-@app.get("/api/monitors/{monitor_id}")
-async def get_monitor(monitor_id: str) -> MonitorOutput:
-    return generate_monitor(monitor_id)
+@app.get("/api/monitors/{monitor_id}", response_model=MonitorOutput)
+async def get_monitor(monitor_id: str) -> Response:
+    return _json_response(generate_monitor(monitor_id))
 
 
-@app.get("/api/mitigation/state")
-async def get_mitigation_state() -> MitigationStateResponse:
-    states = ["nominal", "cautious", "fallback", "safe_stop", "human_escalation"]
-    weights = [0.6, 0.2, 0.1, 0.05, 0.05]
-    state = random.choices(states, weights=weights)[0]
-    return MitigationStateResponse(state=state)
+@app.get("/api/mitigation/state", response_model=MitigationStateResponse)
+async def get_mitigation_state() -> Response:
+    idx = bisect.bisect(_MIT_CUM, random.random())
+    return _json_response(MitigationStateResponse.model_construct(state=_MIT_STATES[idx]))
 
 
-@app.get("/api/scenarios")
-async def list_scenarios(page: int = 1, page_size: int = 10) -> PaginatedResponse:
+@app.get("/api/scenarios", response_model=PaginatedResponse)
+async def list_scenarios(page: int = 1, page_size: int = 10) -> Response:
     total = 25
-    scenarios = [generate_scenario(str(uuid.uuid4())) for _ in range(min(page_size, total))]
-    return PaginatedResponse(
-        items=[s.model_dump() for s in scenarios],
-        total=total,
-        page=page,
-        page_size=page_size,
-        has_more=page * page_size < total,
-    )
+
+    def produce() -> PaginatedResponse:
+        scenarios = [generate_scenario(str(uuid.uuid4())) for _ in range(min(page_size, total))]
+        # Trusted internal data: skip validation and let the serializer walk the
+        # models once instead of dumping them to dicts first.
+        return PaginatedResponse.model_construct(
+            items=scenarios,
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_more=page * page_size < total,
+        )
+
+    return _ttl_memoize(("scenarios", page, page_size), produce)
 
 
 @app.get("/api/scenarios/{scenario_id}")
@@ -136,22 +195,26 @@ async def aggregate_evaluation(request: Dict[str, Any] | None = None) -> Aggrega
     )
 
 
-@app.get("/api/samples")
+@app.get("/api/samples", response_model=PaginatedResponse)
 async def get_samples(
     page: int = 1,
     page_size: int = 20,
     sort_by: str = "uncertainty",
     sort_order: str = "desc",
-) -> PaginatedResponse:
+) -> Response:
     total = 100
-    samples = [generate_sample(str(uuid.uuid4())) for _ in range(min(page_size, total))]
-    return PaginatedResponse(
-        items=[s.model_dump() for s in samples],
-        total=total,
-        page=page,
-        page_size=page_size,
-        has_more=page * page_size < total,
-    )
+
+    def produce() -> PaginatedResponse:
+        samples = [generate_sample(str(uuid.uuid4())) for _ in range(min(page_size, total))]
+        return PaginatedResponse.model_construct(
+            items=samples,
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_more=page * page_size < total,
+        )
+
+    return _ttl_memoize(("samples", page, page_size, sort_by, sort_order), produce)
 
 
 @app.post("/api/acquisition/select")
@@ -178,21 +241,28 @@ async def update_acquisition_config(config: Dict[str, Any]) -> AcquisitionConfig
     return AcquisitionConfig(**config)
 
 
-@app.get("/api/safety/timeline")
-async def get_safety_timeline(limit: int = 100) -> List[SafetyTimelineEntry]:
-    states = ["nominal", "cautious", "fallback"]
-    entries = []
-    base_time = datetime.now().timestamp()
-    for i in range(min(limit, 50)):
-        entries.append(
-            SafetyTimelineEntry(
-                timestamp=base_time - i * 60,
-                mitigation_state=random.choice(states),
-                severity=random.uniform(0, 0.5),
-                ood_score=random.uniform(0, 0.3),
+@app.get("/api/safety/timeline", response_model=List[SafetyTimelineEntry])
+async def get_safety_timeline(limit: int = 100) -> Response:
+    n = max(0, min(limit, 50))
+
+    def produce() -> List[SafetyTimelineEntry]:
+        base_time = datetime.now().timestamp()
+        # One draw per field; tolist() hands back Python scalars for the models.
+        timestamps = (base_time - np.arange(n) * 60.0).tolist()
+        state_idx = _rng.integers(0, len(_TIMELINE_STATES), n).tolist()
+        severities = _rng.uniform(0.0, 0.5, n).tolist()
+        ood_scores = _rng.uniform(0.0, 0.3, n).tolist()
+        return [
+            SafetyTimelineEntry.model_construct(
+                timestamp=ts,
+                mitigation_state=_TIMELINE_STATES[k],
+                severity=sev,
+                ood_score=ood,
             )
-        )
-    return entries
+            for ts, k, sev, ood in zip(timestamps, state_idx, severities, ood_scores)
+        ]
+
+    return _ttl_memoize(("timeline", n), produce)
 
 
 @app.post("/api/conformal/configure")
@@ -242,17 +312,15 @@ if __name__ == "__main__":
     import socket
     import uvicorn
 
-    def find_free_port(start_port: int = 8000, max_tries: int = 200) -> int:
-        """Find a free TCP port starting at start_port."""
-        for port in range(start_port, start_port + max_tries):
+    def find_free_port(preferred_port: int = 8000) -> int:
+        """Return preferred_port if it is free, else a kernel-assigned free port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                    s.bind(("0.0.0.0", port))
-                return port
+                s.bind(("0.0.0.0", preferred_port))
             except OSError:
-                continue
-        raise RuntimeError(f"Failed to find free port in range {start_port}-{start_port + max_tries - 1}")
+                s.bind(("0.0.0.0", 0))
+            return int(s.getsockname()[1])
 
     port_env = os.environ.get("PORT")
     port = int(port_env) if port_env else find_free_port(8000)
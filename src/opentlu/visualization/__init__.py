@@ -6,15 +6,21 @@ safety margins, and OOD score distributions.
 """
 
 from opentlu.visualization.dashboard import (
+    UncertaintyBatch,
+    SafetyBatch,
     UncertaintyVisualizer,
     SafetyVisualizer,
     OODVisualizer,
+    CachedVisualizer,
     Dashboard,
 )
 
 __all__ = [
+    "UncertaintyBatch",
+    "SafetyBatch",
     "UncertaintyVisualizer",
     "SafetyVisualizer",
     "OODVisualizer",
+    "CachedVisualizer",
     "Dashboard",
 ]
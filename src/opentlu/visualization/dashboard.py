@@ -6,13 +6,38 @@ safety margin timelines, and OOD score distributions.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+import base64
+import hashlib
 import io
+import os
 
 import numpy as np
 
+try:
+    from fast_histogram import histogram1d
+
+    HAS_FAST_HISTOGRAM = True
+except ImportError:
+    histogram1d = None
+    HAS_FAST_HISTOGRAM = False
+
 
 # Colorblind-safe palette (Wong palette)
 COLORBLIND_PALETTE = {
@@ -26,6 +51,10 @@ COLORBLIND_PALETTE = {
     "black": "#000000",
 }
 
+# Series colours in palette order, for cycling by index
+_PALETTE_CYCLE: Tuple[str, ...] = tuple(COLORBLIND_PALETTE.values())
+_PALETTE_LEN = len(_PALETTE_CYCLE)
+
 
 class Figure(Protocol):
     """Protocol for figure objects (backend-agnostic)."""
@@ -63,6 +92,202 @@ class SafetyMarginData:
     severity: float
 
 
+@dataclass
+class UncertaintyBatch:
+    """Column-wise (structure-of-arrays) store of many UncertaintyData records."""
+
+    total: np.ndarray
+    aleatoric: np.ndarray
+    epistemic: np.ndarray
+    confidence: np.ndarray
+    labels: Optional[List[Optional[str]]] = None
+
+    @classmethod
+    def from_list(cls, estimates: List[UncertaintyData]) -> "UncertaintyBatch":
+        """Build the columns from records, one preallocated array per field."""
+        n = len(estimates)
+        labels = [e.label for e in estimates]
+        return cls(
+            total=np.fromiter((e.total for e in estimates), dtype=np.float64, count=n),
+            aleatoric=np.fromiter((e.aleatoric for e in estimates), dtype=np.float64, count=n),
+            epistemic=np.fromiter((e.epistemic for e in estimates), dtype=np.float64, count=n),
+            confidence=np.fromiter((e.confidence for e in estimates), dtype=np.float64, count=n),
+            labels=labels if any(label is not None for label in labels) else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+    def display_labels(self) -> List[str]:
+        """Sample labels, defaulting to "Sample i" where none was given."""
+        if self.labels is None:
+            return [f"Sample {i}" for i in range(len(self))]
+        return [label or f"Sample {i}" for i, label in enumerate(self.labels)]
+
+
+# Mitigation states in escalation order, as plotted on the state timeline
+_STATE_MAP: Dict[str, int] = {
+    "nominal": 0,
+    "cautious": 1,
+    "fallback": 2,
+    "safe_stop": 3,
+    "human_escalation": 4,
+}
+_STATE_KEYS = tuple(_STATE_MAP.keys())
+_STATE_VALUES = tuple(_STATE_MAP.values())
+
+
+def _margin_columns(
+    data: List[SafetyMarginData], sorted_constraints: bool = True
+) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """
+    Columnar view of safety margin records.
+
+    Args:
+        data: Safety margin records
+        sorted_constraints: Order constraints alphabetically; otherwise in
+            order of first appearance. Either way the order is deterministic.
+
+    Returns:
+        (timestamps (N,), constraint names (K,), margins (N, K)); margins a
+        record does not report are 0. Margins are Fortran-ordered so each
+        constraint's column is contiguous.
+    """
+    n = len(data)
+    timestamps = np.fromiter((d.timestamp for d in data), dtype=np.float64, count=n)
+
+    # Get all constraint names; a dict is an insertion-ordered set
+    first_seen: Dict[str, None] = {}
+    for d in data:
+        for name in d.constraint_margins:
+            first_seen.setdefault(name, None)
+    constraint_names = sorted(first_seen) if sorted_constraints else list(first_seen)
+    name_to_col = {name: j for j, name in enumerate(constraint_names)}
+
+    # One pass over the records into a flat column-major list, converted once;
+    # element-wise ndarray stores would cost far more than list stores
+    k = len(constraint_names)
+    col_start = {name: j * n for name, j in name_to_col.items()}
+    flat = [0.0] * (n * k)
+    for i, d in enumerate(data):
+        for name, value in d.constraint_margins.items():
+            flat[col_start[name] + i] = value
+    margins = np.array(flat, dtype=np.float64).reshape(k, n).T
+
+    return timestamps, constraint_names, margins
+
+
+@dataclass
+class SafetyBatch:
+    """Column-wise (structure-of-arrays) store of many SafetyMarginData records."""
+
+    timestamps: np.ndarray
+    mitigation_states: List[str]
+    constraint_names: List[str]
+    margins: np.ndarray  # (N, K), column j holds constraint_names[j]
+    ood_score: np.ndarray
+    severity: np.ndarray
+
+    @classmethod
+    def from_list(
+        cls, data: List[SafetyMarginData], sorted_constraints: bool = True
+    ) -> "SafetyBatch":
+        """
+        Build the columns from records.
+
+        Args:
+            data: Safety margin records
+            sorted_constraints: Order margin columns alphabetically rather than
+                by first appearance
+        """
+        n = len(data)
+        timestamps, constraint_names, margins = _margin_columns(data, sorted_constraints)
+        return cls(
+            timestamps=timestamps,
+            mitigation_states=[d.mitigation_state for d in data],
+            constraint_names=constraint_names,
+            margins=margins,
+            ood_score=np.fromiter((d.ood_score for d in data), dtype=np.float64, count=n),
+            severity=np.fromiter((d.severity for d in data), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+def _as_uncertainty_batch(
+    estimates: Union[List[UncertaintyData], UncertaintyBatch],
+) -> UncertaintyBatch:
+    if isinstance(estimates, UncertaintyBatch):
+        return estimates
+    return UncertaintyBatch.from_list(estimates)
+
+
+def _as_safety_batch(
+    data: Union[List[SafetyMarginData], SafetyBatch], sorted_constraints: bool = True
+) -> SafetyBatch:
+    if isinstance(data, SafetyBatch):
+        return data
+    return SafetyBatch.from_list(data, sorted_constraints)
+
+
+def _histogram(
+    values: np.ndarray, bins: int, edges: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Uniform-bin histogram over the data range, as (counts, edges).
+
+    Uses the same range rule as np.histogram (widened by 0.5 for constant
+    data) so results match whichever implementation is available. Explicit
+    `edges` (e.g. shared across sibling plots) skip the range selection.
+    """
+    if edges is not None:
+        counts, _ = np.histogram(values, bins=edges)
+        return counts, edges
+    if values.size:
+        lo, hi = float(values.min()), float(values.max())
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+    else:
+        lo, hi = 0.0, 1.0
+    edges = np.linspace(lo, hi, bins + 1)
+    if histogram1d is not None:
+        # fast_histogram excludes the upper edge; fold the maxima into the last bin
+        counts = histogram1d(values, bins=bins, range=(lo, hi))
+        counts[-1] += np.count_nonzero(values == hi)
+    else:
+        counts, _ = np.histogram(values, bins=edges)
+    return counts, edges
+
+
+# Above these sizes Plotly draws line traces with WebGL instead of one SVG node
+# per point, and histograms are binned here rather than in the browser
+_WEBGL_MIN_POINTS = 2000
+_SERVER_BIN_MIN_VALUES = 50_000
+# Plotly's hover search over all points stalls the page beyond this size
+_HOVER_MAX_POINTS = 20_000
+
+
+def _axes(fig: Any) -> Any:
+    """The figure's single axes, created if the figure has none yet."""
+    return fig.axes[0] if fig.axes else fig.subplots()
+
+
+class _ByteSink(io.RawIOBase):
+    """Write-only file object appending into a bytearray (no BytesIO read-back copy)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.buf = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self.buf += b
+        return len(b)
+
+
 class PlottingBackend(ABC):
     """Abstract plotting backend."""
 
@@ -87,8 +312,8 @@ class PlottingBackend(ABC):
     def line_chart(
         self,
         fig: Any,
-        x: List[float],
-        y_series: Dict[str, List[float]],
+        x: Union[List[float], np.ndarray],
+        y_series: Mapping[str, Union[Sequence[float], np.ndarray]],
         title: str,
         xlabel: str,
         ylabel: str,
@@ -113,25 +338,73 @@ class PlottingBackend(ABC):
         """Convert figure to HTML."""
         pass
 
+    def html_head(self) -> str:
+        """Markup a page must include once in <head> for to_html_fragment output."""
+        return ""
+
+    def to_html_fragment(self, fig: Any) -> str:
+        """Convert figure to HTML for a page that includes html_head()."""
+        return self.to_html(fig)
+
 
 class MatplotlibBackend(PlottingBackend):
-    """Matplotlib-based plotting backend."""
+    """
+    Matplotlib-based plotting backend.
 
-    def __init__(self) -> None:
-        try:
-            import matplotlib
+    Figures are created through the object-oriented API with an Agg canvas
+    rather than through pyplot, so they are not registered in pyplot's global
+    figure manager and can be rendered from several threads at once.
 
-            matplotlib.use("Agg")  # Non-interactive backend
-            import matplotlib.pyplot as plt
+    matplotlib is imported on first use, so constructing a backend (or a
+    Dashboard) that never plots costs nothing.
+    """
 
-            self.plt = plt
+    def __init__(self, png_compress_level: int = 3) -> None:
+        """
+        Args:
+            png_compress_level: zlib level (0-9) for embedded PNGs. Plot images
+                are mostly flat colour, so low levels cost little size and
+                encode faster than the default of 6.
+        """
+        self.png_compress_level = png_compress_level
+        self._plt: Any = None
+        self._figure_cls: Any = None
+        self._canvas_cls: Any = None
+
+    @property
+    def plt(self) -> Any:
+        """matplotlib.pyplot, switched to the non-interactive Agg backend."""
+        if self._plt is None:
+            try:
+                import matplotlib
+
+                matplotlib.use("Agg")  # Non-interactive backend
+                import matplotlib.pyplot as plt
+            except ImportError:
+                raise ImportError(
+                    "matplotlib is required for visualization. Install with: pip install matplotlib"
+                )
+            self._plt = plt
+        return self._plt
+
+    def _load_figure_classes(self) -> None:
+        try:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
         except ImportError:
             raise ImportError(
                 "matplotlib is required for visualization. Install with: pip install matplotlib"
             )
+        self._figure_cls = Figure
+        self._canvas_cls = FigureCanvasAgg
 
     def create_figure(self, figsize: Tuple[int, int] = (10, 6)) -> Any:
-        return self.plt.figure(figsize=figsize)
+        if self._figure_cls is None:
+            self._load_figure_classes()
+        fig = self._figure_cls(figsize=figsize)
+        self._canvas_cls(fig)
+        fig.subplots()  # every chart draws on one axes, created once here
+        return fig
 
     def bar_chart(
         self,
@@ -141,7 +414,7 @@ class MatplotlibBackend(PlottingBackend):
         title: str,
         colors: Optional[List[str]] = None,
     ) -> Any:
-        ax = fig.add_subplot(111)
+        ax = _axes(fig)
         if colors is None:
             colors = [COLORBLIND_PALETTE["blue"]] * len(labels)
         ax.bar(labels, values, color=colors)
@@ -152,20 +425,22 @@ class MatplotlibBackend(PlottingBackend):
     def line_chart(
         self,
         fig: Any,
-        x: List[float],
-        y_series: Dict[str, List[float]],
+        x: Union[List[float], np.ndarray],
+        y_series: Mapping[str, Union[Sequence[float], np.ndarray]],
         title: str,
         xlabel: str,
         ylabel: str,
     ) -> Any:
-        ax = fig.add_subplot(111)
-        colors = list(COLORBLIND_PALETTE.values())
+        ax = _axes(fig)
+        # Pass handles to legend() so it does not rescan every artist on the axes
+        handles = []
         for i, (name, values) in enumerate(y_series.items()):
-            ax.plot(x, values, label=name, color=colors[i % len(colors)])
+            (line,) = ax.plot(x, values, label=name, color=_PALETTE_CYCLE[i % _PALETTE_LEN])
+            handles.append(line)
         ax.set_title(title)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
-        ax.legend()
+        ax.legend(handles=handles, loc="best")
         return fig
 
     def histogram(
@@ -176,51 +451,118 @@ class MatplotlibBackend(PlottingBackend):
         bins: int = 50,
         threshold: Optional[float] = None,
     ) -> Any:
-        ax = fig.add_subplot(111)
+        ax = _axes(fig)
         ax.hist(values, bins=bins, color=COLORBLIND_PALETTE["blue"], alpha=0.7)
         if threshold is not None:
-            ax.axvline(
+            line = ax.axvline(
                 x=threshold,
                 color=COLORBLIND_PALETTE["red"],
                 linestyle="--",
                 label=f"Threshold: {threshold:.2f}",
             )
-            ax.legend()
+            ax.legend(handles=[line])
         ax.set_title(title)
         ax.set_xlabel("Score")
         ax.set_ylabel("Frequency")
         return fig
 
-    def to_html(self, fig: Any) -> str:
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
-        buf.seek(0)
-        import base64
+    def bar_histogram(
+        self,
+        fig: Any,
+        edges: np.ndarray,
+        counts: np.ndarray,
+        title: str,
+        threshold: Optional[float] = None,
+    ) -> Any:
+        """Draw an already-binned histogram (counts per [edges[i], edges[i + 1]))."""
+        ax = _axes(fig)
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
+            color=COLORBLIND_PALETTE["blue"],
+            alpha=0.7,
+        )
+        if threshold is not None:
+            line = ax.axvline(
+                x=threshold,
+                color=COLORBLIND_PALETTE["red"],
+                linestyle="--",
+                label=f"Threshold: {threshold:.2f}",
+            )
+            ax.legend(handles=[line])
+        ax.set_title(title)
+        ax.set_xlabel("Score")
+        ax.set_ylabel("Frequency")
+        return fig
 
-        data = base64.b64encode(buf.read()).decode("utf-8")
-        self.plt.close(fig)
+    def to_html(self, fig: Any) -> str:
+        sink = _ByteSink()
+        fig.savefig(
+            sink,
+            format="png",
+            bbox_inches="tight",
+            pil_kwargs={"compress_level": self.png_compress_level},
+        )
+        # b64encode reads the buffer in place
+        data = base64.b64encode(memoryview(sink.buf)).decode("ascii")
         return f'<img src="data:image/png;base64,{data}" />'
 
 
 class PlotlyBackend(PlottingBackend):
-    """Plotly-based plotting backend for interactive visualizations."""
+    """
+    Plotly-based plotting backend for interactive visualizations.
 
-    def __init__(self) -> None:
+    plotly is imported on first use.
+    """
+
+    def __init__(self, interactive_hover: bool = True, template: Optional[str] = None) -> None:
+        """
+        Args:
+            interactive_hover: Enable hover tooltips. Headless exports never
+                use them and can turn them off entirely.
+            template: Plotly layout template for new figures. None uses
+                plotly.io.templates.default; the bare "none" template skips
+                merging (and serializing) plotly's default styling, which
+                makes figures smaller and faster to export.
+        """
+        self.interactive_hover = interactive_hover
+        self.template = template
+        self._go: Any = None
+        self._pio: Any = None
+
+    def _load(self) -> None:
         try:
             import plotly.graph_objects as go
             import plotly.io as pio
-
-            self.go = go
-            self.pio = pio
         except ImportError:
             raise ImportError(
                 "plotly is required for interactive visualization. Install with: pip install plotly"
             )
+        self._go = go
+        self._pio = pio
+
+    @property
+    def go(self) -> Any:
+        """plotly.graph_objects."""
+        if self._go is None:
+            self._load()
+        return self._go
+
+    @property
+    def pio(self) -> Any:
+        """plotly.io."""
+        if self._pio is None:
+            self._load()
+        return self._pio
 
     def create_figure(self, figsize: Tuple[int, int] = (10, 6)) -> Any:
         # Plotly handles sizing differently, usually continuously responsive or set in layout
         # We initialized a blank figure
-        return self.go.Figure()
+        if self.template is None:
+            return self.go.Figure()
+        return self.go.Figure(layout={"template": self.template})
 
     def bar_chart(
         self,
@@ -242,20 +584,24 @@ class PlotlyBackend(PlottingBackend):
     def line_chart(
         self,
         fig: Any,
-        x: List[float],
-        y_series: Dict[str, List[float]],
+        x: Union[List[float], np.ndarray],
+        y_series: Mapping[str, Union[Sequence[float], np.ndarray]],
         title: str,
         xlabel: str,
         ylabel: str,
     ) -> Any:
-        colors = list(COLORBLIND_PALETTE.values())
+        # SVG is faster for small traces, WebGL for long ones
+        scatter = self.go.Scattergl if len(x) >= _WEBGL_MIN_POINTS else self.go.Scatter
         for i, (name, values) in enumerate(y_series.items()):
-            color = colors[i % len(colors)]
-            fig.add_trace(
-                self.go.Scatter(x=x, y=values, mode="lines", name=name, line=dict(color=color))
-            )
+            color = _PALETTE_CYCLE[i % _PALETTE_LEN]
+            fig.add_trace(scatter(x=x, y=values, mode="lines", name=name, line=dict(color=color)))
 
         fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title=ylabel)
+        n_points = max((len(values) for values in y_series.values()), default=0)
+        if self.interactive_hover and n_points < _HOVER_MAX_POINTS:
+            fig.update_layout(hovermode="x unified", spikedistance=-1)
+        else:
+            fig.update_layout(hovermode=False, spikedistance=0)
         return fig
 
     def histogram(
@@ -266,6 +612,10 @@ class PlotlyBackend(PlottingBackend):
         bins: int = 50,
         threshold: Optional[float] = None,
     ) -> Any:
+        if len(values) >= _SERVER_BIN_MIN_VALUES:
+            counts, edges = _histogram(np.asarray(values, dtype=np.float64), bins)
+            return self.bar_histogram(fig, edges, counts, title, threshold)
+
         fig.add_trace(
             self.go.Histogram(
                 x=values,
@@ -286,12 +636,69 @@ class PlotlyBackend(PlottingBackend):
                 annotation_position="top right",
             )
 
-        fig.update_layout(title=title, xaxis_title="Score", yaxis_title="Frequency")
+        fig.update_layout(
+            title=title,
+            xaxis_title="Score",
+            yaxis_title="Frequency",
+            hovermode="x" if self.interactive_hover else False,
+        )
+        return fig
+
+    def bar_histogram(
+        self,
+        fig: Any,
+        edges: np.ndarray,
+        counts: np.ndarray,
+        title: str,
+        threshold: Optional[float] = None,
+    ) -> Any:
+        """Draw an already-binned histogram (counts per [edges[i], edges[i + 1]))."""
+        fig.add_trace(
+            self.go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                marker_color=COLORBLIND_PALETTE["blue"],
+                opacity=0.7,
+                name="Distribution",
+            )
+        )
+
+        if threshold is not None:
+            fig.add_vline(
+                x=threshold,
+                line_width=2,
+                line_dash="dash",
+                line_color=COLORBLIND_PALETTE["red"],
+                annotation_text=f"Threshold: {threshold:.2f}",
+                annotation_position="top right",
+            )
+
+        fig.update_layout(
+            title=title,
+            xaxis_title="Score",
+            yaxis_title="Frequency",
+            bargap=0,
+            hovermode="x" if self.interactive_hover else False,
+        )
         return fig
 
     def to_html(self, fig: Any) -> str:
         return self.pio.to_html(fig, include_plotlyjs="cdn", full_html=False)
 
+    def html_head(self) -> str:
+        from plotly.offline import get_plotlyjs_version
+
+        return (
+            f'<script charset="utf-8" '
+            f'src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        )
+
+    def to_html_fragment(self, fig: Any) -> str:
+        # plotly.js is loaded once by html_head(); embedding it per figure would
+        # also hash the whole bundle for the SRI attribute on every call
+        return str(self.pio.to_html(fig, include_plotlyjs=False, full_html=False))
+
 
 class UncertaintyVisualizer:
     """Visualizer for uncertainty decomposition."""
@@ -301,24 +708,24 @@ class UncertaintyVisualizer:
 
     def plot_decomposition(
         self,
-        estimates: List[UncertaintyData],
+        estimates: Union[List[UncertaintyData], UncertaintyBatch],
         title: str = "Uncertainty Decomposition",
     ) -> Any:
         """
         Plot uncertainty decomposition bar chart.
 
         Args:
-            estimates: List of uncertainty data points
+            estimates: Uncertainty data points, as records or a batch
             title: Chart title
 
         Returns:
             Figure object.
         """
-        if len(estimates) == 1:
+        batch = _as_uncertainty_batch(estimates)
+        if len(batch) == 1:
             # Single estimate - show components
-            est = estimates[0]
             labels = ["Total", "Aleatoric", "Epistemic"]
-            values = [est.total, est.aleatoric, est.epistemic]
+            values = [float(batch.total[0]), float(batch.aleatoric[0]), float(batch.epistemic[0])]
             colors = [
                 COLORBLIND_PALETTE["purple"],
                 COLORBLIND_PALETTE["blue"],
@@ -326,8 +733,8 @@ class UncertaintyVisualizer:
             ]
         else:
             # Multiple estimates - show total per sample
-            labels = [e.label or f"Sample {i}" for i, e in enumerate(estimates)]
-            values = [e.total for e in estimates]
+            labels = batch.display_labels()
+            values = batch.total.tolist()
             colors = None
 
         fig = self.backend.create_figure()
@@ -335,27 +742,28 @@ class UncertaintyVisualizer:
 
     def plot_decomposition_stacked(
         self,
-        estimates: List[UncertaintyData],
+        estimates: Union[List[UncertaintyData], UncertaintyBatch],
         title: str = "Uncertainty Decomposition (Stacked)",
     ) -> Any:
         """Plot stacked bar showing aleatoric vs epistemic per sample."""
+        batch = _as_uncertainty_batch(estimates)
         fig = self.backend.create_figure()
-        ax = fig.add_subplot(111)
-
-        labels = [e.label or f"Sample {i}" for i, e in enumerate(estimates)]
-        aleatoric = [e.aleatoric for e in estimates]
-        epistemic = [e.epistemic for e in estimates]
-
-        x = np.arange(len(labels))
-        ax.bar(x, aleatoric, label="Aleatoric", color=COLORBLIND_PALETTE["blue"])
-        ax.bar(
-            x, epistemic, bottom=aleatoric, label="Epistemic", color=COLORBLIND_PALETTE["orange"]
+        ax = _axes(fig)
+
+        x = np.arange(len(batch), dtype=np.int32)
+        aleatoric = ax.bar(x, batch.aleatoric, label="Aleatoric", color=COLORBLIND_PALETTE["blue"])
+        epistemic = ax.bar(
+            x,
+            batch.epistemic,
+            bottom=batch.aleatoric,
+            label="Epistemic",
+            color=COLORBLIND_PALETTE["orange"],
         )
         ax.set_xticks(x)
-        ax.set_xticklabels(labels, rotation=45, ha="right")
+        ax.set_xticklabels(batch.display_labels(), rotation=45, ha="right")
         ax.set_ylabel("Uncertainty")
         ax.set_title(title)
-        ax.legend()
+        ax.legend(handles=[aleatoric, epistemic])
 
         return fig
 
@@ -368,34 +776,29 @@ class SafetyVisualizer:
 
     def plot_margin_timeline(
         self,
-        data: List[SafetyMarginData],
+        data: Union[List[SafetyMarginData], SafetyBatch],
         title: str = "Safety Margin Timeline",
+        sorted_constraints: bool = True,
     ) -> Any:
         """
         Plot safety margins over time.
 
         Args:
-            data: List of safety margin data points
+            data: Safety margin data points, as records or a batch
             title: Chart title
+            sorted_constraints: Order series alphabetically rather than by first
+                appearance (ignored for a batch, whose columns are already ordered)
 
         Returns:
             Figure object.
         """
-        timestamps = [d.timestamp for d in data]
-
-        # Get all constraint names
-        all_constraints = set()
-        for d in data:
-            all_constraints.update(d.constraint_margins.keys())
-
-        y_series: Dict[str, List[float]] = {}
-        for constraint in all_constraints:
-            y_series[constraint] = [d.constraint_margins.get(constraint, 0.0) for d in data]
+        batch = _as_safety_batch(data, sorted_constraints)
+        y_series = {name: batch.margins[:, j] for j, name in enumerate(batch.constraint_names)}
 
         fig = self.backend.create_figure()
         return self.backend.line_chart(
             fig,
-            timestamps,
+            batch.timestamps,
             y_series,
             title=title,
             xlabel="Time",
@@ -404,30 +807,31 @@ class SafetyVisualizer:
 
     def plot_state_timeline(
         self,
-        data: List[SafetyMarginData],
+        data: Union[List[SafetyMarginData], SafetyBatch],
         title: str = "Mitigation State Timeline",
     ) -> Any:
         """Plot mitigation state changes over time."""
+        batch = _as_safety_batch(data)
         fig = self.backend.create_figure()
-        ax = fig.add_subplot(111)
-
-        timestamps = [d.timestamp for d in data]
-        states = [d.mitigation_state for d in data]
-
-        # Map states to numeric values
-        state_map = {
-            "nominal": 0,
-            "cautious": 1,
-            "fallback": 2,
-            "safe_stop": 3,
-            "human_escalation": 4,
-        }
+        ax = _axes(fig)
+
+        timestamps = batch.timestamps
+        states = batch.mitigation_states
 
-        y = [state_map.get(s.lower(), 0) for s in states]
+        # Map states to numeric values; only the few distinct names are lowercased
+        codes = {s: _STATE_MAP.get(s.lower(), 0) for s in set(states)}
+        y = np.fromiter((codes[s] for s in states), dtype=np.int8, count=len(states))
+
+        # A post-step only needs the rows where the state changes (plus the
+        # last one), so long timelines shrink without losing any transition
+        if len(y) > 2:
+            keep = np.flatnonzero(np.diff(y)) + 1
+            keep = np.concatenate(([0], keep, [len(y) - 1]))
+            timestamps, y = timestamps[keep], y[keep]
 
         ax.step(timestamps, y, where="post", color=COLORBLIND_PALETTE["blue"])
-        ax.set_yticks(list(state_map.values()))
-        ax.set_yticklabels(list(state_map.keys()))
+        ax.set_yticks(_STATE_VALUES)
+        ax.set_yticklabels(_STATE_KEYS)
         ax.set_xlabel("Time")
         ax.set_ylabel("State")
         ax.set_title(title)
@@ -435,6 +839,43 @@ class SafetyVisualizer:
         return fig
 
 
+def _box_stats(values: np.ndarray, label: str) -> Dict[str, Any]:
+    """
+    Box plot statistics for Axes.bxp, matching Axes.boxplot's defaults.
+
+    Whiskers reach the most extreme values within 1.5 IQR of the quartiles;
+    values beyond them are fliers. All quartiles come from one percentile call.
+    Empty input gives NaN statistics (an empty box), as boxplot_stats does.
+    """
+    if values.size == 0:
+        nan = float("nan")
+        return {
+            "label": label,
+            "med": nan,
+            "q1": nan,
+            "q3": nan,
+            "mean": nan,
+            "whislo": nan,
+            "whishi": nan,
+            "fliers": values,
+        }
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    lo, hi = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    within = (values >= lo) & (values <= hi)
+    inside = values[within]
+    return {
+        "label": label,
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "mean": values.mean(),
+        "whislo": inside.min() if inside.size else q1,
+        "whishi": inside.max() if inside.size else q3,
+        "fliers": values[~within],
+    }
+
+
 class OODVisualizer:
     """Visualizer for OOD score distributions."""
 
@@ -447,6 +888,7 @@ class OODVisualizer:
         threshold: float,
         title: str = "OOD Score Distribution",
         bins: int = 50,
+        bin_edges: Optional[np.ndarray] = None,
     ) -> Any:
         """
         Plot histogram of OOD scores with threshold.
@@ -456,12 +898,46 @@ class OODVisualizer:
             threshold: OOD detection threshold
             title: Chart title
             bins: Number of histogram bins
+            bin_edges: Precomputed edges (see shared_bin_edges); overrides bins
 
         Returns:
             Figure object.
         """
         fig = self.backend.create_figure()
-        return self.backend.histogram(fig, scores, title, bins, threshold)
+        bar_histogram = getattr(self.backend, "bar_histogram", None)
+        if bar_histogram is None:
+            if bin_edges is not None:
+                bins = len(bin_edges) - 1
+            return self.backend.histogram(fig, scores, title, bins, threshold)
+
+        # Bin here so the backend draws `bins` bars instead of walking every score
+        counts, edges = _histogram(np.asarray(scores, dtype=np.float64), bins, bin_edges)
+        return bar_histogram(fig, edges, counts, title, threshold)
+
+    @staticmethod
+    def shared_bin_edges(detector_scores: Dict[str, List[float]], bins: int = 50) -> np.ndarray:
+        """
+        Uniform bin edges spanning every detector's scores.
+
+        Computed once and passed as `bin_edges` to plot_score_distribution,
+        sibling plots skip per-call range selection and share one x-axis.
+
+        Args:
+            detector_scores: Scores per detector
+            bins: Number of histogram bins
+
+        Returns:
+            Array of bins + 1 evenly spaced edges.
+        """
+        arrays = [np.asarray(s, dtype=np.float64) for s in detector_scores.values()]
+        arrays = [a for a in arrays if a.size]
+        if not arrays:
+            return np.linspace(0.0, 1.0, bins + 1)
+        lo = min(float(a.min()) for a in arrays)
+        hi = max(float(a.max()) for a in arrays)
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        return np.linspace(lo, hi, bins + 1)
 
     def plot_detector_comparison(
         self,
@@ -470,18 +946,109 @@ class OODVisualizer:
     ) -> Any:
         """Plot box plots comparing different detectors."""
         fig = self.backend.create_figure()
-        ax = fig.add_subplot(111)
+        ax = _axes(fig)
 
-        data = list(detector_scores.values())
-        labels = list(detector_scores.keys())
+        stats = [
+            _box_stats(np.asarray(scores, dtype=np.float64), label)
+            for label, scores in detector_scores.items()
+        ]
 
-        ax.boxplot(data, labels=labels)
+        ax.bxp(stats)
         ax.set_ylabel("Score")
         ax.set_title(title)
 
         return fig
 
 
+class CachedVisualizer:
+    """
+    Renders common components straight to HTML, memoizing the result.
+
+    Results are keyed on a digest of the plotted values (plus title and
+    options), so dashboards refreshed with unchanged inputs skip the whole
+    plotting and encoding pipeline. The returned strings are page fragments
+    (see PlottingBackend.to_html_fragment) meant to be passed to
+    Dashboard.render_html alongside figures.
+    """
+
+    def __init__(self, backend: Optional[PlottingBackend] = None, maxsize: int = 128):
+        """
+        Args:
+            backend: Plotting backend used on cache misses
+            maxsize: Number of rendered components to keep (least recently
+                used are evicted first)
+        """
+        self.backend = backend or MatplotlibBackend()
+        self.maxsize = maxsize
+        self.uncertainty_viz = UncertaintyVisualizer(self.backend)
+        self.safety_viz = SafetyVisualizer(self.backend)
+        self.ood_viz = OODVisualizer(self.backend)
+        self._cache: "OrderedDict[Tuple[str, bytes], str]" = OrderedDict()
+
+    def _render(self, kind: str, digest: bytes, make_figure: Callable[[], Any]) -> str:
+        key = (kind, digest)
+        html = self._cache.get(key)
+        if html is None:
+            html = self.backend.to_html_fragment(make_figure())
+            self._cache[key] = html
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return html
+
+    @staticmethod
+    def _digest(*parts: Any) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            h.update(part.tobytes() if isinstance(part, np.ndarray) else repr(part).encode())
+        return h.digest()
+
+    def decomposition_html(
+        self,
+        estimates: Union[List[UncertaintyData], UncertaintyBatch],
+        title: str = "Uncertainty Decomposition",
+    ) -> str:
+        """HTML for UncertaintyVisualizer.plot_decomposition."""
+        batch = _as_uncertainty_batch(estimates)
+        return self._render(
+            "decomposition",
+            self._digest(batch.total, batch.aleatoric, batch.epistemic, batch.labels, title),
+            lambda: self.uncertainty_viz.plot_decomposition(batch, title),
+        )
+
+    def margin_timeline_html(
+        self,
+        data: Union[List[SafetyMarginData], SafetyBatch],
+        title: str = "Safety Margin Timeline",
+        sorted_constraints: bool = True,
+    ) -> str:
+        """HTML for SafetyVisualizer.plot_margin_timeline."""
+        batch = _as_safety_batch(data, sorted_constraints)
+        return self._render(
+            "margin_timeline",
+            self._digest(batch.timestamps, batch.margins, batch.constraint_names, title),
+            lambda: self.safety_viz.plot_margin_timeline(batch, title),
+        )
+
+    def score_distribution_html(
+        self,
+        scores: List[float],
+        threshold: float,
+        title: str = "OOD Score Distribution",
+        bins: int = 50,
+        bin_edges: Optional[np.ndarray] = None,
+    ) -> str:
+        """HTML for OODVisualizer.plot_score_distribution."""
+        arr = np.asarray(scores, dtype=np.float64)
+        edges = None if bin_edges is None else np.asarray(bin_edges, dtype=np.float64)
+        return self._render(
+            "score_distribution",
+            self._digest(arr, threshold, title, bins, edges),
+            lambda: self.ood_viz.plot_score_distribution(scores, threshold, title, bins, edges),
+        )
+
+
 class Dashboard:
     """
     Combined dashboard for all visualizations.
@@ -505,18 +1072,34 @@ class Dashboard:
         Render components to HTML.
 
         Args:
-            components: List of figure objects
+            components: List of figure objects or pre-rendered HTML strings
+                (e.g. from CachedVisualizer)
             title: Page title
             path: Optional path to save HTML file
 
         Returns:
             HTML string.
         """
-        html_parts = [
+        html = "\n".join(self._html_chunks(components, title))
+
+        if path:
+            with open(path, "w") as f:
+                f.write(html)
+
+        return html
+
+    def _html_chunks(self, components: List[Any], title: str) -> Iterator[str]:
+        """Yield the page line by line, rendering each component as it is reached."""
+        yield from (
             "<!DOCTYPE html>",
             "<html>",
             "<head>",
             f"<title>{title}</title>",
+        )
+        head = self.backend.html_head()
+        if head:
+            yield head
+        yield from (
             "<style>",
             "body { font-family: Arial, sans-serif; margin: 20px; }",
             ".component { margin: 20px 0; padding: 10px; border: 1px solid #ddd; }",
@@ -525,24 +1108,28 @@ class Dashboard:
             "</head>",
             "<body>",
             f"<h1>{title}</h1>",
-        ]
-
-        for i, fig in enumerate(components):
-            html_parts.append(f'<div class="component" id="component-{i}">')
-            html_parts.append(self.backend.to_html(fig))
-            html_parts.append("</div>")
-
-        html_parts.extend(
-            [
-                "</body>",
-                "</html>",
-            ]
         )
 
-        html = "\n".join(html_parts)
-
-        if path:
-            with open(path, "w") as f:
-                f.write(html)
-
+        for i, html in enumerate(self._render_components(components)):
+            yield f'<div class="component" id="component-{i}">'
+            yield html
+            yield "</div>"
+
+        yield "</body>"
+        yield "</html>"
+
+    def _render_components(self, components: List[Any]) -> List[str]:
+        """Render figures to HTML fragments in input order, in parallel when several."""
+        html = list(components)  # pre-rendered strings are kept as they are
+        pending = [i for i, fig in enumerate(components) if not isinstance(fig, str)]
+        if len(pending) == 1:
+            html[pending[0]] = self.backend.to_html_fragment(components[pending[0]])
+        elif pending:
+            # PNG encoding and Plotly serialization spend most of their time
+            # in C code that releases the GIL
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                rendered = pool.map(self.backend.to_html_fragment, [components[i] for i in pending])
+                for i, fragment in zip(pending, rendered):
+                    html[i] = fragment
         return html
@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for OpenTLU tests.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -12,6 +13,27 @@ if str(src_path) not in sys.path:
 
 import pytest  # noqa: E402
 import numpy as np  # noqa: E402
+from hypothesis import settings  # noqa: E402
+
+from opentlu.active_learning.acquisition import SampleMetadata, dpp_kernel  # noqa: E402
+from opentlu.foundations.contracts import RiskAssessment, UncertaintyEstimate  # noqa: E402
+from opentlu.runtime.ood import MahalanobisDetector  # noqa: E402
+
+
+# Hypothesis example budgets: quick locally, fuller in CI, thorough nightly.
+# Select with HYPOTHESIS_PROFILE; CI runners (CI set) default to "ci".
+settings.register_profile("dev", max_examples=20)
+settings.register_profile("ci", max_examples=100)
+settings.register_profile("nightly", max_examples=200)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci" if os.getenv("CI") else "dev"))
+
+# Every acquisition sample carries the same (never mutated) risk assessment
+_SHARED_RISK = RiskAssessment(
+    expected_risk=0.1,
+    tail_risk_cvar=0.2,
+    violation_probability=0.01,
+    is_acceptable=True,
+)
 
 
 @pytest.fixture
@@ -25,3 +47,53 @@ def sample_ensemble_probs() -> np.ndarray:
     """Provide sample ensemble probabilities for testing uncertainty decomposition."""
     # 3 ensemble members, 10 samples, 4 classes
     return np.random.default_rng(42).dirichlet(alpha=[1, 1, 1, 1], size=(3, 10))
+
+
+@pytest.fixture(scope="module")
+def fitted_mahal():
+    """MahalanobisDetector fitted once per module on 100 standard-normal 10-d features."""
+    detector = MahalanobisDetector(name="mahal")
+    detector.fit(np.random.default_rng(0).standard_normal((100, 10)))
+    return detector
+
+
+@pytest.fixture(scope="module")
+def bootstrap_data() -> np.ndarray:
+    """1000 read-only draws from N(100, 10^2), shared by a module's tests."""
+    data = np.random.default_rng(0).normal(100, 10, 1000)
+    data.setflags(write=False)
+    return data
+
+
+@pytest.fixture(scope="module")
+def acquisition_samples():
+    """20 SampleMetadata with rising epistemic scores, and their (20, 10) embeddings."""
+    embeddings = np.random.default_rng(0).standard_normal((20, 10))
+    epistemic = 0.1 + 0.01 * np.arange(20)
+    samples = [
+        SampleMetadata(
+            id=f"sample_{i}",
+            uncertainty=UncertaintyEstimate(
+                confidence=0.5,
+                aleatoric_score=0.1,
+                epistemic_score=float(epistemic[i]),
+                source="test",
+            ),
+            risk=_SHARED_RISK,
+            novelty_score=0.1,
+            embedding=embeddings[i],
+        )
+        for i in range(20)
+    ]
+    return samples, embeddings
+
+
+@pytest.fixture(scope="module")
+def dpp_fixture():
+    """(embeddings (10, 5), quality scores (10,), their DPP kernel), built once per module."""
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((10, 5))
+    scores = rng.random(10)
+    kernel = dpp_kernel(embeddings, scores)
+    kernel.setflags(write=False)
+    return embeddings, scores, kernel
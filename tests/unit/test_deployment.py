@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import numpy as np
 
 from opentlu.evaluation.deployment import (
@@ -11,18 +11,28 @@ from opentlu.evaluation.deployment import (
 )
 
 
+class FakeClock:
+    """Manually advanced seconds counter, passed to runners as `clock`."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
 class MockPolicy(Policy):
-    def __init__(self, action: np.ndarray, delay: float = 0.0):
+    def __init__(self, action: np.ndarray, delay: float = 0.0, clock: Optional[FakeClock] = None):
         self.action = action
         self.delay = delay
+        self.clock = clock
         self.called_count = 0
 
     def __call__(self, observation: Dict[str, Any]) -> np.ndarray:
         self.called_count += 1
-        if self.delay > 0:
-            import time
-
-            time.sleep(self.delay)
+        if self.delay > 0 and self.clock is not None:
+            # Simulated latency: advance the runner's clock instead of sleeping
+            self.clock.t += self.delay
         return self.action
 
 
@@ -66,6 +76,21 @@ def test_shadow_runner_fraction():
     assert cand_policy.called_count == 1
 
 
+def test_latency_uses_injected_clock():
+    """Latencies come from the runner's clock, so slow policies need not sleep."""
+    clock = FakeClock()
+    prod_policy = MockPolicy(np.array([1.0]), delay=0.002, clock=clock)
+    cand_policy = MockPolicy(np.array([1.0]), delay=0.010, clock=clock)
+
+    result = ShadowRunner(prod_policy, cand_policy, shadow_fraction=1.0, clock=clock).run({})
+    assert np.isclose(result.production_latency_ms, 2.0)
+    assert np.isclose(result.shadow_latency_ms, 10.0)
+
+    runner = ABTestRunner({"A": cand_policy}, {"A": 1.0}, clock=clock)
+    runner.run({})
+    assert np.isclose(runner.get_metrics()["A"]["mean_latency_ms"], 10.0)
+
+
 def test_ab_test_sticky_bucketing():
     """Test sticky assignment in A/B testing."""
     policy_a = MockPolicy(np.array([0.0]))
@@ -76,21 +101,16 @@ def test_ab_test_sticky_bucketing():
 
     runner = ABTestRunner(policies, allocation, sticky_key="user_id")
 
-    # User 1 should always get same variant
-    ctx1 = {"user_id": "user1"}
-    action1, variant1 = runner.run({}, ctx1)
-
-    for _ in range(10):
-        a, v = runner.run({}, ctx1)
-        assert v == variant1
-
-    # User 2 should get consistent var
-    ctx2 = {"user_id": "user2"}
-    action2, variant2 = runner.run({}, ctx2)
+    # One full run per user covers the policy path; the assignment itself
+    # is a pure function of the sticky key, so check it directly after that
+    for user in ("user1", "user2"):
+        ctx = {"user_id": user}
+        action, variant = runner.run({}, ctx)
+        assert np.array_equal(action, policies[variant].action)
+        assert runner._get_bucket(ctx) == variant
+        assert runner._get_bucket({"user_id": user, "other": 1}) == variant
 
-    for _ in range(10):
-        a, v = runner.run({}, ctx2)
-        assert v == variant2
+    assert policy_a.called_count + policy_b.called_count == 2
 
 
 def test_ab_test_metrics():
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from opentlu.safety.filter import (
     BoxConstraint,
     LinearConstraint,
@@ -7,6 +8,7 @@ from opentlu.safety.filter import (
     box_constraint_project,
     linear_constraint_project,
     DynamicsModel,
+    _project_halfspaces,
 )
 from opentlu.foundations.contracts import SafetyEnvelope
 
@@ -27,6 +29,16 @@ def test_box_projection():
     assert not mod
     assert np.allclose(proj, action)
 
+    # On the boundary - still inside, returned without a copy
+    action = np.array([1.0, -1.0])
+    proj, mod = box_constraint_project(action, constraint)
+    assert not mod
+    assert proj is action
+
+    # NaN is never inside the box
+    proj, mod = box_constraint_project(np.array([np.nan, 0.0]), constraint)
+    assert mod
+
     # Outside bounds - clamp
     action = np.array([2.0, -2.0])
     proj, mod = box_constraint_project(action, constraint)
@@ -54,6 +66,54 @@ def test_linear_projection():
     assert np.sum(proj) <= 1.0 + 1e-4
 
 
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("omega", [1.0, 1.5])
+def test_projection_kernel_matches_reference(monkeypatch, seed, omega):
+    """The loop kernel (numba target) and the NumPy path take the same steps."""
+    rng = np.random.default_rng(seed)
+    n_rows, dim = rng.integers(3, 7), rng.integers(2, 5)
+    A = rng.normal(size=(n_rows, dim))  # coupled, non-orthogonal rows
+    A[0] = 0.0  # degenerate rows are skipped by both paths
+    b = rng.uniform(0.1, 1.0, size=n_rows)
+    action = 3.0 * rng.normal(size=dim)
+    action += A[1] * (2.0 * b[1] / (A[1] @ A[1]) + 1.0)  # start outside row 1
+    constraint = LinearConstraint(A=A, b=b)
+
+    monkeypatch.setattr("opentlu.safety.filter._project_numba", None)
+    ref_x, ref_mod = linear_constraint_project(action, constraint, omega=omega)
+
+    active = constraint._active_rows
+    kernel_x, kernel_mod = _project_halfspaces(
+        constraint._active_A,
+        b[active],
+        constraint._row_norm_sq[active],
+        constraint._active_gram,
+        action.astype(np.float64),
+        100,
+        1e-6,
+        omega,
+    )
+
+    assert kernel_mod and ref_mod
+    assert np.allclose(kernel_x, ref_x, atol=1e-9)
+
+
+def test_linear_projection_over_relaxed():
+    """SOR steps still converge to a feasible point; zero rows are ignored."""
+    A = np.array([[1.0, 1.0], [1.0, -0.5], [0.0, 0.0]])
+    b = np.array([1.0, 0.5, 0.0])
+    constraint = LinearConstraint(A=A, b=b)
+    assert np.allclose(constraint._row_norm_sq, [2.0, 1.25, 0.0])
+    assert list(constraint._active_rows) == [0, 1]
+
+    proj, mod = linear_constraint_project(np.array([2.0, 1.5]), constraint, omega=1.5)
+    assert mod
+    assert np.all(A @ proj - b <= 1e-6)
+
+    with pytest.raises(ValueError):
+        linear_constraint_project(np.array([2.0, 1.5]), constraint, omega=2.0)
+
+
 def test_cbf_filter():
     """Test Control Barrier Function filter."""
     dynamics = MockDynamics()
@@ -87,6 +147,25 @@ def test_cbf_filter():
     assert is_safe
 
 
+def test_cbf_filter_batched_matches_sequential():
+    """Batched line search picks the same action as the sequential one."""
+    state = np.array([0.1, 0.5])
+    action = np.array([-0.45, 0.2])
+
+    def barrier(x):
+        return x[0]
+
+    sequential = CBFFilter(MockDynamics(), barrier, alpha=0.5)
+    batched = CBFFilter(MockDynamics(), barrier, alpha=0.5, batch_dynamics=True)
+
+    seq_action, seq_mod, seq_margin = sequential.filter_action(state, action)
+    bat_action, bat_mod, bat_margin = batched.filter_action(state, action)
+
+    assert seq_mod and bat_mod
+    assert np.allclose(seq_action, bat_action)
+    assert np.isclose(seq_margin, bat_margin)
+
+
 def test_safety_filter_integration():
     """Test full safety filter integration."""
     envelope = SafetyEnvelope(source="test", constraints=[])
@@ -103,3 +182,105 @@ def test_safety_filter_integration():
     res = sf.filter(np.array([1.5]))
     assert res.was_modified
     assert np.allclose(res.action, [1.0])
+
+
+def test_safety_filter_box_margins():
+    """Box margins are the distance to the nearest bound, zero once clipped."""
+    envelope = SafetyEnvelope(source="test", constraints=[])
+    box = BoxConstraint(np.array([-1.0, 0.0]), np.array([1.0, 2.0]), name="limits")
+    sf = SafetyFilter(envelope=envelope, box_constraints=[box])
+
+    candidate = np.array([0.25, 1.5])
+    res = sf.filter(candidate)
+    assert not res.was_modified
+    assert np.isclose(res.constraint_margins["limits"], 0.5)
+
+    candidate = np.array([3.0, 1.0])
+    res = sf.filter(candidate)
+    assert res.was_modified
+    assert res.violation_type == "limits"
+    assert res.constraint_margins["limits"] == 0.0
+    assert np.allclose(res.action, [1.0, 1.0])
+    assert np.allclose(candidate, [3.0, 1.0])  # caller's array is untouched
+
+
+def test_safety_filter_memo():
+    """Repeated candidates hit the memo; callers cannot corrupt cached results."""
+    envelope = SafetyEnvelope(source="test", constraints=[])
+    box = BoxConstraint(np.array([-1.0]), np.array([1.0]))
+    sf = SafetyFilter(envelope=envelope, box_constraints=[box], memo_size=2)
+
+    first = sf.filter(np.array([1.5]))
+    first.action[0] = 99.0
+    second = sf.filter(np.array([1.5]))
+    assert second.was_modified
+    assert np.allclose(second.action, [1.0])
+    assert len(sf._memo) == 1
+
+    sf.filter(np.array([0.1]))
+    sf.filter(np.array([0.2]))
+    assert len(sf._memo) == 2
+
+
+def test_safety_filter_stacked_constraints():
+    """Multiple boxes and linear constraints are enforced jointly with per-name margins."""
+    envelope = SafetyEnvelope(source="test", constraints=[])
+    wide = BoxConstraint(np.array([-2.0, -2.0]), np.array([2.0, 2.0]), name="wide")
+    narrow = BoxConstraint(np.array([-1.0, -0.5]), np.array([1.0, 0.5]), name="narrow")
+    sum_limit = LinearConstraint(A=np.array([[1.0, 1.0]]), b=np.array([1.2]), name="sum")
+    slab = LinearConstraint(
+        A=np.array([[1.0, 0.0], [-1.0, 0.0]]), b=np.array([0.9, 0.9]), name="slab"
+    )
+    sf = SafetyFilter(
+        envelope=envelope, box_constraints=[wide, narrow], linear_constraints=[sum_limit, slab]
+    )
+
+    assert sf.check_constraints(np.array([1.5, 0.0])) == {
+        "wide": True,
+        "narrow": False,
+        "sum": False,
+        "slab": False,
+    }
+
+    res = sf.filter(np.array([1.5, 0.0]))
+    assert res.was_modified
+    assert all(sf.check_constraints(res.action + np.array([-1e-5, 0.0])).values())
+    assert np.isclose(res.constraint_margins["wide"], 1.0)  # measured after the box stage
+    assert res.constraint_margins["narrow"] >= 0.0
+    assert res.constraint_margins["slab"] >= -1e-6
+
+
+@pytest.mark.parametrize("position", [0, 1, 2])
+def test_safety_filter_zero_row_linear_constraint(position):
+    """A constraint without rows is always satisfied, wherever it sits in the list."""
+    envelope = SafetyEnvelope(source="test", constraints=[])
+    empty = LinearConstraint(A=np.zeros((0, 2)), b=np.zeros(0), name="empty")
+    linear = [
+        LinearConstraint(A=np.array([[1.0, 0.0]]), b=np.array([0.5]), name="x"),
+        LinearConstraint(A=np.array([[0.0, 1.0]]), b=np.array([0.5]), name="y"),
+    ]
+    linear.insert(position, empty)
+    sf = SafetyFilter(envelope=envelope, linear_constraints=linear)
+
+    assert sf.check_constraints(np.array([0.0, 1.0])) == {"x": True, "y": False, "empty": True}
+    res = sf.filter(np.array([0.0, 1.0]))
+    assert res.violation_type == "y"
+    assert res.constraint_margins["empty"] == np.inf
+    assert np.isclose(res.constraint_margins["x"], 0.5)
+
+    only_empty = SafetyFilter(envelope=envelope, linear_constraints=[empty])
+    assert only_empty.check_constraints(np.array([3.0, 3.0])) == {"empty": True}
+    assert not only_empty.filter(np.array([3.0, 3.0])).was_modified
+
+
+def test_linear_constraint_layout_and_coupled_projection():
+    """A is stored C-contiguous; coupled constraints are all satisfied after projection."""
+    A = np.asfortranarray(np.array([[1, 2], [3, -1], [-1, 1]]))
+    constraint = LinearConstraint(A=A, b=np.array([1.0, 1.0, 0.5]))
+    assert constraint.A.flags.c_contiguous
+    assert constraint.A.dtype == np.float64
+    assert np.allclose(constraint._active_gram, A @ A.T)
+
+    proj, mod = linear_constraint_project(np.array([3.0, 3.0]), constraint)
+    assert mod
+    assert np.all(constraint.A @ proj - constraint.b <= 1e-6)
@@ -28,10 +28,10 @@ def test_entropy():
 
 
 def test_uncertainty_decomposition():
-    # Model 1: [1.0, 0.0], Model 2: [0.0, 1.0]
-    p1 = np.array([[1.0, 0.0]])
-    p2 = np.array([[0.0, 1.0]])
-    ensemble = np.stack([p1, p2])
+    # (models, samples, classes): Model 1: [1.0, 0.0], Model 2: [0.0, 1.0]
+    ensemble = np.empty((2, 1, 2))
+    ensemble[0] = [[1.0, 0.0]]
+    ensemble[1] = [[0.0, 1.0]]
 
     total, aleatoric, epistemic = ensemble_uncertainty_decomposition(ensemble)
 
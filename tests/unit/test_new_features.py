@@ -1,11 +1,17 @@
 """Tests for new features: TTC, OOD ensemble, statistics, health monitor, etc."""
 
+import threading
+
 import numpy as np
+import pytest
 
 from opentlu.safety.monitors import (
+    _ttc_cv_batch,
     TTCMonitor,
     TTCConfig,
+    constant_acceleration_ttc,
     constant_velocity_ttc,
+    constant_velocity_ttc_batch,
 )
 from opentlu.runtime.ood import (
     EnergyBasedDetector,
@@ -19,17 +25,17 @@ from opentlu.evaluation.statistics import (
     StatisticalEvaluator,
 )
 from opentlu.runtime.health import (
+    AlertEngine,
+    AlertRule,
     HealthMonitor,
+    NotificationChannel,
     RollingStatistics,
 )
 from opentlu.active_learning.acquisition import (
     DataAcquisitionPolicy,
     AcquisitionConfig,
-    SampleMetadata,
-    dpp_kernel,
     greedy_dpp_map,
 )
-from opentlu.foundations.contracts import UncertaintyEstimate, RiskAssessment
 
 
 # --- TTC Monitor Tests ---
@@ -59,6 +65,39 @@ def test_ttc_no_collision():
     assert ttc == float("inf"), "Expected infinite TTC when moving apart"
 
 
+def test_ttc_3d_and_sequences():
+    """TTC accepts plain sequences and 3D vectors."""
+    # Closing at 5 m/s along a 3-4-0 diagonal, 25 m apart in 3D
+    ttc = constant_velocity_ttc([0, 0, 0], [3.0, 4.0, 0.0], (15.0, 20.0, 0.0), [0, 0, 0])
+    assert np.isclose(ttc, 5.0)
+
+    # Ego at 10 m/s accelerating at 2 m/s^2 toward an object 24 m ahead:
+    # t^2 + 10 t - 24 = 0 -> t = 2
+    ttc = constant_acceleration_ttc(
+        np.zeros(2),
+        np.array([10.0, 0.0]),
+        np.array([24.0, 0.0]),
+        np.zeros(2),
+        ego_acc=np.array([2.0, 0.0]),
+        obj_acc=np.zeros(2),
+    )
+    assert np.isclose(ttc, 2.0)
+
+    # Braking at 2 m/s^2: -t^2 + 10 t - 24 = 0 has roots 4 and 6; the first wins.
+    # From 30 m away the ego stops short (negative discriminant).
+    braking = dict(ego_acc=np.array([-2.0, 0.0]), obj_acc=np.zeros(2))
+    ego_vel = np.array([10.0, 0.0])
+    assert np.isclose(
+        constant_acceleration_ttc(
+            np.zeros(2), ego_vel, np.array([24.0, 0.0]), np.zeros(2), **braking
+        ),
+        4.0,
+    )
+    assert constant_acceleration_ttc(
+        np.zeros(2), ego_vel, np.array([30.0, 0.0]), np.zeros(2), **braking
+    ) == float("inf")
+
+
 def test_ttc_monitor():
     """Test TTC monitor with multiple objects."""
     config = TTCConfig(critical_ttc=1.0, warning_ttc=3.0)
@@ -81,6 +120,186 @@ def test_ttc_monitor():
     assert not output.triggered or "car2" in output.message
 
 
+def test_ttc_monitor_severity_bounds():
+    """Severity is 0 with no approaching object and 1 at contact."""
+    monitor = TTCMonitor("ttc", TTCConfig(debounce_steps=1))
+    receding = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [-1.0, 0.0],
+        "objects": [{"object_id": "a", "position": [5.0, 0.0], "velocity": [0.0, 0.0]}],
+    }
+    contact = {
+        "ego_position": [5.0, 0.0],
+        "ego_velocity": [0.0, 0.0],
+        "objects": receding["objects"],
+    }
+    assert monitor.check(receding).severity == 0.0
+    assert monitor.check(contact).severity == 1.0
+
+
+def test_ttc_monitor_severity_lookup_table():
+    """Tabulated severity rounds up to within one table step of the formula."""
+    lut = TTCMonitor("ttc", TTCConfig(debounce_steps=1))
+    exact = TTCMonitor("ttc", TTCConfig(debounce_steps=1, exact_severity=True))
+    for distance in np.linspace(0.0, 4.0, 37):
+        state = {
+            "ego_position": [0.0, 0.0],
+            "ego_velocity": [1.0, 0.0],
+            "positions": np.array([[distance, 0.0]]),
+            "velocities": np.zeros((1, 2)),
+        }
+        approx, ref = lut.check(state).severity, exact.check(state).severity
+        assert ref <= approx <= ref + 1.0 / 1023 + 1e-12
+
+
+def test_ttc_monitor_lookup_table_follows_warning_ttc():
+    """Changing warning_ttc after construction rescales the tabulated severity."""
+    lut = TTCMonitor("ttc", TTCConfig(debounce_steps=1))
+    exact = TTCMonitor("ttc", TTCConfig(debounce_steps=1, exact_severity=True))
+    state = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [1.0, 0.0],
+        "positions": np.array([[5.0, 0.0]]),
+        "velocities": np.zeros((1, 2)),
+    }
+    for warning_ttc in (3.0, 10.0, 6.0):
+        lut.config.warning_ttc = exact.config.warning_ttc = warning_ttc
+        approx, ref = lut.check(state).severity, exact.check(state).severity
+        assert ref <= approx <= ref + 1.0 / 1023 + 1e-12
+
+    lut.config = TTCConfig(debounce_steps=1, warning_ttc=20.0)
+    assert np.isclose(lut.check(state).severity, 0.75, atol=1.0 / 1023)
+
+
+def test_ttc_monitor_severity_edge_inputs():
+    """A zero warning_ttc or a NaN TTC falls back to the exact severity formula."""
+    state = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [1.0, 0.0],
+        "positions": np.array([[2.0, 0.0]]),
+        "velocities": np.zeros((1, 2)),
+    }
+    monitor = TTCMonitor("ttc", TTCConfig(warning_ttc=0.0, critical_ttc=0.0, debounce_steps=1))
+    assert monitor.check(state).severity == 0.0
+
+    monitor = TTCMonitor("ttc", TTCConfig(debounce_steps=1))
+    monitor._min_ttc = lambda *args: (float("nan"), 0)
+    assert monitor.check(state).severity == 1.0
+
+
+def test_ttc_monitor_debounce_window():
+    """Triggering requires a majority of the last debounce_steps checks."""
+    monitor = TTCMonitor("ttc", TTCConfig(critical_ttc=1.0, debounce_steps=3))
+    danger = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [10.0, 0.0],
+        "objects": [{"object_id": "car", "position": [5.0, 0.0], "velocity": [0.0, 0.0]}],
+    }
+    clear = {"ego_position": [0.0, 0.0], "ego_velocity": [0.0, 0.0], "objects": danger["objects"]}
+
+    sequence = [danger, clear, danger, danger, clear, clear, clear]
+    results = [monitor.check(state).triggered for state in sequence]
+
+    assert results == [True, False, True, True, True, False, False]
+    assert monitor._trigger_count == sum(monitor._trigger_history) == 0
+
+
+def test_ttc_monitor_reuses_buffers():
+    """Per-object state is copied into reused SoA buffers for both models."""
+    state = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [10.0, 0.0],
+        "objects": [
+            {"object_id": "car1", "position": [50.0, 0.0], "velocity": [0.0, 0.0]},
+            {
+                "object_id": "car2",
+                "position": [20.0, 0.0],
+                "velocity": [0.0, 0.0],
+                "acceleration": [1.0, 0.0],
+            },
+        ],
+    }
+    for model in ("constant_velocity", "constant_acceleration"):
+        monitor = TTCMonitor("ttc", TTCConfig(model=model, debounce_steps=1))
+        first = monitor.check(state)
+        buffers = monitor._buffers
+        second = monitor.check(state)
+
+        assert monitor._buffers is buffers
+        assert buffers.ids == ["car1", "car2"]
+        assert first.severity == second.severity
+        assert "2.00s" in second.message
+
+
+def test_ttc_monitor_accepts_soa_state():
+    """Array-valued object state gives the same result as the object dicts."""
+    objects = [
+        {"object_id": "car1", "position": [50.0, 0.0], "velocity": [0.0, 0.0]},
+        {"object_id": "car2", "position": [20.0, 0.0], "velocity": [0.0, 0.0]},
+    ]
+    soa = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [10.0, 0.0],
+        "positions": np.array([o["position"] for o in objects]),
+        "velocities": np.array([o["velocity"] for o in objects]),
+        "object_ids": ["car1", "car2"],
+    }
+    dicts = {"ego_position": [0.0, 0.0], "ego_velocity": [10.0, 0.0], "objects": objects}
+
+    for model in ("constant_velocity", "constant_acceleration"):
+        config = TTCConfig(model=model, debounce_steps=1)
+        from_soa = TTCMonitor("ttc", config).check(soa, timestamp=0.0)
+        from_dicts = TTCMonitor("ttc", config).check(dicts, timestamp=0.0)
+        assert from_soa == from_dicts
+        assert "car2" in from_soa.message
+
+
+def test_ttc_monitor_float32_buffers():
+    """float32 object state gives the same TTC and target as float64."""
+    rng = np.random.default_rng(1)
+    state = {
+        "ego_position": [0.0, 0.0],
+        "ego_velocity": [8.0, 1.0],
+        "objects": [
+            {"object_id": f"obj{i}", "position": p, "velocity": v}
+            for i, (p, v) in enumerate(
+                zip(rng.uniform(-50, 50, (16, 2)).tolist(), rng.uniform(-3, 3, (16, 2)).tolist())
+            )
+        ],
+    }
+    for model in ("constant_velocity", "constant_acceleration"):
+        config = TTCConfig(model=model, warning_ttc=20.0, debounce_steps=1)
+        ref = TTCMonitor("ttc", config)
+        fast = TTCMonitor("ttc", config, dtype=np.float32)
+        ref_out, fast_out = ref.check(state), fast.check(state)
+
+        assert fast._buffers.pos.dtype == np.float32
+        assert np.isclose(fast_out.severity, ref_out.severity, atol=1e-5)
+        assert ref_out.message.startswith("WARNING")
+        assert fast_out.message == ref_out.message
+
+
+def test_constant_velocity_ttc_batch_matches_scalar():
+    """The vectorized TTC kernel agrees with the per-object function."""
+    rng = np.random.default_rng(0)
+    ego_pos = np.array([1.0, -2.0])
+    ego_vel = np.array([3.0, 0.5])
+    positions = rng.uniform(-20, 20, size=(32, 2))
+    velocities = rng.uniform(-5, 5, size=(32, 2))
+    positions[0] = ego_pos  # coincident object
+
+    batch = constant_velocity_ttc_batch(ego_pos, ego_vel, positions, velocities)
+    scalar = [constant_velocity_ttc(ego_pos, ego_vel, p, v) for p, v in zip(positions, velocities)]
+
+    assert batch[0] == 0.0
+    assert np.allclose(batch, scalar)
+
+    # The loop kernel (numba target) finds the same minimum
+    best, idx = _ttc_cv_batch(ego_pos, ego_vel, positions[1:], velocities[1:], 0.1)
+    assert idx == int(np.argmin(batch[1:]))
+    assert np.isclose(best, batch[1:].min())
+
+
 # --- OOD Detection Tests ---
 
 
@@ -119,22 +338,33 @@ def test_label_shift_detector():
     assert score_shifted > score_same, "Shifted distribution should have higher score"
 
 
-def test_ood_ensemble():
-    """Test OOD ensemble combining multiple detectors."""
-    # Create detectors
-    mahal = MahalanobisDetector(name="mahal")
-    mahal.fit(np.random.randn(100, 10))
+def test_label_shift_detector_labels():
+    """Predicted-label inputs are histogrammed; out-of-range labels are ignored."""
+    detector = LabelShiftDetector()
+    detector.fit(np.zeros((4, 1)), np.array([0, 1, 2, 3]))
+
+    assert detector.score(np.array([0, 1, 2, 3, 7])) < 1e-6
+    assert detector.score(np.array([0, 0, 0, 1])) > 0.1
+    with pytest.raises(ValueError, match="non-negative"):
+        detector.score(np.array([0, -1, 2]))
+
+    # A class missing from the reference yields a large but finite divergence
+    detector.fit(np.zeros((2, 1)), np.array([0, 1]))
+    assert np.isfinite(detector.score(np.array([[0.5, 0.0, 0.5]])))
 
+
+def test_ood_ensemble(fitted_mahal, rng):
+    """Test OOD ensemble combining multiple detectors."""
     energy = EnergyBasedDetector()
 
     ensemble = OODEnsemble(
-        detectors=[mahal, energy],
+        detectors=[fitted_mahal, energy],
         weights=[0.5, 0.5],
         threshold=2.0,
     )
 
     # Score in-distribution
-    in_dist = np.random.randn(10)
+    in_dist = rng.standard_normal(10)
     result_in = ensemble.score(in_dist)
 
     assert "mahal" in result_in.component_scores
@@ -142,17 +372,47 @@ def test_ood_ensemble():
     assert isinstance(result_in.is_ood, bool)
 
 
+def test_ood_ensemble_routes_inputs_and_skips_failures():
+    """Each detector gets its own input; a failing detector gets zero weight."""
+    label_shift = LabelShiftDetector(reference_distribution=np.array([0.5, 0.5]))
+    unfitted = MahalanobisDetector(name="unfitted")  # raises on score
+
+    ensemble = OODEnsemble(detectors=[label_shift, unfitted], threshold=0.1)
+    result = ensemble.score(np.zeros(3), predictions=np.array([[0.9, 0.1]]))
+
+    expected_kl = 0.9 * np.log(0.9 / 0.5) + 0.1 * np.log(0.1 / 0.5)
+    assert np.isclose(result.component_scores["label_shift"], expected_kl)
+    assert result.component_scores["unfitted"] == 0.0
+    assert np.isclose(result.ensemble_score, expected_kl)
+    assert result.is_ood
+
+
+def test_ood_ensemble_max_ignores_failed_detectors():
+    """A failed detector's placeholder 0.0 never wins the max combination."""
+    energy = EnergyBasedDetector()
+    unfitted = MahalanobisDetector(name="unfitted")
+    ensemble = OODEnsemble(
+        detectors=[energy, unfitted], weights=[3.0, 1.0], combination_method="max"
+    )
+    assert ensemble.weights == [0.75, 0.25]
+
+    logits = np.array([[5.0, 0.0, 0.0]])
+    result = ensemble.score(logits)
+    assert np.isclose(result.ensemble_score, energy.score(logits))
+    assert result.ensemble_score < 0
+
+
 # --- Statistical Evaluation Tests ---
 
 
-def test_bootstrap_ci():
+@pytest.mark.parametrize("n_boot", [16, pytest.param(1000, marks=pytest.mark.slow)])
+def test_bootstrap_ci(bootstrap_data, n_boot):
     """Test bootstrap confidence interval."""
-    np.random.seed(42)
-    data = np.random.normal(100, 10, 1000)
-
-    estimate, ci_lower, ci_upper = bootstrap_ci(data, n_bootstrap=1000)
+    sample_mean = bootstrap_data.mean()
+    estimate, ci_lower, ci_upper = bootstrap_ci(bootstrap_data, n_bootstrap=n_boot, random_state=0)
 
-    assert ci_lower < estimate < ci_upper
+    assert estimate == sample_mean
+    assert ci_lower < sample_mean < ci_upper
     assert 98 < estimate < 102  # Should be close to true mean 100
 
 
@@ -170,7 +430,7 @@ def test_statistical_evaluator():
     """Test statistical evaluator aggregation."""
     evaluator = StatisticalEvaluator(
         acceptance_thresholds={"collision_rate": 0.01},
-        n_bootstrap=100,
+        n_bootstrap=16,
     )
 
     # Create sample results
@@ -218,7 +478,7 @@ def test_rolling_statistics():
     assert 0.05 < stats.get_error_rate() < 0.15
 
 
-def test_health_monitor():
+def test_health_monitor(rng):
     """Test health monitor recording and status."""
     monitor = HealthMonitor(
         latency_threshold_p99_ms=50.0,
@@ -227,7 +487,7 @@ def test_health_monitor():
 
     # Record some operations
     for i in range(100):
-        latency = 10 + np.random.rand() * 10
+        latency = 10 + rng.random() * 10
         monitor.record("inference", latency, success=True)
 
     status = monitor.get_health()
@@ -238,67 +498,65 @@ def test_health_monitor():
     assert status.error_rate == 0.0
 
 
+def test_health_monitor_close_stops_alert_dispatch():
+    """Leaving the monitor's context shuts down its default alert engine."""
+
+    def dispatch_threads():
+        return {t for t in threading.enumerate() if t.name.startswith("alert-dispatch")}
+
+    before = dispatch_threads()
+    with HealthMonitor(error_rate_threshold=0.1) as monitor:
+        for _ in range(20):
+            monitor.record("inference", 1.0, success=False)
+        assert [a.rule_name for a in monitor.get_health().alerts] == ["high_error_rate"]
+    assert not dispatch_threads() - before
+
+    # A caller-supplied engine stays usable after the monitor is closed
+    engine = AlertEngine([AlertRule(name="errors", metric="error_rate", threshold=0.1)])
+    HealthMonitor(alert_engine=engine).close()
+    assert len(engine.evaluate({"error_rate": 1.0}, {"error_rate": 20})) == 1
+    engine.close()
+
+    # A closed engine sends inline instead of submitting to the dead pool
+    sent = []
+
+    class ListChannel(NotificationChannel):
+        def send(self, alert):
+            sent.append(alert.rule_name)
+            return True
+
+    rule = AlertRule(name="late", metric="error_rate", threshold=0.1, channels=[ListChannel()])
+    engine.add_rule(rule)
+    assert len(engine.evaluate({"error_rate": 1.0}, {"error_rate": 20})) == 1
+    assert sent == ["late"]
+
+
 # --- Diversity-Aware Acquisition Tests ---
 
 
-def test_dpp_kernel():
+def test_dpp_kernel(dpp_fixture):
     """Test DPP kernel construction."""
-    embeddings = np.random.randn(10, 5)
-    scores = np.random.rand(10)
-
-    kernel = dpp_kernel(embeddings, scores)
+    _, _, kernel = dpp_fixture
 
     assert kernel.shape == (10, 10)
     assert np.allclose(kernel, kernel.T)  # Symmetric
     assert np.all(np.diag(kernel) > 0)  # Positive diagonal
 
 
-def test_greedy_dpp_map():
+def test_greedy_dpp_map(dpp_fixture):
     """Test greedy DPP MAP inference."""
-    embeddings = np.random.randn(10, 5)
-    scores = np.random.rand(10)
-
-    kernel = dpp_kernel(embeddings, scores)
+    _, _, kernel = dpp_fixture
     selected = greedy_dpp_map(kernel, k=3)
 
     assert len(selected) == 3
     assert len(set(selected)) == 3  # All unique
 
 
-def test_diversity_aware_selection():
+def test_diversity_aware_selection(acquisition_samples):
     """Test diversity-aware batch selection."""
     config = AcquisitionConfig()
     policy = DataAcquisitionPolicy(config)
-
-    # Create samples with embeddings
-    samples = []
-    embeddings = []
-    for i in range(20):
-        unc = UncertaintyEstimate(
-            confidence=0.5,
-            aleatoric_score=0.1,
-            epistemic_score=0.1 + i * 0.01,
-            source="test",
-        )
-        risk = RiskAssessment(
-            expected_risk=0.1,
-            tail_risk_cvar=0.2,
-            violation_probability=0.01,
-            is_acceptable=True,
-        )
-        emb = np.random.randn(10)
-        samples.append(
-            SampleMetadata(
-                id=f"sample_{i}",
-                uncertainty=unc,
-                risk=risk,
-                novelty_score=0.1,
-                embedding=emb,
-            )
-        )
-        embeddings.append(emb)
-
-    embeddings = np.array(embeddings)
+    samples, embeddings = acquisition_samples
 
     # Test DPP selection
     result = policy.select_batch_with_metadata(
@@ -5,8 +5,11 @@ These tests verify mathematical invariants that should hold universally,
 catching edge cases that example-based tests might miss.
 """
 
+import time
+
 import numpy as np
-from hypothesis import given, strategies as st, settings
+import pytest
+from hypothesis import given, strategies as st
 from hypothesis.extra.numpy import arrays
 
 from opentlu.foundations.uncertainty import (
@@ -21,6 +24,7 @@ from opentlu.foundations.metrics import (
 from opentlu.foundations.contracts import (
     UncertaintyEstimate,
     MitigationState,
+    MonitorOutput,
 )
 from opentlu.safety.monitors import ConstraintMonitor, GeofenceMonitor
 from opentlu.runtime.controller import MitigationController
@@ -29,44 +33,41 @@ from opentlu.runtime.controller import MitigationController
 # --- Strategies for generating valid inputs ---
 
 
+_PROB_ELEMENTS = st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False)
+# Constant fill for elements Hypothesis does not draw individually, so a
+# failing array shrinks toward the fill value in bulk rather than entry by entry
+_PROB_FILL = st.just(0.5)
+
+
+def _draw_probabilities(draw, shape):
+    """Draw positive weights of the given shape in one go, normalized over the last axis."""
+    raw = draw(arrays(dtype=np.float64, shape=shape, elements=_PROB_ELEMENTS, fill=_PROB_FILL))
+    raw /= raw.sum(axis=-1, keepdims=True)
+    return raw
+
+
 @st.composite
 def probability_vector(draw, size: int = 4):
     """Generate a valid probability vector that sums to 1."""
-    raw = draw(
-        arrays(
-            dtype=np.float64,
-            shape=(size,),
-            elements=st.floats(
-                min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False
-            ),
-        )
-    )
-    return raw / raw.sum()
+    return _draw_probabilities(draw, (size,))
 
 
 @st.composite
 def probability_batch(draw, n_samples: int = 10, n_classes: int = 4):
     """Generate a batch of probability vectors."""
-    batch = []
-    for _ in range(n_samples):
-        batch.append(draw(probability_vector(n_classes)))
-    return np.array(batch)
+    return _draw_probabilities(draw, (n_samples, n_classes))
 
 
 @st.composite
 def ensemble_probs(draw, k_models: int = 3, n_samples: int = 5, n_classes: int = 4):
     """Generate ensemble probability predictions."""
-    ensemble = []
-    for _ in range(k_models):
-        ensemble.append(draw(probability_batch(n_samples, n_classes)))
-    return np.array(ensemble)
+    return _draw_probabilities(draw, (k_models, n_samples, n_classes))
 
 
 # --- Uncertainty Tests ---
 
 
 @given(probs=probability_batch(n_samples=10, n_classes=4))
-@settings(max_examples=100)
 def test_entropy_non_negative(probs: np.ndarray):
     """Entropy should always be non-negative."""
     entropy = predictive_entropy(probs)
@@ -74,7 +75,6 @@ def test_entropy_non_negative(probs: np.ndarray):
 
 
 @given(probs=probability_batch(n_samples=10, n_classes=4))
-@settings(max_examples=100)
 def test_entropy_bounded(probs: np.ndarray):
     """Entropy should be bounded by log(num_classes)."""
     n_classes = probs.shape[1]
@@ -84,7 +84,6 @@ def test_entropy_bounded(probs: np.ndarray):
 
 
 @given(ensemble=ensemble_probs(k_models=3, n_samples=5, n_classes=4))
-@settings(max_examples=50)
 def test_uncertainty_decomposition_identity(ensemble: np.ndarray):
     """Total uncertainty should equal aleatoric + epistemic (mutual information decomposition)."""
     total, aleatoric, epistemic = ensemble_uncertainty_decomposition(ensemble)
@@ -97,7 +96,6 @@ def test_uncertainty_decomposition_identity(ensemble: np.ndarray):
 
 
 @given(ensemble=ensemble_probs(k_models=5, n_samples=10, n_classes=4))
-@settings(max_examples=50)
 def test_aleatoric_non_negative(ensemble: np.ndarray):
     """Aleatoric uncertainty should be non-negative."""
     _, aleatoric, _ = ensemble_uncertainty_decomposition(ensemble)
@@ -105,7 +103,6 @@ def test_aleatoric_non_negative(ensemble: np.ndarray):
 
 
 @given(ensemble=ensemble_probs(k_models=5, n_samples=10, n_classes=4))
-@settings(max_examples=50)
 def test_epistemic_non_negative(ensemble: np.ndarray):
     """Epistemic uncertainty should be non-negative (within numerical tolerance)."""
     _, _, epistemic = ensemble_uncertainty_decomposition(ensemble)
@@ -121,14 +118,15 @@ def test_epistemic_non_negative(ensemble: np.ndarray):
         dtype=np.float64,
         shape=(100,),
         elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
+        fill=_PROB_FILL,
     ),
     targets=arrays(
         dtype=np.float64,
         shape=(100,),
         elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
+        fill=_PROB_FILL,
     ),
 )
-@settings(max_examples=50)
 def test_brier_score_bounded(probs: np.ndarray, targets: np.ndarray):
     """Brier score should be bounded in [0, 1] for probability predictions."""
     score = brier_score(probs, targets)
@@ -140,10 +138,15 @@ def test_brier_score_bounded(probs: np.ndarray, targets: np.ndarray):
         dtype=np.float64,
         shape=(100,),
         elements=st.floats(min_value=0.01, max_value=0.99, allow_nan=False, allow_infinity=False),
+        fill=_PROB_FILL,
+    ),
+    labels=arrays(
+        dtype=np.int64,
+        shape=(100,),
+        elements=st.integers(min_value=0, max_value=1),
+        fill=st.just(0),
     ),
-    labels=arrays(dtype=np.int64, shape=(100,), elements=st.integers(min_value=0, max_value=1)),
 )
-@settings(max_examples=50)
 def test_ece_bounded(probs: np.ndarray, labels: np.ndarray):
     """ECE should be bounded in [0, 1]."""
     ece = expected_calibration_error(probs, labels.astype(float))
@@ -152,16 +155,20 @@ def test_ece_bounded(probs: np.ndarray, labels: np.ndarray):
 
 # --- Monitor Tests ---
 
+# Built once and reconfigured per example; check() keeps no state
+_CONSTRAINT_MONITOR = ConstraintMonitor("test", limit=1.0, metric_key="value")
+_GEOFENCE_BOUNDS = (-10.0, -10.0, 10.0, 10.0)  # x_min, y_min, x_max, y_max
+_GEOFENCE_MONITOR = GeofenceMonitor("test", bounds=_GEOFENCE_BOUNDS)
+
 
 @given(
     value=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
     limit=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=100)
 def test_constraint_monitor_severity_bounded(value: float, limit: float):
     """Monitor severity should always be in [0, 1]."""
-    monitor = ConstraintMonitor("test", limit=limit, metric_key="value")
-    output = monitor.check({"value": value})
+    _CONSTRAINT_MONITOR.limit = limit
+    output = _CONSTRAINT_MONITOR.check({"value": value})
     assert 0.0 <= output.severity <= 1.0, f"Severity out of bounds: {output.severity}"
 
 
@@ -169,11 +176,10 @@ def test_constraint_monitor_severity_bounded(value: float, limit: float):
     value=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
     limit=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=100)
 def test_constraint_monitor_trigger_correctness(value: float, limit: float):
     """Monitor should trigger iff value exceeds limit."""
-    monitor = ConstraintMonitor("test", limit=limit, metric_key="value")
-    output = monitor.check({"value": value})
+    _CONSTRAINT_MONITOR.limit = limit
+    output = _CONSTRAINT_MONITOR.check({"value": value})
     assert output.triggered == (value > limit), (
         f"Trigger mismatch: value={value}, limit={limit}, triggered={output.triggered}"
     )
@@ -183,12 +189,10 @@ def test_constraint_monitor_trigger_correctness(value: float, limit: float):
     x=st.floats(min_value=-100.0, max_value=100.0, allow_nan=False, allow_infinity=False),
     y=st.floats(min_value=-100.0, max_value=100.0, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=100)
 def test_geofence_monitor_trigger_correctness(x: float, y: float):
     """Geofence should trigger iff position is outside bounds."""
-    bounds = (-10.0, -10.0, 10.0, 10.0)  # x_min, y_min, x_max, y_max
-    monitor = GeofenceMonitor("test", bounds=bounds)
-    output = monitor.check({"x": x, "y": y})
+    bounds = _GEOFENCE_BOUNDS
+    output = _GEOFENCE_MONITOR.check({"x": x, "y": y})
 
     in_bounds = bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
     assert output.triggered == (not in_bounds), (
@@ -199,46 +203,51 @@ def test_geofence_monitor_trigger_correctness(x: float, y: float):
 # --- FSM Reachability Tests ---
 
 
+class MockMonitor:
+    """Monitor reporting whatever severity the test last stored in `_sev`."""
+
+    def __init__(self):
+        self.monitor_id = "mock"
+        self._sev = np.zeros(1)
+
+    def check(self, state):
+        severity = float(self._sev[0])
+        return MonitorOutput(
+            monitor_id="mock",
+            triggered=severity > 0,
+            severity=severity,
+            message="test",
+            timestamp=time.time(),
+        )
+
+
+@pytest.fixture(scope="module")
+def mock_controller():
+    """One controller shared by every example; step() keeps no history."""
+    return MitigationController(
+        monitors=[MockMonitor()],
+        uncertainty_threshold=0.5,
+        ood_threshold=0.8,
+    )
+
+
 @given(
     epistemic=st.floats(min_value=0.0, max_value=2.0, allow_nan=False, allow_infinity=False),
     ood_score=st.floats(min_value=0.0, max_value=5.0, allow_nan=False, allow_infinity=False),
     monitor_severity=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=100)
 def test_fsm_always_produces_valid_state(
-    epistemic: float, ood_score: float, monitor_severity: float
+    mock_controller, epistemic: float, ood_score: float, monitor_severity: float
 ):
     """FSM should always transition to a valid MitigationState."""
-
-    # Create a mock monitor that returns the given severity
-    class MockMonitor:
-        def __init__(self, severity: float):
-            self._severity = min(max(severity, 0.0), 1.0)  # Clamp to valid range
-            self.monitor_id = "mock"
-
-        def check(self, state):
-            from opentlu.foundations.contracts import MonitorOutput
-            import time
-
-            return MonitorOutput(
-                monitor_id="mock",
-                triggered=self._severity > 0,
-                severity=self._severity,
-                message="test",
-                timestamp=time.time(),
-            )
-
-    controller = MitigationController(
-        monitors=[MockMonitor(monitor_severity)],
-        uncertainty_threshold=0.5,
-        ood_threshold=0.8,
-    )
+    # Point the shared mock monitor at this example's severity
+    mock_controller.monitors[0]._sev[0] = min(max(monitor_severity, 0.0), 1.0)
 
     uncertainty = UncertaintyEstimate(
         confidence=0.5, aleatoric_score=0.1, epistemic_score=epistemic, source="test"
     )
 
-    state = controller.step({}, uncertainty, ood_score)
+    state = mock_controller.step({}, uncertainty, ood_score)
 
     assert state in MitigationState, f"Invalid state returned: {state}"
 
@@ -247,7 +256,6 @@ def test_fsm_always_produces_valid_state(
     epistemic=st.floats(min_value=0.0, max_value=0.4, allow_nan=False, allow_infinity=False),
     ood_score=st.floats(min_value=0.0, max_value=0.7, allow_nan=False, allow_infinity=False),
 )
-@settings(max_examples=50)
 def test_fsm_reaches_nominal(epistemic: float, ood_score: float):
     """FSM should reach NOMINAL when all conditions are safe."""
     controller = MitigationController(
@@ -272,9 +280,9 @@ def test_fsm_reaches_nominal(epistemic: float, ood_score: float):
         dtype=np.float64,
         shape=(5, 10),
         elements=st.floats(min_value=-10.0, max_value=10.0, allow_nan=False, allow_infinity=False),
+        fill=st.just(0.0),
     )
 )
-@settings(max_examples=50)
 def test_ensemble_variance_non_negative(predictions: np.ndarray):
     """Variance should always be non-negative."""
     variance = ensemble_variance(predictions)
@@ -282,7 +290,6 @@ def test_ensemble_variance_non_negative(predictions: np.ndarray):
 
 
 @given(value=st.floats(min_value=-10.0, max_value=10.0, allow_nan=False, allow_infinity=False))
-@settings(max_examples=50)
 def test_ensemble_variance_zero_for_identical(value: float):
     """Variance should be zero when all ensemble members agree."""
     predictions = np.full((5, 10), value)
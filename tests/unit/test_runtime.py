@@ -1,6 +1,15 @@
+import time
 import typing
-from opentlu.foundations.contracts import MitigationState, UncertaintyEstimate
+
+import numpy as np
+
+from opentlu.foundations.contracts import (
+    MitigationState,
+    UncertaintyEstimate,
+    UncertaintyEstimateBatch,
+)
 from opentlu.runtime.controller import MitigationController
+from opentlu.runtime.logging import InterventionLogger, MemoryLogSink
 from opentlu.safety.monitors import BaseMonitor, MonitorOutput
 
 
@@ -8,11 +17,11 @@ class MockMonitor(BaseMonitor):
     def __init__(self, severity: float):
         super().__init__("mock")
         self.severity = severity
+        self.calls = 0
 
     def check(self, state: typing.Dict[str, typing.Any]) -> MonitorOutput:
+        self.calls += 1
         triggered = self.severity > 0
-        import time
-
         return MonitorOutput(
             monitor_id=self.monitor_id,
             triggered=triggered,
@@ -59,6 +68,20 @@ def test_fallback_ood():
     assert state == MitigationState.FALLBACK
 
 
+def test_thresholds_can_be_retuned():
+    controller = MitigationController([MockMonitor(severity=0.0)])
+    unc = UncertaintyEstimate(
+        confidence=0.5, aleatoric_score=0.1, epistemic_score=0.6, source="test"
+    )
+    assert controller.step({}, unc, ood_score=0.5) == MitigationState.CAUTIOUS
+
+    controller.uncertainty_threshold = 0.7
+    assert controller.step({}, unc, ood_score=0.5) == MitigationState.NOMINAL
+
+    controller.ood_threshold = 0.4
+    assert controller.step({}, unc, ood_score=0.5) == MitigationState.FALLBACK
+
+
 def test_safe_stop_monitor():
     # Severity 1.0 -> Safe Stop
     monitor = MockMonitor(severity=1.0)
@@ -70,3 +93,89 @@ def test_safe_stop_monitor():
     state = controller.step({}, unc, ood_score=0.0)
 
     assert state == MitigationState.SAFE_STOP
+
+
+def test_safe_stop_short_circuit():
+    # A critical monitor ends the scan only when short-circuiting is enabled
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.9, source="test"
+    )
+    for short_circuit, later_calls in ((False, 1), (True, 0)):
+        critical, later = MockMonitor(severity=1.0), MockMonitor(severity=0.5)
+        controller = MitigationController([critical, later], short_circuit=short_circuit)
+
+        assert controller.step({}, unc, ood_score=2.0) == MitigationState.SAFE_STOP
+        assert critical.calls == 1
+        assert later.calls == later_calls
+
+
+def test_monitor_outputs_cached_per_step():
+    # The latest step's outputs are readable without re-checking the monitors
+    monitor = MockMonitor(severity=0.5)
+    controller = MitigationController([monitor])
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+    assert controller.get_monitor_output("mock") is None
+
+    controller.step({}, unc, ood_score=0.0)
+    output = controller.get_monitor_output("mock")
+    assert output.severity == 0.5
+    assert controller.last_monitor_outputs == [output]
+    assert monitor.calls == 1
+
+    monitor.severity = 0.0
+    controller.step({}, unc, ood_score=0.0)
+    assert controller.get_monitor_output("mock").severity == 0.0
+    assert controller.get_monitor_output("other") is None
+
+
+def test_step_and_log_shares_outputs_with_logger():
+    monitor = MockMonitor(severity=0.5)
+    controller = MitigationController([monitor])
+    sink = MemoryLogSink()
+    logger = InterventionLogger(sink)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+
+    obs = {"speed": 12.0}
+    state = controller.step_and_log(obs, unc, 0.0, np.array([0.0]), logger)
+
+    assert state == MitigationState.FALLBACK
+    assert monitor.calls == 1
+    (record,) = sink.get_records()
+    assert record.mitigation_state == MitigationState.FALLBACK
+    assert record.observation is obs  # in-memory sink keeps the reference
+    assert [m["severity"] for m in record.monitor_outputs] == [0.5]
+
+
+def test_step_batch_matches_sequential_steps():
+    severities = [0.0, 0.0, 0.5, 1.0, 0.0]
+    epistemic = np.array([0.1, 0.6, 0.1, 0.1, 0.1])
+    ood = np.array([0.0, 0.0, 0.0, 0.0, 0.9])
+    estimates = [
+        UncertaintyEstimate(confidence=1.0, aleatoric_score=0.1, epistemic_score=e, source="test")
+        for e in epistemic
+    ]
+
+    monitor = MockMonitor(severity=0.0)
+    controller = MitigationController([monitor])
+    expected = []
+    for sev, unc, o in zip(severities, estimates, ood):
+        monitor.severity = sev
+        expected.append(controller.step({}, unc, ood_score=o))
+
+    class ScriptedMonitor(MockMonitor):
+        def check(self, state):
+            self.severity = state["sev"]
+            return super().check(state)
+
+    batch_controller = MitigationController([ScriptedMonitor(severity=0.0)])
+    codes = batch_controller.step_batch(
+        [{"sev": s} for s in severities], UncertaintyEstimateBatch.from_estimates(estimates), ood
+    )
+
+    assert codes.dtype == np.int8
+    assert [list(MitigationState)[c] for c in codes] == expected
+    assert batch_controller.current_state == expected[-1]
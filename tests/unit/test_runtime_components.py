@@ -1,15 +1,33 @@
+import json
+import threading
+from dataclasses import replace
+
 import numpy as np
+import pytest
+from scipy.special import logsumexp
+from opentlu.runtime import health
 from opentlu.runtime.health import (
     RollingStatistics,
+    Alert,
     AlertEngine,
     AlertRule,
+    NotificationChannel,
 )
 from opentlu.runtime.logging import (
+    FileLogSink,
     InterventionLogger,
+    InterventionRecord,
+    LogQuery,
     MemoryLogSink,
 )
-from opentlu.foundations.contracts import MitigationState, UncertaintyEstimate
-from opentlu.runtime.ood import MahalanobisDetector, EnergyBasedDetector
+from opentlu.foundations.contracts import MitigationState, MonitorOutput, UncertaintyEstimate
+from opentlu.runtime.ood import (
+    DynamicsResidualDetector,
+    MahalanobisDetector,
+    EnergyBasedDetector,
+    _mahal_quad_kernel,
+    _mahal_tri_kernel,
+)
 
 
 def test_rolling_statistics():
@@ -29,6 +47,38 @@ def test_rolling_statistics():
     assert stats.get_error_rate() > 0.0
 
 
+def test_rolling_statistics_window_moments(monkeypatch):
+    """Running mean/variance track the live window as samples expire or overflow."""
+    now = [0.0]
+    monkeypatch.setattr("opentlu.runtime.health.time.monotonic", lambda: now[0])
+    stats = RollingStatistics(window_seconds=5.0, max_samples=8)
+
+    values = np.random.default_rng(3).normal(10.0, 2.0, 20)
+    for i, value in enumerate(values):
+        now[0] = float(i)
+        stats.record(float(value))
+
+    # t = 19: window keeps t >= 14, i.e. the last 6 samples
+    live = values[-6:]
+    assert np.isclose(stats.get_mean(), live.mean())
+    assert np.isclose(stats.get_variance(), live.var(ddof=1))
+    assert np.isclose(stats.get_percentile(50), np.median(live))
+
+    # Reads expire stale samples too
+    now[0] = 22.0
+    assert np.isclose(stats.get_mean(), values[-3:].mean())
+    assert np.isclose(stats.get_throughput(), 3 / 5.0)
+    now[0] = 100.0
+    assert stats.get_mean() == 0.0 and stats.get_variance() == 0.0
+
+    # max_samples evicts the oldest
+    stats = RollingStatistics(window_seconds=1e9, max_samples=4)
+    for value in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+        stats.record(value)
+    assert np.isclose(stats.get_mean(), 4.5)
+    assert np.isclose(stats.get_variance(), np.var([3.0, 4.0, 5.0, 6.0], ddof=1))
+
+
 def test_alert_engine():
     """Test alerting logic."""
     engine = AlertEngine()
@@ -53,6 +103,189 @@ def test_alert_engine():
     assert len(alerts) == 0
 
 
+def test_alert_rule_inline_op():
+    """Test built-in comparison ops without a custom condition."""
+    engine = AlertEngine()
+    engine.add_rule(AlertRule(name="low_throughput", metric="throughput", threshold=5.0, op="<"))
+
+    assert engine.evaluate({"throughput": 10.0}, {"throughput": 10}) == []
+    alerts = engine.evaluate({"throughput": 1.0}, {"throughput": 10})
+    assert [a.rule_name for a in alerts] == ["low_throughput"]
+
+    with pytest.raises(ValueError):
+        AlertRule(name="bad", metric="throughput", threshold=1.0, op="!=")
+
+    # Positional (name, metric, condition, threshold) construction still works
+    rule = AlertRule("high", "throughput", lambda x: x > 50.0, 50.0)
+    assert rule.condition is not None and rule.threshold == 50.0 and rule.op == ">"
+
+
+def test_alert_engine_compiled_rules_match_per_rule_semantics():
+    """Vectorized evaluation agrees with the scalar comparison for every op."""
+    ops = {
+        ">": lambda v, t: v > t,
+        ">=": lambda v, t: v >= t,
+        "<": lambda v, t: v < t,
+        "<=": lambda v, t: v <= t,
+        "==": lambda v, t: v == t,
+    }
+    metrics = {"a": 1.0, "b": 2.0, "c": float("nan")}
+    counts = {"a": 10, "b": 3, "c": 10}
+    engine = AlertEngine(dispatch_workers=0)
+    expected = []
+    for op, check in ops.items():
+        for metric in ("a", "b", "c", "missing"):
+            for threshold in (0.5, 1.0, 2.0):
+                name = f"{metric}{op}{threshold}"
+                engine.add_rule(
+                    AlertRule(name=name, metric=metric, threshold=threshold, op=op, min_samples=5)
+                )
+                if metric in metrics and counts[metric] >= 5 and check(metrics[metric], threshold):
+                    expected.append(name)
+    # Custom predicates mix with built-in rules
+    engine.add_rule(AlertRule(name="custom", metric="a", threshold=0.0, condition=bool))
+
+    fired = [alert.rule_name for alert in engine.evaluate(metrics, counts)]
+    assert fired == expected + ["custom"]
+
+
+def test_alert_engine_cooldown_array(monkeypatch):
+    """Cooldowns are tracked per rule and survive rules being added later."""
+    now = [100.0]
+    monkeypatch.setattr("opentlu.runtime.health.time.monotonic", lambda: now[0])
+    engine = AlertEngine(dispatch_workers=0)
+    engine.add_rule(AlertRule(name="fast", metric="x", threshold=0.0, cooldown_seconds=1.0))
+    engine.add_rule(AlertRule(name="slow", metric="x", threshold=0.0, cooldown_seconds=10.0))
+
+    def fire():
+        return [a.rule_name for a in engine.evaluate({"x": 1.0}, {"x": 10})]
+
+    assert fire() == ["fast", "slow"]
+    engine.add_rule(AlertRule(name="new", metric="x", threshold=0.0, cooldown_seconds=10.0))
+    now[0] += 0.5
+    assert fire() == ["new"]
+    now[0] += 1.0
+    assert fire() == ["fast"]
+    now[0] += 10.0
+    assert fire() == ["fast", "slow", "new"]
+
+
+def test_alert_engine_recompiles_edited_rules():
+    """In-place edits and replaced rule sets take effect on the next evaluate."""
+    engine = AlertEngine(dispatch_workers=0)
+    rule = AlertRule(name="latency", metric="latency", threshold=1.0, cooldown_seconds=0.0)
+    engine.add_rule(rule)
+    assert engine.evaluate({"latency": 0.5}, {"latency": 10}) == []
+
+    rule.threshold = 0.2
+    assert len(engine.evaluate({"latency": 0.5}, {"latency": 10})) == 1
+    rule.op = "<"
+    assert engine.evaluate({"latency": 0.5}, {"latency": 10}) == []
+    with pytest.raises(ValueError):
+        rule.op = "!="
+
+    engine.rules = [AlertRule(name="errors", metric="errors", threshold=0.0)]
+    alerts = engine.evaluate({"latency": 0.1, "errors": 1.0}, {"latency": 10, "errors": 10})
+    assert [a.rule_name for a in alerts] == ["errors"]
+    with pytest.raises(AttributeError):
+        engine.rules.append(rule)
+
+
+def test_alert_engine_ignores_other_engines_rules(monkeypatch):
+    """Creating or editing rules elsewhere does not recompile an engine."""
+    engine = AlertEngine([AlertRule(name="a", metric="a", threshold=1.0)], dispatch_workers=0)
+    compiles = []
+    compile_rules = health._compile_rules
+
+    def counting_compile(rules):
+        compiles.append(len(rules))
+        return compile_rules(rules)
+
+    monkeypatch.setattr(health, "_compile_rules", counting_compile)
+
+    other = AlertRule(name="b", metric="b", threshold=1.0)
+    other.threshold = 2.0
+    engine.evaluate({"a": 0.0}, {"a": 10})
+    assert compiles == []
+
+    engine.rules[0].threshold = -1.0
+    assert len(engine.evaluate({"a": 0.0}, {"a": 10})) == 1
+    assert compiles == [1]
+
+
+def test_alert_engine_cooldowns_follow_rules(monkeypatch):
+    """Removing or reordering rules keeps each cooldown on its rule's name."""
+    now = [100.0]
+    monkeypatch.setattr("opentlu.runtime.health.time.monotonic", lambda: now[0])
+    engine = AlertEngine(dispatch_workers=0)
+    hot = AlertRule(name="hot", metric="x", threshold=0.0, cooldown_seconds=10.0)
+    cold = AlertRule(name="cold", metric="y", threshold=0.0, cooldown_seconds=10.0)
+    engine.rules = [hot, cold]
+
+    assert [a.rule_name for a in engine.evaluate({"x": 1.0}, {"x": 10})] == ["hot"]
+    engine.rules = [cold, hot]
+    now[0] += 1.0
+    fired = engine.evaluate({"x": 1.0, "y": 1.0}, {"x": 10, "y": 10})
+    assert [a.rule_name for a in fired] == ["cold"]  # hot is still cooling down
+
+    # Cooldowns are keyed by name: a replacement rule named "hot" inherits it
+    engine.rules = [AlertRule(name="hot", metric="x", threshold=0.5, cooldown_seconds=10.0)]
+    assert engine.evaluate({"x": 1.0}, {"x": 10}) == []
+    engine.rules = []
+    engine.add_rule(AlertRule(name="hot", metric="x", threshold=0.0, cooldown_seconds=10.0))
+    assert engine.evaluate({"x": 1.0}, {"x": 10}) == []
+    now[0] += 10.0
+    assert [a.rule_name for a in engine.evaluate({"x": 1.0}, {"x": 10})] == ["hot"]
+
+
+def test_alert_channels_dispatched_outside_lock():
+    """Channel sends must not hold the engine lock."""
+    engine = AlertEngine()
+
+    class HistoryChannel(NotificationChannel):
+        def __init__(self) -> None:
+            self.seen: list = []
+
+        def send(self, alert: Alert) -> bool:
+            # Re-enters the engine; would deadlock if send ran under the lock
+            self.seen.append(len(engine.get_history()))
+            return True
+
+    channel = HistoryChannel()
+    engine.add_rule(AlertRule(name="r", metric="m", threshold=0.0, channels=[channel]))
+
+    worker = threading.Thread(target=engine.evaluate, args=({"m": 1.0}, {"m": 10}))
+    worker.start()
+    worker.join(timeout=5.0)
+    engine.close()
+
+    assert not worker.is_alive()
+    assert channel.seen == [1]
+
+
+def test_alert_dispatch_does_not_block_evaluate():
+    """A blocked channel must not stall evaluate()."""
+    engine = AlertEngine()
+    release = threading.Event()
+    sent = threading.Event()
+
+    class SlowChannel(NotificationChannel):
+        def send(self, alert: Alert) -> bool:
+            release.wait(timeout=5.0)
+            sent.set()
+            return True
+
+    engine.add_rule(AlertRule(name="r", metric="m", threshold=0.0, channels=[SlowChannel()]))
+
+    alerts = engine.evaluate({"m": 1.0}, {"m": 10})
+    assert len(alerts) == 1
+    assert not sent.is_set()
+
+    release.set()
+    engine.close()
+    assert sent.is_set()
+
+
 def test_logger_memory_sink():
     """Test logging system with memory sink."""
     sink = MemoryLogSink()
@@ -76,12 +309,179 @@ def test_logger_memory_sink():
     assert "x" in records[0].observation
 
 
-def test_mahalanobis_ood():
+def test_logger_serializes_uncertainty_and_monitors():
+    """Test record serialization of uncertainty, monitors and field filters."""
+    sink = MemoryLogSink()
+    logger = InterventionLogger(sink, log_all=True, field_filters=["secret"])
+
+    monitor = MonitorOutput(
+        monitor_id="speed", triggered=True, severity=0.5, message="fast", timestamp=1.0
+    )
+    logger.log(
+        observation={"x": 1, "secret": 2},
+        mitigation_state=MitigationState.FALLBACK,
+        uncertainty=UncertaintyEstimate(
+            confidence=0.9, aleatoric_score=0.1, epistemic_score=0.2, source="test"
+        ),
+        ood_score=0.3,
+        action_taken=np.array([0.0]),
+        monitor_outputs=[monitor],
+    )
+
+    record = sink.get_records()[0]
+    assert record.observation == {"x": 1}
+    assert record.uncertainty == {
+        "confidence": 0.9,
+        "aleatoric_score": 0.1,
+        "epistemic_score": 0.2,
+        "source": "test",
+        "conformal_set_size": 0,
+        "coverage_probability": 0.0,
+        "prediction_set": [],
+    }
+    assert record.monitor_outputs == [
+        {
+            "monitor_id": "speed",
+            "triggered": True,
+            "severity": 0.5,
+            "message": "fast",
+            "timestamp": 1.0,
+        }
+    ]
+
+
+def test_logger_dedup_observations(tmp_path):
+    """Repeated observations are stored once and resolved by LogQuery."""
+    path = tmp_path / "log.jsonl"
+    logger = InterventionLogger(FileLogSink(path), log_all=True, dedup_observations=True)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+
+    for obs in ({"x": np.array([1.0, 2.0])}, {"x": np.array([1.0, 2.0])}, {"x": 3}):
+        logger.log(obs, MitigationState.NOMINAL, unc, 0.0, np.array([0.0]))
+
+    logger.close()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["observation_id"] for r in records] == [0, None, 1]
+    assert [r["observation_ref"] for r in records] == [None, 0, None]
+    assert records[1]["observation"] == {}
+
+    resolved = LogQuery.from_file(path).to_list()
+    assert resolved[1].observation == {"x": [1.0, 2.0]}
+    assert resolved[2].observation == {"x": 3}
+
+    # A ref whose payload record is missing stays flagged instead of
+    # silently resolving to an empty observation
+    (orphan,) = LogQuery([InterventionRecord(**records[1])]).to_list()
+    assert orphan.observation_ref == 0 and orphan.observation == {}
+
+
+def test_logger_dedup_observations_survive_ring_eviction():
+    """A bounded ring never holds a reference to an evicted payload."""
+    sink = MemoryLogSink(max_records=3)
+    logger = InterventionLogger(sink, log_all=True, dedup_observations=True)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+
+    for _ in range(5):
+        logger.log({"x": 1}, MitigationState.NOMINAL, unc, 0.0, np.array([0.0]))
+
+    records = sink.get_records()
+    assert all(r.observation_ref is None for r in records)
+    assert [r.observation for r in LogQuery(records).to_list()] == [{"x": 1}] * 3
+    # Repeats share the first record's payload rather than copying it
+    assert len({id(r.observation) for r in records}) == 1
+
+
+def test_logger_skips_nominal_steps():
+    """Nominal steps are only counted; triggered monitors still persist a record."""
+    sink = MemoryLogSink()
+    logger = InterventionLogger(sink)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+    quiet = MonitorOutput(monitor_id="m", triggered=False, severity=0.0, message="", timestamp=0.0)
+    loud = MonitorOutput(monitor_id="m", triggered=True, severity=0.4, message="", timestamp=0.0)
+
+    for _ in range(3):
+        logger.log({"x": 1}, MitigationState.NOMINAL, unc, 0.0, np.array([0.0]), [quiet])
+    logger.log({"x": 2}, MitigationState.NOMINAL, unc, 0.0, np.array([0.0]), [loud])
+    logger.log({"x": 3}, MitigationState.FALLBACK, unc, 0.0, np.array([0.0]))
+
+    assert [r.observation["x"] for r in sink.get_records()] == [2, 3]
+    assert [r.step_number for r in sink.get_records()] == [3, 4]
+    assert logger.flush_counters() == {"nominal": 3, "logged": 2}
+    assert logger.flush_counters() == {"nominal": 0, "logged": 0}
+
+
+def test_memory_sink_ring_buffer_columns():
+    """The sink keeps the newest records and mirrors them in ordered columns."""
+    sink = MemoryLogSink(max_records=3)
+    logger = InterventionLogger(sink, log_all=True)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+    states = [MitigationState.NOMINAL, MitigationState.CAUTIOUS, MitigationState.FALLBACK]
+    for step in range(5):
+        logger.log({"x": step}, states[step % 3], unc, step / 10, np.array([0.0]))
+
+    records = sink.get_records()
+    assert [r.step_number for r in records] == [2, 3, 4]
+
+    columns = sink.get_columns()
+    assert list(columns["step_number"]) == [2, 3, 4]
+    assert columns["ood_score"].dtype == np.float16
+    assert np.allclose(columns["ood_score"], [0.2, 0.3, 0.4], atol=1e-3)
+    assert np.allclose(columns["uncertainty"], [[1.0, 0.1, 0.1]] * 3, atol=1e-3)
+    assert columns["action"].shape == (3, 1)
+    assert [list(MitigationState)[c] for c in columns["state"]] == [
+        MitigationState.FALLBACK,
+        MitigationState.NOMINAL,
+        MitigationState.CAUTIOUS,
+    ]
+    assert np.array_equal(columns["timestamp"], [r.timestamp for r in records])
+
+    exact = MemoryLogSink(max_records=3, column_dtype=np.float64)
+    exact.write(records[0])
+    exact.write(replace(records[1], action_taken=[1.0, 2.0]))
+    columns = exact.get_columns()
+    assert columns["ood_score"][0] == records[0].ood_score
+    assert np.isnan(columns["action"][1]).all()  # action length differs from the first
+
+
+def test_memory_sink_scalar_and_matrix_actions():
+    """Actions of any shape are stored; the column holds them flattened."""
+    sink = MemoryLogSink(max_records=4, column_dtype=np.float64)
+    logger = InterventionLogger(sink, log_all=True)
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.1, epistemic_score=0.1, source="test"
+    )
+    logger.log({}, MitigationState.NOMINAL, unc, 0.0, np.array([[1.0, 2.0], [3.0, 4.0]]))
+    logger.log({}, MitigationState.NOMINAL, unc, 0.0, np.array([5.0, 6.0, 7.0, 8.0]))
+    logger.log({}, MitigationState.NOMINAL, unc, 0.0, np.array(0.5))  # 0-d action
+    (record,) = sink.get_records()[:1]
+    sink.write(replace(record, action_taken=[[1.0], [2.0, 3.0]]))  # ragged
+
+    assert sink.get_records()[2].action_taken == 0.5
+    actions = sink.get_columns()["action"]
+    assert actions.shape == (4, 4)
+    assert np.array_equal(actions[:2], [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]])
+    assert np.isnan(actions[2:]).all()
+
+    scalar_first = MemoryLogSink(max_records=2)
+    scalar_first.write(replace(record, action_taken=0.25))
+    assert scalar_first.get_columns()["action"].shape == (1, 1)
+
+
+def test_mahalanobis_ood(rng):
     """Test Mahalanobis distance OOD detector."""
     detector = MahalanobisDetector()
 
     # Fit on 2D normal data
-    data = np.random.normal(0, 1, size=(100, 2))
+    data = rng.normal(0, 1, size=(100, 2))
     detector.fit(data)
 
     # In-dist
@@ -96,6 +496,48 @@ def test_mahalanobis_ood():
     assert score_out > score_in
 
 
+def test_mahalanobis_score_batch():
+    """Batch scores match the per-sample quadratic form."""
+    rng = np.random.default_rng(0)
+    detector = MahalanobisDetector()
+    detector.fit(rng.normal(size=(200, 4)))
+
+    batch = rng.normal(size=(8, 4))
+    expected = [
+        np.sqrt((x - detector.mean) @ detector.precision @ (x - detector.mean)) for x in batch
+    ]
+
+    assert np.allclose(detector.score_batch(batch), expected)
+    assert np.isclose(detector.score(batch), np.mean(expected))
+    assert np.isclose(detector.score(batch[0]), expected[0])
+
+
+def test_mahalanobis_class_conditional(rng):
+    """With labels, scores are distances to the nearest class mean under pooled covariance."""
+    centers = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    labels = np.repeat(np.array(["a", "b", "c"]), 40)
+    data = centers[np.repeat(np.arange(3), 40)] + rng.normal(size=(120, 2))
+
+    detector = MahalanobisDetector()
+    detector.fit(data, labels)
+    assert list(detector.classes) == ["a", "b", "c"]
+    assert detector.means.shape == (3, 2)
+
+    within = data - detector.means[np.repeat(np.arange(3), 40)]
+    cov = within.T @ within / (120 - 3) + 1e-6 * np.eye(2)
+    assert np.allclose(detector.precision, np.linalg.inv(cov))
+
+    batch = np.array([[10.2, -0.1], [5.0, 5.0], [0.0, 9.5]])
+    diffs = batch[:, None, :] - detector.means[None, :, :]
+    expected = np.sqrt(np.einsum("nkd,de,nke->nk", diffs, np.linalg.inv(cov), diffs).min(axis=1))
+    assert np.allclose(detector.score_batch(batch), expected)
+    # The midpoint between clusters is far from every class mean
+    assert detector.score(batch[1]) > detector.score(batch[0])
+
+    detector.fit(data)  # refitting without labels drops the class means
+    assert detector.means is None
+
+
 def test_energy_ood():
     """Test Energy-based OOD detector."""
     detector = EnergyBasedDetector(temperature=1.0)
@@ -118,3 +560,128 @@ def test_energy_ood():
     # So score_out > score_in
 
     assert score_out > score_in
+
+
+def test_energy_batch_fast_path_matches_logsumexp(rng):
+    """Confident rows take the -max shortcut; all rows match the exact energy."""
+    logits = rng.normal(size=(6, 5))
+    logits[::2, 1] += 200.0  # confident rows
+    for temperature in (0.5, 2.0):
+        detector = EnergyBasedDetector(temperature=temperature)
+        expected = -temperature * logsumexp(logits / temperature, axis=1)
+        assert np.allclose(detector.energy_batch(logits), expected)
+        assert np.allclose(detector.energy_batch(logits[1::2]), expected[1::2])
+        assert np.array_equal(detector.energy_batch(logits[::2]), -logits[::2].max(axis=1))
+    assert np.array_equal(detector.energy_batch(np.array([[3.0], [4.0]])), [-3.0, -4.0])
+
+
+def test_mahalanobis_cholesky_matches_precision():
+    """Fitted (Cholesky) and explicit-precision detectors agree."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(300, 3)) @ np.array([[2.0, 0.0, 0.0], [0.5, 1.0, 0.0], [0.0, 0.3, 0.2]])
+    fitted = MahalanobisDetector()
+    fitted.fit(data)
+
+    cov = np.cov(data.T) + 1e-6 * np.eye(3)
+    assert np.allclose(fitted.precision, np.linalg.inv(cov))
+
+    explicit = MahalanobisDetector(mean=fitted.mean, precision=np.linalg.inv(cov))
+    batch = rng.normal(size=(16, 3))
+    assert np.allclose(fitted.score_batch(batch), explicit.score_batch(batch))
+
+
+def test_mahalanobis_fit_blocked_one_pass(monkeypatch):
+    """Blocked one-pass moments match np.cov, even far from the origin."""
+    monkeypatch.setattr("opentlu.runtime.ood._MAHAL_FIT_BLOCK_ELEMENTS", 7)
+    rng = np.random.default_rng(2)
+    data = 1e6 + rng.normal(size=(50, 3)) @ np.array(
+        [[1.0, 0.0, 0.0], [0.5, 2.0, 0.0], [0, 0, 0.5]]
+    )
+
+    detector = MahalanobisDetector()
+    detector.fit(data)
+    assert np.allclose(detector.mean, data.mean(axis=0))
+    cov = np.cov(data.T)
+    assert np.allclose(detector.precision, np.linalg.inv(cov + 1e-6 * np.eye(3)), rtol=1e-6)
+
+    shrunk = MahalanobisDetector(shrinkage=0.1)
+    shrunk.fit(data)
+    ridge = 0.1 * np.trace(cov) / 3
+    assert np.allclose(shrunk.precision, np.linalg.inv(cov + ridge * np.eye(3)))
+
+
+def test_energy_large_logits_stable():
+    """Energy stays finite for logits that would overflow a naive exp."""
+    detector = EnergyBasedDetector(temperature=0.5)
+    score = detector.score(np.array([[1000.0, 999.0, -1000.0]]))
+    assert np.isfinite(score)
+    assert np.isclose(score, -0.5 * (2000.0 + np.log1p(np.exp(-2.0))))
+
+
+def test_mahalanobis_float32_storage():
+    """float32 storage scores in float32 and stays close to float64."""
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(500, 8))
+    batch = rng.normal(size=(32, 8))
+
+    ref = MahalanobisDetector()
+    ref.fit(data)
+    fast = MahalanobisDetector(dtype=np.float32)
+    fast.fit(data)
+
+    scores = fast.score_batch(batch)
+    assert scores.dtype == np.float32
+    assert fast.mean.dtype == np.float32
+    assert np.allclose(scores, ref.score_batch(batch), rtol=1e-4)
+    assert fast.precision.dtype == np.float32
+    assert np.allclose(fast.precision, ref.precision, rtol=1e-4, atol=1e-6)
+
+
+def test_mahalanobis_scratch_buffers_reused():
+    """Repeated batch scoring reuses scratch space but returns fresh results."""
+    rng = np.random.default_rng(3)
+    detector = MahalanobisDetector(mean=np.zeros(3), precision=np.eye(3))
+    first_batch = rng.normal(size=(5, 3))
+
+    first = detector.score_batch(first_batch)
+    buf = detector._diff_buf
+    second = detector.score_batch(rng.normal(size=(5, 3)))
+
+    assert detector._diff_buf is buf
+    assert np.allclose(first, np.linalg.norm(first_batch, axis=1))
+    assert not np.shares_memory(first, second)
+
+
+def test_mahalanobis_small_dim_kernels():
+    """The loop kernels (numba targets) match the BLAS scoring path."""
+    rng = np.random.default_rng(4)
+    detector = MahalanobisDetector()
+    detector.fit(rng.normal(size=(200, 5)))
+    batch = rng.normal(size=(6, 5))
+    expected = detector.score_batch(batch)
+
+    tri_out = np.empty(6)
+    _mahal_tri_kernel(batch, detector.mean, detector._cov_factor[0], tri_out)
+    quad_out = np.empty(6)
+    _mahal_quad_kernel(batch, detector.mean, detector.precision, quad_out)
+
+    assert np.allclose(tri_out, expected)
+    assert np.allclose(quad_out, expected)
+
+
+def test_dynamics_residual_update_matches_fit():
+    """Streaming updates reproduce the batch fit statistics."""
+    rng = np.random.default_rng(5)
+    residuals = rng.normal(size=(300, 4))
+
+    batch = DynamicsResidualDetector()
+    batch.fit(residuals)
+    norms = np.linalg.norm(residuals, axis=-1)
+    assert np.isclose(batch._mean_residual, norms.mean())
+    assert np.isclose(batch._std_residual, norms.std() + 1e-6)
+
+    streaming = DynamicsResidualDetector()
+    for chunk in np.array_split(residuals, 7):
+        streaming.update(chunk)
+    assert np.isclose(streaming._mean_residual, batch._mean_residual)
+    assert np.isclose(streaming._std_residual, batch._std_residual)
@@ -1,3 +1,7 @@
+import numpy as np
+
+from opentlu.foundations.contracts import MitigationState, UncertaintyEstimate
+from opentlu.runtime.controller import MitigationController
 from opentlu.safety.monitors import ConstraintMonitor, GeofenceMonitor
 
 
@@ -15,6 +19,36 @@ def test_constraint_monitor():
     assert out.severity == 0.5  # (15-10)/10 = 0.5
 
 
+def test_constraint_monitor_limit_updates_and_arrays():
+    monitor = ConstraintMonitor("speed_limit", limit=10.0, metric_key="speed")
+    monitor.limit = 20.0
+    assert monitor.check({"speed": 25.0}).severity == 0.25
+
+    out = monitor.check({"speed": np.array([5.0, 30.0, 50.0])})
+    assert out.triggered
+    assert out.severity == 1.0
+    assert out.message.startswith("2 of 3 values")
+    assert not monitor.check({"speed": np.array([1.0, 2.0])}).triggered
+
+
+def test_constraint_monitor_zero_limit_is_critical():
+    # Zero tolerance: any excess is a full violation, so the controller escalates
+    monitor = ConstraintMonitor("leak", limit=0.0, metric_key="leak")
+    assert monitor.check({"leak": 0.0}).severity == 0.0
+    out = monitor.check({"leak": 1e-3})
+    assert out.triggered and out.severity == 1.0
+
+    out = monitor.check({"leak": np.array([0.0, -1.0, 2.0])})
+    assert out.triggered and out.severity == 1.0
+    assert monitor.check({"leak": np.array([0.0, -1.0])}).severity == 0.0
+
+    unc = UncertaintyEstimate(
+        confidence=1.0, aleatoric_score=0.0, epistemic_score=0.0, source="test"
+    )
+    controller = MitigationController([monitor])
+    assert controller.step({"leak": 1e-3}, unc, ood_score=0.0) == MitigationState.SAFE_STOP
+
+
 def test_geofence_monitor():
     bounds = (0, 0, 10, 10)
     monitor = GeofenceMonitor("geo", bounds)
@@ -27,3 +61,58 @@ def test_geofence_monitor():
     out = monitor.check({"x": -1, "y": 5})
     assert out.triggered
     assert out.severity == 1.0
+
+
+def test_geofence_bounds_can_be_reassigned():
+    geo = GeofenceMonitor("geo", (0, 0, 10, 10))
+    assert geo.check({"x": 15, "y": 5}).triggered
+
+    geo.bounds = (0, 0, 20, 20)
+    assert not geo.check({"x": 15, "y": 5}).triggered
+    assert geo.check_batch(np.array([[15.0, 5.0], [25.0, 5.0]]), ["a", "b"])[0].monitor_id == "b"
+    assert "(0, 0, 20, 20)" in geo.check({"x": 25, "y": 5}).message
+
+
+def test_monitors_use_shared_timestamp():
+    speed = ConstraintMonitor("speed_limit", limit=10.0, metric_key="speed")
+    geo = GeofenceMonitor("geo", (0, 0, 10, 10))
+
+    outputs = [m.check({"speed": 5.0, "x": 1, "y": 1}, timestamp=123.0) for m in (speed, geo)]
+    assert [o.timestamp for o in outputs] == [123.0, 123.0]
+    assert all(o.message == "OK" for o in outputs)
+
+
+def test_geofence_check_batch_reports_only_outside_agents():
+    geo = GeofenceMonitor("geo", (0, 0, 10, 10))
+    positions = np.array([[5.0, 5.0], [11.0, 5.0], [10.0, 0.0], [np.nan, 1.0]])
+
+    outputs = geo.check_batch(positions, ["a", "b", "c", "d"], timestamp=7.0)
+    assert [o.monitor_id for o in outputs] == ["b", "d"]
+    assert all(o.triggered and o.severity == 1.0 and o.timestamp == 7.0 for o in outputs)
+    for out, (x, y) in zip(outputs, positions[[1, 3]]):
+        assert out.message == geo.check({"x": x, "y": y}).message
+
+
+def test_geofence_graded_severity_and_point_arrays():
+    geo = GeofenceMonitor("geo", (0, 0, 10, 10), severity_scale=5.0)
+
+    assert geo.check({"x": 5, "y": 5}).severity == 0.0
+    assert np.isclose(geo.check({"x": -3, "y": 14}).severity, 1.0)  # distance 5
+    assert np.isclose(geo.check({"x": 11, "y": 5}).severity, 0.2)
+
+    out = geo.check({"x": np.array([5.0, 11.0, 12.0]), "y": np.array([5.0, 5.0, 5.0])})
+    assert out.triggered
+    assert np.isclose(out.severity, 0.4)
+    assert out.message.startswith("2 of 3 positions")
+
+    out = geo.check({"x": np.array([1.0, 2.0]), "y": 3.0}, timestamp=1.0)
+    assert not out.triggered and out.severity == 0.0 and out.message == "OK"
+
+    batch = geo.check_batch(np.array([[11.0, 5.0], [np.nan, 1.0]]), ["a", "b"])
+    assert [o.severity for o in batch] == [geo.check({"x": 11.0, "y": 5.0}).severity, 1.0]
+
+    geo.severity_scale = 10.0
+    assert np.isclose(geo.check({"x": 11, "y": 5}).severity, 0.1)
+    assert np.isclose(geo.check_batch(np.array([[12.0, 5.0]]), ["a"])[0].severity, 0.2)
+    geo.severity_scale = None
+    assert geo.check({"x": 11, "y": 5}).severity == 1.0
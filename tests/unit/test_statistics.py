@@ -3,17 +3,18 @@ import pytest
 from opentlu.evaluation.statistics import (
     bootstrap_ci,
     wilson_ci,
+    wilson_ci_batch,
     StatisticalEvaluator,
     AggregatedResults,
     MetricWithCI,
 )
 
 
-def test_bootstrap_ci_mean():
+@pytest.mark.slow
+def test_bootstrap_ci_mean(rng):
     """Test bootstrap CI for mean."""
-    np.random.seed(42)
     # True mean 5.0
-    data = np.random.normal(5.0, 1.0, 1000)
+    data = rng.normal(5.0, 1.0, 1000)
 
     est, lower, upper = bootstrap_ci(data, np.mean, n_bootstrap=1000)
 
@@ -23,6 +24,18 @@ def test_bootstrap_ci_mean():
     assert lower <= 5.0 <= upper
 
 
+def test_bootstrap_ci_reductions_match_generic_path(rng, monkeypatch):
+    """Axis-wise reductions give the same interval as calling stat_fn per resample."""
+    data = rng.normal(0.0, 1.0, 200)
+    # Small blocks so the resamples span several index draws
+    monkeypatch.setattr("opentlu.evaluation.statistics._BOOTSTRAP_BLOCK_ELEMENTS", 1000)
+
+    for stat_fn in (np.mean, np.median, np.std):
+        fast = bootstrap_ci(data, stat_fn, n_bootstrap=64, random_state=7)
+        generic = bootstrap_ci(data, lambda x, fn=stat_fn: fn(x), n_bootstrap=64, random_state=7)
+        assert np.allclose(fast, generic)
+
+
 def test_wilson_ci():
     """Test Wilson score interval."""
     # 50/100 -> 0.5
@@ -44,6 +57,15 @@ def test_wilson_ci():
     assert high == 1.0
 
 
+def test_wilson_ci_batch_matches_scalar():
+    """The batched interval agrees with wilson_ci element-wise, including n == 0."""
+    successes = np.array([0, 3, 50, 100, 7, 0])
+    trials = np.array([100, 10, 100, 100, 7, 0])
+    p, low, high = wilson_ci_batch(successes, trials, alpha=0.1)
+    for i, (k, n) in enumerate(zip(successes, trials)):
+        assert np.allclose((p[i], low[i], high[i]), wilson_ci(int(k), int(n), alpha=0.1))
+
+
 def test_statistical_evaluator_aggregate():
     """Test aggregation with stats evaluator."""
     evaluator = StatisticalEvaluator({"acc": 0.5})
@@ -99,3 +121,50 @@ def test_regression_detection():
     is_regr, _ = evaluator.detect_regression(old, new, safety_metrics=[])
     # If not safety, maybe it doesn't strict check?
     # Let's rely on the explicit safety check for specific failure.
+
+
+def test_regression_detection_many_metrics():
+    """All metrics are checked together; higher-is-better metrics invert the test."""
+    evaluator = StatisticalEvaluator({})
+
+    def results(metrics):
+        return AggregatedResults(
+            total_scenarios=100,
+            pass_rate=MetricWithCI(1.0, 0.95, 1.0, "wilson", 100),
+            mean_metrics={k: MetricWithCI(*v, "bootstrap", 100) for k, v in metrics.items()},
+            stratified_metrics={},
+            power_analysis={},
+        )
+
+    old = results(
+        {
+            "error_rate": (0.1, 0.08, 0.12),
+            "collisions": (0.1, 0.05, 0.15),
+            "success": (0.9, 0.88, 0.92),
+            "coverage": (0.9, 0.85, 0.95),
+        }
+    )
+    new = results(
+        {
+            "error_rate": (0.09, 0.07, 0.11),  # better
+            "collisions": (0.12, 0.07, 0.17),  # worse, overlapping
+            "success": (0.8, 0.78, 0.82),  # definitely worse
+            "coverage": (0.95, 0.9, 1.0),  # better
+        }
+    )
+
+    is_regression, details = evaluator.detect_regression(
+        old,
+        new,
+        safety_metrics=["error_rate", "collisions", "success", "coverage", "missing"],
+        higher_is_better=["success", "coverage"],
+    )
+    assert is_regression
+    assert list(details) == ["collisions", "success"]
+    assert details["collisions"].startswith("WARNING")
+    assert details["success"] == "REGRESSION: new [0.7800, 0.8200] < old [0.8800, 0.9200]"
+
+    is_regression, details = evaluator.detect_regression(
+        old, new, safety_metrics=["error_rate", "coverage"], higher_is_better=["coverage"]
+    )
+    assert not is_regression and details == {}
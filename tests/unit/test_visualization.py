@@ -0,0 +1,253 @@
+import base64
+
+import numpy as np
+
+from opentlu.visualization.dashboard import (
+    CachedVisualizer,
+    Dashboard,
+    MatplotlibBackend,
+    OODVisualizer,
+    PlotlyBackend,
+    SafetyBatch,
+    SafetyMarginData,
+    SafetyVisualizer,
+    UncertaintyBatch,
+    UncertaintyData,
+    UncertaintyVisualizer,
+    _box_stats,
+    _histogram,
+)
+
+
+def _margin_data():
+    return [
+        SafetyMarginData(0.0, "nominal", {"speed": 1.0, "lane": 0.5}, 0.1, 0.0),
+        SafetyMarginData(1.0, "cautious", {"speed": 0.5}, 0.2, 0.3),
+        SafetyMarginData(2.0, "fallback", {"lane": -0.2, "speed": 0.1}, 0.6, 0.8),
+    ]
+
+
+def test_margin_timeline_columns():
+    """Each constraint becomes one series; missing margins are plotted as 0."""
+    fig = SafetyVisualizer().plot_margin_timeline(_margin_data())
+    assert len(fig.axes) == 1
+    lines = {line.get_label(): line for line in fig.axes[0].get_lines()}
+
+    assert list(lines) == ["lane", "speed"]
+    legend = fig.axes[0].get_legend()
+    assert [text.get_text() for text in legend.get_texts()] == ["lane", "speed"]
+
+    unsorted = SafetyVisualizer().plot_margin_timeline(_margin_data(), sorted_constraints=False)
+    assert [line.get_label() for line in unsorted.axes[0].get_lines()] == ["speed", "lane"]
+    assert np.allclose(lines["lane"].get_xdata(), [0.0, 1.0, 2.0])
+    assert np.allclose(lines["lane"].get_ydata(), [0.5, 0.0, -0.2])
+    assert np.allclose(lines["speed"].get_ydata(), [1.0, 0.5, 0.1])
+
+    margins = SafetyBatch.from_list(_margin_data()).margins
+    assert margins.flags.f_contiguous
+    assert np.array_equal(margins, [[0.5, 1.0], [0.0, 0.5], [-0.2, 0.1]])
+
+
+def test_matplotlib_html_embeds_png():
+    backend = MatplotlibBackend(png_compress_level=1)
+    fig = SafetyVisualizer(backend).plot_margin_timeline(_margin_data())
+    html = backend.to_html(fig)
+
+    assert html.startswith('<img src="data:image/png;base64,')
+    assert base64.b64decode(html.split(",", 1)[1].split('"', 1)[0]).startswith(b"\x89PNG")
+
+
+def test_cached_visualizer_reuses_rendered_html():
+    backend = MatplotlibBackend()
+    calls = []
+    render = backend.to_html
+    backend.to_html = lambda fig: calls.append(fig) or render(fig)
+    cache = CachedVisualizer(backend, maxsize=2)
+
+    first = cache.margin_timeline_html(_margin_data())
+    assert cache.margin_timeline_html(_margin_data()) is first
+    assert len(calls) == 1
+
+    # Different values or title miss; the oldest entry is evicted
+    changed = _margin_data()
+    changed[0].constraint_margins["speed"] = 0.9
+    cache.margin_timeline_html(changed)
+    cache.score_distribution_html([0.1, 0.5, 0.9], threshold=0.5, title="OOD")
+    assert len(calls) == 3
+    assert len(cache._cache) == 2
+
+    html = Dashboard(backend).render_html([first])
+    assert first in html
+
+
+def test_score_distribution_is_prebinned():
+    scores = np.random.default_rng(0).normal(size=1000)
+    counts, edges = _histogram(scores, 20)
+    ref_counts, ref_edges = np.histogram(scores, bins=20)
+    assert np.array_equal(counts, ref_counts)
+    assert np.allclose(edges, ref_edges)
+
+    fig = OODVisualizer().plot_score_distribution(scores.tolist(), threshold=1.0, bins=20)
+    bars = fig.axes[0].patches
+    assert len(bars) == 20
+    assert sum(bar.get_height() for bar in bars) == 1000
+
+    fig = OODVisualizer(PlotlyBackend()).plot_score_distribution(scores, threshold=1.0, bins=20)
+    assert fig.data[0].type == "bar"
+    assert int(np.sum(fig.data[0].y)) == 1000
+
+
+def test_shared_bin_edges_span_all_detectors():
+    rng = np.random.default_rng(1)
+    detector_scores = {"a": rng.normal(0.0, 1.0, 500), "b": rng.normal(3.0, 1.0, 500)}
+    edges = OODVisualizer.shared_bin_edges(detector_scores, bins=30)
+    assert len(edges) == 31
+    assert edges[0] == min(s.min() for s in detector_scores.values())
+    assert edges[-1] == max(s.max() for s in detector_scores.values())
+
+    viz = OODVisualizer()
+    for scores in detector_scores.values():
+        fig = viz.plot_score_distribution(scores, threshold=1.0, bin_edges=edges)
+        bars = fig.axes[0].patches
+        assert len(bars) == 30
+        assert np.isclose(bars[0].get_x(), edges[0])
+        assert sum(bar.get_height() for bar in bars) == 500
+
+
+def test_batches_match_record_lists():
+    estimates = [
+        UncertaintyData(0.3, 0.1, 0.2, 0.9, "model", label="a"),
+        UncertaintyData(0.5, 0.4, 0.1, 0.8, "model"),
+    ]
+    batch = UncertaintyBatch.from_list(estimates)
+    assert np.allclose(batch.epistemic, [0.2, 0.1])
+    assert batch.display_labels() == ["a", "Sample 1"]
+
+    viz = UncertaintyVisualizer()
+    stacked = viz.plot_decomposition_stacked(batch).axes[0]
+    assert np.allclose([p.get_height() for p in stacked.patches], [0.1, 0.4, 0.2, 0.1])
+    assert [t.get_text() for t in stacked.get_xticklabels()] == ["a", "Sample 1"]
+
+    safety = SafetyBatch.from_list(_margin_data())
+    assert safety.constraint_names == ["lane", "speed"]
+    assert safety.mitigation_states == ["nominal", "cautious", "fallback"]
+    from_batch = SafetyVisualizer().plot_margin_timeline(safety).axes[0].get_lines()
+    from_list = SafetyVisualizer().plot_margin_timeline(_margin_data()).axes[0].get_lines()
+    for a, b in zip(from_batch, from_list):
+        assert np.array_equal(a.get_ydata(), b.get_ydata())
+
+
+def test_plotly_switches_to_webgl_and_server_binning():
+    backend = PlotlyBackend()
+    short = backend.line_chart(
+        backend.create_figure(), [0.0, 1.0], {"a": [1.0, 2.0]}, "t", "x", "y"
+    )
+    x = np.arange(5000.0)
+    long = backend.line_chart(backend.create_figure(), x, {"a": x}, "t", "x", "y")
+    assert short.data[0].type == "scatter"
+    assert long.data[0].type == "scattergl"
+    assert short.layout.hovermode == "x unified"
+
+    many = np.arange(30_000.0)
+    huge = backend.line_chart(backend.create_figure(), many, {"a": many}, "t", "x", "y")
+    assert huge.layout.hovermode is False
+
+    values = np.random.default_rng(0).normal(size=60_000)
+    fig = backend.histogram(backend.create_figure(), values, "t", bins=30)
+    assert fig.data[0].type == "bar"
+    assert int(np.sum(fig.data[0].y)) == 60_000
+
+
+def test_plotly_hover_can_be_disabled():
+    backend = PlotlyBackend(interactive_hover=False)
+    fig = backend.line_chart(backend.create_figure(), [0.0, 1.0], {"a": [1.0, 2.0]}, "t", "x", "y")
+    assert fig.layout.hovermode is False
+    fig = OODVisualizer(backend).plot_score_distribution([0.1, 0.2, 0.9], threshold=0.5)
+    assert fig.layout.hovermode is False
+
+
+def test_plotly_dashboard_loads_plotly_js_once(tmp_path):
+    backend = PlotlyBackend()
+    dashboard = Dashboard(backend)
+    figs = [dashboard.ood_viz.plot_score_distribution([0.1, 0.4, 0.8], 0.5) for _ in range(3)]
+    html = dashboard.render_html(figs, path=tmp_path / "dash.html")
+
+    assert html.count("cdn.plot.ly") == 1
+    assert html.index("cdn.plot.ly") < html.index("</head>")
+    assert html.count('class="component"') == 3
+    assert (tmp_path / "dash.html").read_text() == html
+
+
+def test_dashboard_renders_components_in_order():
+    backend = MatplotlibBackend()
+    dashboard = Dashboard(backend)
+    figs = [
+        dashboard.safety_viz.plot_margin_timeline(_margin_data()),
+        "<p>pre-rendered</p>",
+        dashboard.ood_viz.plot_score_distribution([0.1, 0.4, 0.8], 0.5),
+    ]
+    assert backend.plt.get_fignums() == []  # figures bypass pyplot's global state
+
+    html = dashboard.render_html(figs)
+    parts = html.split('<div class="component"')[1:]
+    assert len(parts) == 3
+    assert "<img" in parts[0] and "<img" in parts[2]
+    assert "<p>pre-rendered</p>" in parts[1]
+
+
+def test_state_timeline_keeps_every_transition():
+    states = ["nominal"] * 5 + ["FALLBACK"] + ["nominal"] * 3 + ["safe_stop", "unknown"]
+    data = [SafetyMarginData(float(t), s, {}, 0.0, 0.0) for t, s in enumerate(states)]
+    line = SafetyVisualizer().plot_state_timeline(data).axes[0].get_lines()[0]
+
+    # Replaying the reduced steps gives the state of every original row
+    xs, ys = line.get_xdata(), line.get_ydata()
+    replay = [ys[np.searchsorted(xs, t, side="right") - 1] for t in range(len(states))]
+    assert replay == [0] * 5 + [2] + [0] * 3 + [3, 0]
+    assert len(xs) < len(states)
+
+
+def test_detector_comparison_matches_boxplot_stats():
+    from matplotlib import cbook
+
+    rng = np.random.default_rng(0)
+    scores = {"energy": rng.normal(size=200).tolist(), "mahal": rng.exponential(size=150)}
+    for label, values in scores.items():
+        ours = _box_stats(np.asarray(values), label)
+        ref = cbook.boxplot_stats(np.asarray(values))[0]
+        for key in ("med", "q1", "q3", "whislo", "whishi", "mean"):
+            assert np.isclose(ours[key], ref[key])
+        assert np.array_equal(np.sort(ours["fliers"]), np.sort(ref["fliers"]))
+
+    ax = OODVisualizer().plot_detector_comparison(scores).axes[0]
+    assert [t.get_text() for t in ax.get_xticklabels()] == ["energy", "mahal"]
+
+
+def test_detector_comparison_empty_scores():
+    from matplotlib import cbook
+
+    empty = _box_stats(np.array([]), "b")
+    ref = cbook.boxplot_stats(np.array([]))[0]
+    for key in ("med", "q1", "q3", "whislo", "whishi", "mean"):
+        assert np.isnan(empty[key]) and np.isnan(ref[key])
+    assert empty["fliers"].size == 0
+
+    ax = OODVisualizer().plot_detector_comparison({"a": [1, 2, 3], "b": []}).axes[0]
+    assert [t.get_text() for t in ax.get_xticklabels()] == ["a", "b"]
+
+
+def test_backends_import_lazily():
+    dashboard = Dashboard()
+    assert dashboard.backend._figure_cls is None
+    assert PlotlyBackend()._go is None
+
+    dashboard.ood_viz.plot_score_distribution([0.1, 0.2], threshold=0.5)
+    assert dashboard.backend._figure_cls is not None
+
+
+def test_plotly_template_is_configurable():
+    default = PlotlyBackend().create_figure()
+    bare = PlotlyBackend(template="none").create_figure()
+    assert default.layout.template.layout.to_plotly_json()  # plotly's default styling
+    assert not bare.layout.template.layout.to_plotly_json()
+    assert len(bare.to_json()) < len(default.to_json())